@@ -0,0 +1,105 @@
+"""
+Mede o custo da detecção de colisões do Pac-Man conforme o número de fantasmas cresce,
+comparando o teste contra todos os fantasmas com a consulta ao índice espacial por tile.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/collision_broadphase.py --ghosts 4 16 64 256 1024
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from src.core.game_builder import load_entity_configs
+from src.entities.blinky import Blinky
+from src.simulation.headless_game import HeadlessGame
+
+CONFIG_PATH = os.path.join("data", "settings", "config.json")
+
+def build_game(ghost_count: int, seed: int) -> HeadlessGame:
+    """ Partida sem janela com fantasmas extras espalhados por tiles livres do labirinto. """
+    game = HeadlessGame(CONFIG_PATH, seed=seed)
+    manager = game.manager
+    maze = manager.maze
+    cw, ch = manager.cell_width, manager.cell_height
+
+    ghost_config = load_entity_configs(CONFIG_PATH)["blinky"]
+
+    rng = random.Random(seed)
+    walkable = [(row, col) for row in range(maze.rows) for col in range(maze.cols) if maze.is_walkable(row, col)]
+
+    for _ in range(max(0, ghost_count - len(manager.ghosts))):
+        row, col = rng.choice(walkable)
+        x, y = col * cw + cw // 2, row * ch + ch // 2
+        manager.add_entity(Blinky(x, y, manager, ghost_config))
+
+    return game
+
+def measure_queries(game: HeadlessGame, queries: int, seed: int) -> tuple[float, float, int]:
+    """ Tempo médio (µs) por verificação com força bruta e com o índice espacial. """
+    manager = game.manager
+    ghosts = manager.ghosts
+    spatial_hash = manager.spatial_hash
+    pacman = manager.pacman
+    start_position = pacman.position
+
+    rng = random.Random(seed)
+    centers = [
+        (rng.randrange(0, manager.screen_width), rng.randrange(0, manager.screen_height)) for _ in range(queries)
+    ]
+
+    start = time.perf_counter()
+    brute_hits = 0
+    for center in centers:
+        pacman.position = pygame.Vector2(center)
+        brute_hits += sum(1 for ghost in ghosts if pacman.collides_with(ghost))
+    brute_us = (time.perf_counter() - start) / queries * 1e6
+
+    start = time.perf_counter()
+    hash_hits = 0
+    for center in centers:
+        pacman.position = pygame.Vector2(center)
+        x, y = pacman.fixed_position
+        hash_hits += sum(1 for ghost in spatial_hash.query(x, y, pacman.collision_size) if pacman.collides_with(ghost))
+    hash_us = (time.perf_counter() - start) / queries * 1e6
+
+    pacman.position = start_position
+
+    if brute_hits != hash_hits:
+        raise RuntimeError(f"Resultados divergentes: {brute_hits} colisões x {hash_hits} no índice espacial")
+
+    return brute_us, hash_us, hash_hits
+
+def measure_ticks(game: HeadlessGame, ticks: int) -> float:
+    start = time.perf_counter()
+    executed = game.step(ticks)
+    elapsed = time.perf_counter() - start
+    return executed / elapsed if elapsed > 0 else 0.0
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ghosts", type=int, nargs="+", default=[4, 16, 64, 256, 1024])
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--ticks", type=int, default=300, help="ticks completos simulados por tamanho (0 desativa)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'fantasmas':>10} {'força bruta (µs)':>18} {'índice (µs)':>12} {'ganho':>7} {'colisões':>9} {'ticks/s':>9}")
+
+    for ghost_count in args.ghosts:
+        game = build_game(ghost_count, args.seed)
+        brute_us, hash_us, hits = measure_queries(game, args.queries, args.seed)
+        ticks_per_second = measure_ticks(game, args.ticks) if args.ticks > 0 else 0.0
+
+        speedup = brute_us / hash_us if hash_us > 0 else float("inf")
+        print(f"{len(game.manager.ghosts):>10} {brute_us:>18.2f} {hash_us:>12.2f} {speedup:>6.1f}x {hits:>9} {ticks_per_second:>9.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Mede passos de ambiente por segundo da API de ambientes (`src/simulation/env.py`).
+
+Compara:
+    * o embrulho manual de antes: `HeadlessGame` com a grade de pastilhas e as entidades
+      convertidas para NumPy a cada passo;
+    * `PacManEnv`, com observações reaproveitadas (vista da grade viva do `Maze`);
+    * `VectorPacManEnv` com N partidas por chamada sobre o `BatchEngine`.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/env_steps.py --steps 2000 --envs 1 64 1024
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from src.core.states import GameState
+from src.simulation.env import PacManEnv, VectorPacManEnv
+from src.simulation.headless_game import HeadlessGame
+
+CONFIG_PATH = os.path.join("data", "settings", "config.json")
+ENDED_STATES = (GameState.GAME_OVER, GameState.VICTORY)
+
+def bench_manual_wrapper(steps: int, frame_skip: int, actions: np.ndarray) -> float:
+    game = HeadlessGame(CONFIG_PATH, seed = 0)
+    start = time.perf_counter()
+
+    for step in range(steps):
+        game.set_direction(int(actions[step]))
+        game.step(frame_skip)
+
+        manager = game.manager
+        pellets = np.array(manager.matrix, dtype=np.int8)
+        entities = np.array([(*entity.fixed_position, entity.orientation) for entity in manager.entities])
+
+        if game.game_state in ENDED_STATES:
+            game = HeadlessGame(CONFIG_PATH, seed = step)
+
+    return steps / (time.perf_counter() - start)
+
+def bench_single_env(steps: int, frame_skip: int, actions: np.ndarray) -> float:
+    env = PacManEnv(CONFIG_PATH, frame_skip = frame_skip)
+    env.reset(seed = 0)
+    start = time.perf_counter()
+
+    for step in range(steps):
+        _, _, terminated, truncated, _ = env.step(int(actions[step]))
+        if terminated or truncated:
+            env.reset(seed = step)
+
+    return steps / (time.perf_counter() - start)
+
+def bench_vector_env(n_envs: int, steps: int, frame_skip: int, rng: np.random.Generator) -> float:
+    env = VectorPacManEnv(CONFIG_PATH, n_envs, frame_skip = frame_skip)
+    env.reset(seed = 0)
+    actions = rng.integers(1, 5, size = (steps, n_envs))
+    start = time.perf_counter()
+
+    for step in range(steps):
+        env.step(actions[step])
+
+    return n_envs * steps / (time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Passos de ambiente por segundo.")
+    parser.add_argument("--steps", type=int, default=2000, help="passos medidos por variante")
+    parser.add_argument("--frame-skip", type=int, default=4)
+    parser.add_argument("--envs", type=int, nargs="+", default=[1, 64, 1024], help="tamanhos do ambiente vetorizado")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    actions = rng.integers(1, 5, size = args.steps)
+
+    print(f"frame_skip = {args.frame_skip}")
+    print(f"{'variante':<28}{'passos/s':>14}")
+    print(f"{'HeadlessGame + conversão':<28}{bench_manual_wrapper(args.steps, args.frame_skip, actions):>14.0f}")
+    print(f"{'PacManEnv':<28}{bench_single_env(args.steps, args.frame_skip, actions):>14.0f}")
+
+    for n_envs in args.envs:
+        vector_steps = max(10, args.steps // n_envs)
+        rate = bench_vector_env(n_envs, vector_steps, args.frame_skip, rng)
+        print(f"{f'VectorPacManEnv (N={n_envs})':<28}{rate:>14.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Mede a memória ocupada por partida sem janela, para avaliar quantas partidas cabem em memória
+em buscas e avaliações em lote.
+
+Reporta, por partida:
+    * bytes alocados no heap do Python (tracemalloc), com N partidas vivas ao mesmo tempo;
+    * crescimento do RSS do processo (inclui superfícies do SDL), quando disponível;
+    * bytes exclusivos das entidades (Pac-Man e fantasmas), sem contar objetos compartilhados
+      entre partidas, como a configuração.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/memory_per_game.py --games 200
+"""
+import os
+import sys
+import gc
+import argparse
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from src.simulation.headless_game import HeadlessGame
+
+CONFIG_PATH = os.path.join("data", "settings", "config.json")
+
+def read_rss_bytes() -> int:
+    """ RSS atual do processo (Linux); 0 se não for possível ler. """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+def reachable_objects(roots: list, stop: set) -> dict[int, object]:
+    """ Objetos alcançáveis a partir das raízes, pelos atributos (`__dict__` e `__slots__`) e contêineres. """
+    seen: dict[int, object] = {}
+    pending = list(roots)
+
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or id(obj) in stop or isinstance(obj, type):
+            continue
+        seen[id(obj)] = obj
+
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        elif isinstance(obj, (str, bytes, int, float, bool, pygame.Surface, pygame.Vector2)) or obj is None:
+            continue
+        else:
+            if hasattr(obj, "__dict__"):
+                pending.append(vars(obj))
+            for cls in type(obj).__mro__:
+                for slot in cls.__dict__.get("__slots__", ()):
+                    if hasattr(obj, slot) and slot not in ("__dict__", "__weakref__"):
+                        pending.append(getattr(obj, slot))
+
+    return seen
+
+def object_bytes(obj) -> int:
+    size = sys.getsizeof(obj)
+    if isinstance(obj, pygame.Surface):
+        size += obj.get_width() * obj.get_height() * obj.get_bytesize()
+    return size
+
+def entity_bytes(game: HeadlessGame, other: HeadlessGame) -> int:
+    """ Bytes dos objetos alcançáveis pelas entidades de `game` que não são alcançáveis por `other`. """
+    stop = { id(game.manager), id(other.manager) }
+    shared = reachable_objects(list(other.manager.entities), stop)
+    owned = reachable_objects(list(game.manager.entities), stop | set(shared))
+    return sum(object_bytes(obj) for obj in owned.values())
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=200)
+    args = parser.parse_args()
+
+    pygame.font.init()
+    HeadlessGame(CONFIG_PATH, seed=0)
+
+    gc.collect()
+    rss_before = read_rss_bytes()
+    tracemalloc.start()
+
+    games = [HeadlessGame(CONFIG_PATH, seed=seed) for seed in range(args.games)]
+
+    gc.collect()
+    python_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = read_rss_bytes()
+
+    print(f"partidas vivas:              {len(games)}")
+    print(f"heap Python por partida:     {python_bytes / len(games):>12,.0f} bytes")
+    if rss_before and rss_after:
+        print(f"RSS por partida:             {(rss_after - rss_before) / len(games):>12,.0f} bytes")
+    if len(games) > 1:
+        print(f"entidades por partida:       {entity_bytes(games[0], games[1]):>12,.0f} bytes")
+
+if __name__ == "__main__":
+    main()
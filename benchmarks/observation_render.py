@@ -0,0 +1,86 @@
+"""
+Mede quadros por segundo de observações em pixels para agentes que aprendem por imagem.
+
+Compara:
+    * o caminho de antes: `GameRenderer.render` na tela cheia, redução com `smoothscale` e
+      cópia dos pixels com `surfarray.array3d`;
+    * `ObservationRenderer.render` para uma partida sem janela;
+    * `ObservationRenderer.render_batch` sobre um `BatchEngine` com N partidas.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/observation_render.py --size 84 84 --games 1024
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from src.core.clock import SimulationClock
+from src.core.game_builder import build_game_manager
+from src.core.input_source import ScriptedInput
+from src.simulation.batch_engine import BatchEngine
+from src.simulation.headless_game import HeadlessGame
+from src.ui.observation_renderer import ObservationRenderer
+
+CONFIG_PATH = os.path.join("data", "settings", "config.json")
+
+def bench_game_renderer(size: tuple[int, int], frames: int) -> float:
+    screen = pygame.Surface((900, 950))
+    manager = build_game_manager(screen = screen, config_path = CONFIG_PATH, clock = SimulationClock(), input_source = ScriptedInput())
+    start = time.perf_counter()
+
+    for _ in range(frames):
+        manager.draw()
+        pygame.surfarray.array3d(pygame.transform.smoothscale(screen, size))
+
+    return frames / (time.perf_counter() - start)
+
+def bench_single(game: HeadlessGame, size: tuple[int, int], frames: int) -> float:
+    renderer = ObservationRenderer(game.manager.maze, size)
+    start = time.perf_counter()
+
+    for _ in range(frames):
+        renderer.render(game.manager)
+
+    return frames / (time.perf_counter() - start)
+
+def bench_batch(n_games: int, size: tuple[int, int], batches: int) -> float:
+    engine = BatchEngine(CONFIG_PATH, n_games, seeds = range(n_games))
+    engine.step(120)
+    renderer = ObservationRenderer(engine.maze, size)
+    renderer.render_batch(engine)
+    start = time.perf_counter()
+
+    for _ in range(batches):
+        renderer.render_batch(engine)
+
+    return n_games * batches / (time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Quadros de observação por segundo.")
+    parser.add_argument("--size", type=int, nargs=2, default=[84, 84], metavar=("LARGURA", "ALTURA"))
+    parser.add_argument("--frames", type=int, default=300, help="quadros medidos por variante de uma partida")
+    parser.add_argument("--games", type=int, default=1024, help="partidas do BatchEngine")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((900, 950))
+    size = tuple(args.size)
+
+    game = HeadlessGame(CONFIG_PATH, seed = 0)
+    game.step(120)
+
+    print(f"quadro {size[0]}x{size[1]}")
+    print(f"{'variante':<44}{'quadros/s':>12}")
+    print(f"{'GameRenderer + smoothscale + cópia':<44}{bench_game_renderer(size, args.frames):>12.0f}")
+    print(f"{'ObservationRenderer.render':<44}{bench_single(game, size, args.frames):>12.0f}")
+    print(f"{f'ObservationRenderer.render_batch (N={args.games})':<44}{bench_batch(args.games, size, 10):>12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Suíte de benchmarks do jogo, executada sem janela (driver de vídeo "dummy" do SDL).
+
+Mede, em cenários fixos e determinísticos (início de jogo, todos os fantasmas fora da casa
+em modo vulnerável e labirinto quase limpo):
+    * a decisão de direção dos fantasmas (`Ghost._calculate_best_direction`);
+    * a renderização completa do quadro (`GameRenderer.render`);
+    * ticks completos por segundo da simulação sem janela;
+e, fora dos cenários, a construção do `Maze`, o `_create_wall_surface` e a leitura das paredes do cache.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/suite.py --output resultados.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+
+Com `--baseline`, o processo termina com código 1 se alguma métrica piorar além do limite.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import platform
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from src.core.game_builder import default_maze_path, load_entity_configs
+from src.core.states import GhostState
+from src.simulation.headless_game import HeadlessGame
+from src.world.maze import Maze
+
+CONFIG_PATH = os.path.join("data", "settings", "config.json")
+SCREEN_SIZE = (900, 950)
+SEED = 1234
+DEFAULT_THRESHOLD = 0.20
+SCENARIO_TICKS = 1200
+
+def build_early_game(load_sprites: bool = False) -> HeadlessGame:
+    """ Início de partida: o Pac-Man anda para a esquerda por 2 segundos simulados. """
+    game = HeadlessGame(CONFIG_PATH, *SCREEN_SIZE, seed=SEED, load_sprites=load_sprites)
+    game.set_direction(3)
+    game.step(120)
+    return game
+
+def build_vulnerable_all_out(load_sprites: bool = False) -> HeadlessGame:
+    """ Os quatro fantasmas fora da casa e uma pílula de poder recém-ativada. """
+    game = HeadlessGame(CONFIG_PATH, *SCREEN_SIZE, seed=SEED, load_sprites=load_sprites)
+    manager = game.manager
+
+    for ghost in manager.ghosts:
+        if ghost.mode == GhostState.IN_HOUSE:
+            ghost._release_ghost_from_house()
+    game.step(60)
+
+    manager.set_vulnerable()
+    game.step(2)
+    return game
+
+def build_nearly_cleared(load_sprites: bool = False, remaining: int = 6) -> HeadlessGame:
+    """ Restam apenas as `remaining` pastilhas mais distantes do início do Pac-Man. """
+    game = HeadlessGame(CONFIG_PATH, *SCREEN_SIZE, seed=SEED, load_sprites=load_sprites)
+    manager = game.manager
+    maze = manager.maze
+
+    start_row, start_col = manager.pacman._get_grid_coordinates()
+    pellets = [
+        (row, col) for row in range(maze.rows) for col in range(maze.cols) if maze.matrix[row][col] in (1, 2)
+    ]
+    pellets.sort(key=lambda tile: abs(tile[0] - start_row) + abs(tile[1] - start_col))
+
+    for row, col in pellets[:-remaining]:
+        maze.eat_tablet(row, col)
+
+    game.set_direction(3)
+    game.step(30)
+    return game
+
+SCENARIOS: dict = {
+    "early_game": build_early_game,
+    "vulnerable_all_out": build_vulnerable_all_out,
+    "nearly_cleared": build_nearly_cleared
+}
+
+def time_repeated(function, loops: int, repeats: int) -> float:
+    """ Menor tempo médio (s) de uma chamada entre as repetições, o menos sujeito a ruído do sistema. """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        timings.append((time.perf_counter() - start) / loops)
+    return min(timings)
+
+def bench_ghost_decision(game: HeadlessGame, loops: int, repeats: int) -> float:
+    """ µs por chamada de `_calculate_best_direction`, na média dos fantasmas fora da casa. """
+    manager = game.manager
+    ghosts = manager.ghosts
+    active = [ghost for ghost in ghosts if ghost.mode != GhostState.IN_HOUSE] or list(ghosts)
+    context = manager.tick_context()
+
+    def decide_all():
+        for ghost in active:
+            ghost._calculate_best_direction(context)
+
+    return time_repeated(decide_all, loops, repeats) / len(active) * 1e6
+
+def bench_render(game: HeadlessGame, loops: int, repeats: int) -> float:
+    """ ms por quadro de `GameRenderer.render` (via `GameManager.draw`), com os sprites reais. """
+    manager = game.manager
+    manager.draw()
+    return time_repeated(manager.draw, loops, repeats) * 1e3
+
+def bench_ticks(builder, ticks: int, repeats: int) -> float:
+    """ Ticks completos por segundo a partir do estado do cenário (melhor das repetições). """
+    rates = []
+    for _ in range(repeats):
+        game = builder()
+        start = time.perf_counter()
+        executed = game.step(ticks)
+        elapsed = time.perf_counter() - start
+        rates.append(executed / elapsed if elapsed > 0 else 0.0)
+    return max(rates)
+
+def bench_maze(loops: int, repeats: int) -> tuple[float, float, float, float]:
+    """
+    ms da construção completa do `Maze` (sem as tabelas compartilhadas em memória), da construção
+    de mais uma partida do mesmo labirinto, do `_create_wall_surface` e da leitura da superfície
+    das paredes do cache em disco.
+    """
+    config = load_entity_configs(CONFIG_PATH)["manager"]
+    cell_width, cell_height = SCREEN_SIZE[0] // 30, SCREEN_SIZE[1] // 32
+    maze_path = default_maze_path()
+
+    def build_cold() -> Maze:
+        Maze._shared_tables.clear()
+        return Maze(maze_path, cell_width, cell_height, config)
+
+    construction = time_repeated(build_cold, loops, repeats)
+    shared = time_repeated(lambda: Maze(maze_path, cell_width, cell_height, config), loops, repeats)
+    maze = Maze(maze_path, cell_width, cell_height, config)
+    wall_surface = time_repeated(maze._create_wall_surface, loops, repeats)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cached_maze = Maze(maze_path, cell_width, cell_height, config, cache_dir)
+        cache_key = cached_maze.wall_cache_key()
+        cached_maze._save_cached_wall_surface(cached_maze._create_wall_surface(), cache_key)
+        cached_wall_surface = time_repeated(lambda: cached_maze._load_cached_wall_surface(cache_key), loops, repeats)
+
+    return construction * 1e3, shared * 1e3, wall_surface * 1e3, cached_wall_surface * 1e3
+
+def run_suite(quick: bool = False) -> dict:
+    """
+    Executa todos os benchmarks.
+
+    :return: Métricas no formato { nome: { "value", "unit", "higher_is_better" } }.
+    """
+    scale = 0.2 if quick else 1.0  # os ticks por cenário não mudam, para o resultado ser comparável
+    loops = lambda n: max(1, int(n * scale))
+    repeats = 3 if quick else 5
+
+    metrics = {}
+
+    def add(name: str, value: float, unit: str, higher_is_better: bool = False) -> None:
+        metrics[name] = { "value": round(value, 4), "unit": unit, "higher_is_better": higher_is_better }
+        print(f"  {name:<48} {value:>12.3f} {unit}")
+
+    construction_ms, shared_ms, wall_ms, cached_wall_ms = bench_maze(loops(20), repeats)
+    add("maze.construction", construction_ms, "ms")
+    add("maze.construction_shared", shared_ms, "ms")
+    add("maze.create_wall_surface", wall_ms, "ms")
+    add("maze.load_cached_wall_surface", cached_wall_ms, "ms")
+
+    for scenario, builder in SCENARIOS.items():
+        add(f"{scenario}.ghost_decision", bench_ghost_decision(builder(), loops(2000), repeats), "us")
+        add(f"{scenario}.render", bench_render(builder(load_sprites=True), loops(100), repeats), "ms")
+        add(f"{scenario}.ticks_per_second", bench_ticks(builder, SCENARIO_TICKS, repeats), "ticks/s", higher_is_better=True)
+
+    return metrics
+
+def compare_with_baseline(metrics: dict, baseline: dict, default_threshold: float) -> list[str]:
+    """
+    Compara as métricas com o baseline. O limite de cada métrica vem de `baseline["thresholds"]`,
+    ou de `default_threshold` (fração: 0.2 = 20% pior que o baseline).
+
+    :return: Descrição de cada regressão encontrada.
+    """
+    thresholds = baseline.get("thresholds", {})
+    regressions = []
+
+    print(f"\n  {'métrica':<48} {'baseline':>12} {'atual':>12} {'variação':>9}")
+    for name, reference in baseline.get("metrics", {}).items():
+        current = metrics.get(name)
+        if current is None or not reference["value"]:
+            continue
+
+        change = (current["value"] - reference["value"]) / reference["value"]
+        worse = -change if reference.get("higher_is_better") else change
+        limit = thresholds.get(name, default_threshold)
+
+        status = "REGRESSÃO" if worse > limit else ""
+        print(f"  {name:<48} {reference['value']:>12.3f} {current['value']:>12.3f} {change:>+8.1%} {status}")
+
+        if worse > limit:
+            regressions.append(f"{name}: {worse:.1%} pior que o baseline (limite {limit:.0%})")
+
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    parser.add_argument("--baseline", help="baseline JSON para comparação")
+    parser.add_argument("--save-baseline", help="salva os resultados como novo baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="piora máxima aceita (fração)")
+    parser.add_argument("--quick", action="store_true", help="menos iterações, para checagens rápidas")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+    random.seed(SEED)
+
+    print("Executando benchmarks...")
+    metrics = run_suite(args.quick)
+    pygame.quit()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "quick": args.quick
+        },
+        "metrics": metrics
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+
+    if args.save_baseline:
+        previous_thresholds = {}
+        if os.path.exists(args.save_baseline):
+            with open(args.save_baseline, 'r', encoding='utf-8') as f:
+                previous_thresholds = json.load(f).get("thresholds", {})
+
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report | { "thresholds": previous_thresholds }, f, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare_with_baseline(metrics, baseline, args.threshold)
+        if regressions:
+            print("\nRegressões encontradas:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+
+        print("\nNenhuma regressão acima do limite.")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
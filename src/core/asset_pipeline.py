@@ -0,0 +1,91 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional
+
+import pygame
+
+class AssetPipeline:
+    """
+    Lê e decodifica imagens e sons em um pool de threads, sobrepondo o acesso ao disco com a
+    decodificação. Nas threads, cada imagem é lida, decodificada e escalada; a conversão para o
+    formato da tela (`convert_alpha`), que depende do display, termina na thread principal.
+
+    Quem chama `run` recebe o progresso a cada arquivo concluído (para uma tela de carregamento).
+    """
+
+    _image_jobs: dict[str, tuple[str, Optional[tuple[int, int]]]]
+    _sound_jobs: dict[str, str]
+    _max_workers: Optional[int]
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        :param max_workers: Threads do pool (None = padrão do `ThreadPoolExecutor`).
+        """
+        self._image_jobs = {}
+        self._sound_jobs = {}
+        self._max_workers = max_workers
+
+    def add_image(self, key: str, path: str, size: Optional[tuple[int, int]] = None) -> None:
+        """ Agenda uma imagem, escalada para `size` se informado. """
+        self._image_jobs[key] = (path, size)
+
+    def add_sound(self, key: str, path: str) -> None:
+        """ Agenda um som; ignorado se o mixer não estiver inicializado. """
+        self._sound_jobs[key] = path
+
+    def run(self, progress: Optional[Callable[[int, int, str], None]] = None) -> tuple[dict[str, pygame.Surface], dict[str, pygame.mixer.Sound]]:
+        """
+        Carrega tudo o que foi agendado.
+
+        :param progress: Chamada na thread principal como `progress(concluídos, total, chave)`.
+        :return: Imagens e sons por chave. Imagens ausentes viram superfícies vazias; sons com
+            falha ficam de fora (e são avisados pelo `SoundBank`).
+        """
+        sound_jobs = self._sound_jobs if pygame.mixer.get_init() is not None else {}
+        total = len(self._image_jobs) + len(sound_jobs)
+        convert = pygame.display.get_surface() is not None
+
+        images: dict[str, pygame.Surface] = {}
+        sounds: dict[str, pygame.mixer.Sound] = {}
+
+        if progress: progress(0, total, "")
+
+        with ThreadPoolExecutor(max_workers = self._max_workers, thread_name_prefix = "assets") as executor:
+            futures = {
+                executor.submit(self._decode_image, path, size): (images, key)
+                for key, (path, size) in self._image_jobs.items()
+            }
+            futures.update({
+                executor.submit(self._decode_sound, path): (sounds, key)
+                for key, path in sound_jobs.items()
+            })
+
+            for done, future in enumerate(as_completed(futures), start = 1):
+                target, key = futures[future]
+                asset = future.result()
+
+                if target is images and convert:
+                    asset = asset.convert_alpha()
+                if asset is not None:
+                    target[key] = asset
+
+                if progress: progress(done, total, key)
+
+        return images, sounds
+
+    @staticmethod
+    def _decode_image(path: str, size: Optional[tuple[int, int]]) -> pygame.Surface:
+        try:
+            image = pygame.image.load(path)
+        except FileNotFoundError:
+            print(f"[ERRO] Imagem não encontrada: {os.path.basename(path)}")
+            return pygame.Surface(size or (1, 1))
+
+        return pygame.transform.scale(image, size) if size else image
+
+    @staticmethod
+    def _decode_sound(path: str) -> Optional[pygame.mixer.Sound]:
+        try:
+            return pygame.mixer.Sound(path)
+        except (OSError, pygame.error):
+            return None
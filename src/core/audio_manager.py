@@ -1,72 +1,137 @@
+from typing import Optional
+
 import pygame
 
+from src.core.sound_bank import SoundBank
+
 class AudioManager:
-    """ Classe responsável por gerir todos os Audios do jogo. """
+    """
+    Classe responsável por gerir todos os Audios do jogo.
+
+    Todos os sons ficam decodificados em um `SoundBank` desde a construção. O Waka-Waka e as
+    sirenes tocam em canais reservados: a troca entre a sirene de perseguição e a de
+    vulnerabilidade é um crossfade entre dois canais, sem `mixer.music` e sem ler o disco.
+    """
+
+    WAKA_CHANNEL: int = 0
+    SIREN_CHANNELS: tuple[int, int] = (1, 2)
 
     _music_volume: float
     _waka_volume: float
+    _crossfade_ms: int
     _siren_chase_path: str
     _siren_vulnerable_path: str
     _waka_path: str
-    _eat_sound: pygame.mixer.Sound
+    _sound_bank: SoundBank
+    _eat_sound: Optional[pygame.mixer.Sound]
+    _enabled: bool
+
+    _waka_channel: Optional[pygame.mixer.Channel]
+    _siren_channels: tuple[pygame.mixer.Channel, ...]
+    _waka_playing: bool
+    _current_siren: Optional[str]
+    _active_siren_channel: int
+
+    def __init__(self, config: dict, sounds: Optional[dict[str, pygame.mixer.Sound]] = None) -> None:
+        """
+        :param sounds: Sons já decodificados (ex.: pelo `AssetPipeline`), por caminho; os que
+            faltarem são lidos do disco aqui.
+        """
+        self._enabled = pygame.mixer.get_init() is not None
 
-    def __init__(self, config: dict) -> None:
         constants_config: dict = config.get("constants", {})
         self._music_volume = constants_config.get("music_volume", 0.2)
         self._waka_volume = constants_config.get("waka_volume", 0.4)
+        self._crossfade_ms = constants_config.get("siren_crossfade_ms", 250)
 
         paths_config: dict = config.get("paths", {})
         self._siren_chase_path = paths_config.get("siren_chase", "")
         self._siren_vulnerable_path = paths_config.get("siren_vulnerable", "")
         self._waka_path = paths_config.get("waka_path", "")
-        
+
+        self._sound_bank = SoundBank(self.sound_paths(config), sounds)
         self._eat_sound = None
-        
-        if self._waka_path:
-            try:
-                self._eat_sound = pygame.mixer.Sound(self._waka_path)
-                self._eat_sound.set_volume(self._waka_volume)
-            except pygame.error as e:
-                print(f"Erro ao carregar '{self._waka_path}': {e}")
-
-        try:
-            pygame.mixer.music.set_volume(self._music_volume)
-        except pygame.error:
-             pass
+        self._waka_channel = None
+        self._siren_channels = ()
+        self._waka_playing = False
+        self._current_siren = None
+        self._active_siren_channel = 0
+
+        if not self._enabled:
+            return
+
+        reserved = 1 + len(self.SIREN_CHANNELS)
+        if pygame.mixer.get_num_channels() < reserved:
+            pygame.mixer.set_num_channels(reserved)
+        pygame.mixer.set_reserved(reserved)
+
+        self._waka_channel = pygame.mixer.Channel(self.WAKA_CHANNEL)
+        self._siren_channels = tuple(pygame.mixer.Channel(index) for index in self.SIREN_CHANNELS)
+
+        self._eat_sound = self._sound_bank.get(self._waka_path)
+        if self._eat_sound:
+            self._eat_sound.set_volume(self._waka_volume)
+
+        for path in (self._siren_chase_path, self._siren_vulnerable_path):
+            siren = self._sound_bank.get(path)
+            if siren:
+                siren.set_volume(self._music_volume)
+
+    @staticmethod
+    def sound_paths(config: dict) -> list[str]:
+        """ Arquivos que o gerente decodifica inteiros em memória. """
+        paths_config: dict = config.get("paths", {})
+        keys = ("waka_path", "siren_chase", "siren_vulnerable")
+        return [path for path in (paths_config.get(key, "") for key in keys) if path]
 
     def play_chase(self) -> None:
         """ Toca o som padrão de persequição. """
-        if self._siren_chase_path:
-            self._play_music(self._siren_chase_path)
+        self._play_siren(self._siren_chase_path)
 
     def play_vulnerable(self) -> None:
         """ Toca o som padrão dos fantasmas vulneráveis. """
-        if self._siren_vulnerable_path:
-            self._play_music(self._siren_vulnerable_path)
+        self._play_siren(self._siren_vulnerable_path)
 
     def play_waka(self) -> None:
         """ Toca o som Waka-Waka, do PacMan. """
-        if not self._eat_sound: 
-            return 
-        
-        if self._eat_sound.get_num_channels() == 0:
-            self._eat_sound.play(loops=-1)
-    
+        if not self._eat_sound or self._waka_playing:
+            return
+
+        self._waka_channel.play(self._eat_sound, loops = -1)
+        self._waka_playing = True
+
     def stop_waka(self) -> None:
         """ Para de tocar o som Waka-Waka, do PacMan. """
-        if self._eat_sound:
-            self._eat_sound.stop()
+        if self._waka_playing:
+            self._waka_channel.stop()
+            self._waka_playing = False
+
+    def stop_music(self) -> None:
+        """ Para a sirene de fundo. """
+        for channel in self._siren_channels:
+            channel.stop()
+        self._current_siren = None
 
-    def _play_music(self, path: str) -> None:
+    def _play_siren(self, path: str) -> None:
         """
-        Toca uma música a partir do caminho dela nos arquivos.
-        
-        :param path: Caminho aonde se localiza a música.
+        Troca a sirene de fundo com um crossfade: a atual desaparece no seu canal enquanto a
+        nova entra no outro. Pedir a sirene que já está tocando não faz nada.
+
+        :param path: Caminho do som no `SoundBank`.
         :type path: str
         """
-        try:
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.play(loops = -1)
+        if not self._enabled or path == self._current_siren:
+            return
+
+        siren = self._sound_bank.get(path)
+        if siren is None:
+            return
+
+        fade_ms = 0
+        if self._current_siren is not None:
+            self._siren_channels[self._active_siren_channel].fadeout(self._crossfade_ms)
+            self._active_siren_channel = 1 - self._active_siren_channel
+            fade_ms = self._crossfade_ms
 
-        except pygame.error as e:
-            print(f"Erro ao carregar música '{path}': {e}")
\ No newline at end of file
+        self._siren_channels[self._active_siren_channel].play(siren, loops = -1, fade_ms = fade_ms)
+        self._current_siren = path
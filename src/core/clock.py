@@ -0,0 +1,63 @@
+import pygame
+
+class WallClock:
+    """ Relógio baseado no tempo real do pygame. """
+
+    def get_ticks(self) -> int:
+        """ Retorna os milissegundos desde a inicialização do pygame. """
+        return pygame.time.get_ticks()
+
+    def delay(self, duration_ms: int) -> None:
+        """ Pausa a execução pelo tempo informado. """
+        pygame.time.delay(duration_ms)
+
+class SimulationClock:
+    """ 
+    Relógio simulado, avançado manualmente. 
+    Permite rodar o jogo sem depender do tempo real.
+    """
+
+    _elapsed_ms: float
+
+    def __init__(self, start_ms: float = 0.0) -> None:
+        self._elapsed_ms = start_ms
+
+    def get_ticks(self) -> int:
+        """ Retorna os milissegundos simulados decorridos. """
+        return int(self._elapsed_ms)
+
+    def advance(self, duration_ms: float) -> None:
+        """ Avança o tempo simulado. """
+        self._elapsed_ms += duration_ms
+
+    def delay(self, duration_ms: int) -> None:
+        """ Uma pausa no relógio simulado apenas avança o tempo, sem bloquear. """
+        self.advance(duration_ms)
+
+    @property
+    def elapsed_ms(self) -> float:
+        return self._elapsed_ms
+
+class FixedStepClock(SimulationClock):
+    """
+    Relógio simulado do laço de passo fixo da janela (`Game.run`): o tempo do jogo só avança
+    com os ticks. Uma pausa (`delay`) também espera o tempo real, para ser vista na tela; o
+    laço desconta esse tempo (`take_blocked_ms`) para não compensá-lo com ticks extras.
+    """
+
+    _blocked_ms: int
+
+    def __init__(self, start_ms: float = 0.0) -> None:
+        super().__init__(start_ms)
+        self._blocked_ms = 0
+
+    def delay(self, duration_ms: int) -> None:
+        pygame.time.delay(duration_ms)
+        self.advance(duration_ms)
+        self._blocked_ms += duration_ms
+
+    def take_blocked_ms(self) -> int:
+        """ Tempo real bloqueado em pausas desde a última chamada. """
+        blocked = self._blocked_ms
+        self._blocked_ms = 0
+        return blocked
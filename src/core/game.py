@@ -1,24 +1,50 @@
-import sys
 import os
+import random
+from typing import Optional
 
 import pygame
 
+from src.core.clock import FixedStepClock
+from src.core.paths import default_cache_dir
+from src.core.profiler import FrameProfiler
+from src.core.input_source import KeyboardInput
+from src.core.game_builder import build_asset_pipeline, build_game_manager, build_sprite_atlas, default_maze_path
 from src.core.game_manager import GameManager
-from src.entities.pacman import PacMan
-from src.core.settings import Settings
-from src.entities.blinky import Blinky
-from src.entities.clyde import Clyde
-from src.entities.pinky import Pinky
-from src.entities.inky import Inky
+from src.net.spectator_server import SpectatorServer
+from src.core.replay import ReplayLog, RecordingClock, RecordingInput, create_replay_log
+from src.ui.profiler_overlay import ProfilerOverlay
+from src.ui.render_scheduler import RenderScheduler
+from src.ui.loading_screen import LoadingScreen
+from src.ui.sprite_atlas import SpriteAtlas
 
 class Game:
 
     _width: float
     _height: float
     _fps: int
+    _tick_rate: int
+    _tick_ms: float
+    _simulation_clock: FixedStepClock
     _running: bool
+    _replay_log: Optional[ReplayLog]
+    _profiler: FrameProfiler
+    _profiler_overlay: ProfilerOverlay
+    _render_scheduler: RenderScheduler
+
+    PROFILER_TOGGLE_KEY: int = pygame.K_F3
+    TRACE_EXPORT_KEY: int = pygame.K_F4
+    # Maior intervalo entre quadros convertido em ticks; acima disso o jogo fica mais lento
+    # em vez de acumular ticks atrasados que nunca alcançariam o tempo real.
+    MAX_FRAME_MS: int = 250
+
+    def __init__(self, width: float, height: float, fps: int, tick_rate: int = 60) -> None:
+        """
+        :param fps: Limite de quadros desenhados por segundo.
+        :param tick_rate: Ticks da simulação por segundo, independentes dos quadros: entre dois
+            ticks, as entidades são desenhadas em posições interpoladas.
+        """
+        if fps <= 0 or tick_rate <= 0: raise ValueError('O fps e a taxa de ticks devem ser positivos.')
 
-    def __init__(self, width: float, height: float, fps: int) -> None:
         pygame.init()
         pygame.mixer.init()
         pygame.display.set_caption("Pac-Man")
@@ -26,24 +52,86 @@ class Game:
         self._width: float = width
         self._height: float = height
         self._fps: int = fps
+        self._tick_rate: int = tick_rate
+        self._tick_ms: float = 1000.0 / tick_rate
+        self._simulation_clock = FixedStepClock()
 
         self._running: bool = True
         self._screen = pygame.display.set_mode((width, height))
         self._clock = pygame.time.Clock()
-
-    def run(self, config_path: str) -> None:
-
-        game_manager = self._initial_config(config_path)
-
-        while self._running:
-            delta_time: float = self._clock.tick(self._fps) / 1000.0
+        self._replay_log = None
+        self._profiler = FrameProfiler()
+        self._profiler_overlay = ProfilerOverlay(self._screen, self._profiler)
+        self._render_scheduler = RenderScheduler(fps, self._tick_ms)
+
+    def run(self, config_path: str, record_path: Optional[str] = None, spectator_port: Optional[int] = None) -> None:
+        """
+        :param record_path: Se informado, grava a partida nesse arquivo de replay ao final.
+        :param spectator_port: Se informado, transmite a partida para espectadores nessa porta.
+        """
+        game_manager = self._initial_config(config_path, record_path is not None)
+
+        spectator_server = None
+        if spectator_port is not None:
+            spectator_server = SpectatorServer(game_manager.maze, port = spectator_port)
+            spectator_server.start_in_thread()
+
+        profiler = self._profiler
+        render_scheduler = self._render_scheduler
+        simulation_clock = self._simulation_clock
+        tick_ms = self._tick_ms
+        tick_seconds = tick_ms / 1000.0
+        accumulator = 0.0
+        tick = 0
+
+        # O primeiro intervalo incluiria o carregamento dos recursos.
+        self._clock.tick()
+
+        while self._running and not game_manager.is_finished:
+            timed = profiler.enabled
+            if timed: start = profiler.now()
+
+            frame_ms = max(self._clock.tick(self._fps) - simulation_clock.take_blocked_ms(), 0)
+            accumulator += min(frame_ms, self.MAX_FRAME_MS)
+            if timed: start = profiler.lap("game.wait", start)
 
             self._handle_event()
-
-            game_manager.update(delta_time)
-            game_manager.draw()
+            if timed: start = profiler.lap("game.events", start)
+
+            while accumulator >= tick_ms and not game_manager.is_finished:
+                game_manager.store_previous_positions()
+                simulation_clock.advance(tick_ms)
+                game_manager.update(tick_seconds)
+                accumulator -= tick_ms
+
+                tick += 1
+                if spectator_server is not None:
+                    spectator_server.publish_threadsafe(game_manager, tick)
+            if timed: start = profiler.lap("game.update", start)
+
+            alpha = accumulator / tick_ms
+            if profiler.enabled:
+                render_scheduler.invalidate()
+            if not render_scheduler.should_draw(frame_ms, game_manager.frame_signature(alpha)):
+                if timed: profiler.lap("game.schedule", start)
+                continue
+            if timed: start = profiler.lap("game.schedule", start)
+
+            game_manager.draw(alpha)
+            if timed: start = profiler.lap("game.draw", start)
+
+            if profiler.enabled:
+                self._profiler_overlay.draw()
+                if timed: start = profiler.lap("game.overlay", start)
 
             pygame.display.flip()
+            if timed: profiler.lap("game.flip", start)
+
+        if spectator_server is not None:
+            spectator_server.stop_thread()
+
+        if record_path is not None and self._replay_log is not None:
+            self._replay_log.save(record_path)
 
         pygame.quit()
 
@@ -51,135 +139,57 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self._running = False
-
-    def _initial_config(self, config_path: str) -> GameManager:
-
-        if getattr(sys, 'frozen', False):
-            BASE_DIR = os.path.dirname(sys.executable)
-        else:
-            BASE_DIR = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "..")
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED, pygame.WINDOWRESTORED):
+                self._render_scheduler.invalidate()
+            elif event.type == pygame.KEYDOWN and event.key == self.PROFILER_TOGGLE_KEY:
+                self._profiler.toggle()
+                self._render_scheduler.invalidate()
+            elif event.type == pygame.KEYDOWN and event.key == self.TRACE_EXPORT_KEY:
+                self._export_trace()
+
+    def _export_trace(self) -> None:
+        """ Salva as amostras do profiler no formato de trace do Chrome. """
+        trace_path = os.path.join(default_cache_dir(), "frame_trace.json")
+
+        try:
+            os.makedirs(os.path.dirname(trace_path), exist_ok=True)
+            self._profiler.export_chrome_trace(trace_path)
+            print(f"Trace salvo em {trace_path}")
+        except OSError as e:
+            print(f"[ERRO] Não foi possível salvar o trace '{trace_path}': {e}")
+
+    def _load_assets(self, config_path: str) -> tuple[SpriteAtlas, dict[str, pygame.mixer.Sound]]:
+        """ Lê os sprites e sons em paralelo, mostrando o progresso na tela de carregamento. """
+        cell_size = (self._screen.get_width() // 30, self._screen.get_height() // 32)
+        loading_screen = LoadingScreen(self._screen)
+
+        images, sounds = build_asset_pipeline(config_path, cell_size).run(loading_screen.draw)
+        return build_sprite_atlas(cell_size, images), sounds
+
+    def _initial_config(self, config_path: str, record: bool = False) -> GameManager:
+        sprite_atlas, sounds = self._load_assets(config_path)
+        self._simulation_clock = FixedStepClock()
+
+        if not record:
+            return build_game_manager(
+                screen = self._screen,
+                config_path = config_path,
+                profiler = self._profiler,
+                clock = self._simulation_clock,
+                sprite_atlas = sprite_atlas,
+                sounds = sounds
             )
 
-        def load_image(path: str, scale: tuple = None) -> pygame.Surface:
-            try:
-                full_path = os.path.join(BASE_DIR, "data", "images", path)
-                image = pygame.image.load(full_path).convert_alpha()
-                if scale:
-                    image = pygame.transform.scale(image, scale)
-
-                return image
-            except FileNotFoundError:
-                print(f"[ERRO] Imagem não encontrada: {path}")
-                return pygame.Surface((32, 32))
-
-        def get_pacman_assets(cw: int, ch: int) -> dict:
-            scale = (cw, ch)
-            
-            sprites_list = [
-                load_image("pacman_eat_0.png", scale),
-                load_image("pacman_eat_1.png", scale),
-                load_image("pacman_eat_2.png", scale)
-            ]
-
-            return { "move": sprites_list }
-
-        def get_ghost_assets(ghost_name: str, cw: int, ch: int) -> dict:
-            scale = (cw, ch)
-            
-            return {
-                "directional": {
-                    1: load_image(f"{ghost_name}_up.png", scale),
-                    2: load_image(f"{ghost_name}_down.png", scale),
-                    3: load_image(f"{ghost_name}_left.png", scale),
-                    4: load_image(f"{ghost_name}_right.png", scale)
-                },
-                "vulnerable": [
-                    load_image("vulnerable_sprite.png", scale),
-                    load_image("vulnerable_sprite_white.png", scale)
-                ],
-                "eaten": {
-                    1: load_image("eyes_up.png", scale),
-                    2: load_image("eyes_down.png", scale),
-                    3: load_image("eyes_left.png", scale),
-                    4: load_image("eyes_right.png", scale)
-                }
-            }
-
-        settings = Settings(config_path)
-
-        teleport_config: dict = settings.get("teleport", {})
-        ghost_config: dict = settings.get("ghost", {})
-        audio_manager_config: dict = settings.get("audio_manager", {})
-        environment_config: dict = settings.get("environment", {})
-        maze_config: dict = settings.get("maze", {})
-        hud_config: dict = settings.get("hud", {})
-        pacman_config: dict = settings.get("pacman", {})
-        blinky_config: dict = settings.get("blinky", {})
-        inky_config: dict = settings.get("inky", {})
-        clyde_config: dict = settings.get("clyde", {})
-        pinky_config: dict = settings.get("pinky", {})
-
-        maze_file_path = os.path.join(BASE_DIR, 'data', 'settings', 'default_maze.txt')
-
-        game_manager = GameManager(
-            screen = self._screen, 
-            maze_file = maze_file_path, 
-            config = environment_config | maze_config | audio_manager_config | hud_config
-        )
-
-        cw, ch = game_manager.cell_width, game_manager.cell_height
-        pacman_start_pos = pacman_config.get("start_grid_pos", [18, 15])
-        start_row, start_col = pacman_start_pos[0], pacman_start_pos[1]
-
-        game_manager.add_entity(
-            PacMan(
-                x = start_col * cw + cw // 2, 
-                y = start_row * ch + ch // 2, 
-                manager = game_manager,
-                config = teleport_config | pacman_config,
-                assets = get_pacman_assets(cw, ch)
-            )
-        )
-
-        game_manager.add_entity(
-            Blinky(
-                x = 15 * cw + cw // 2,
-                y = 12 * ch + ch // 2,
-                manager = game_manager,
-                config = teleport_config | ghost_config | blinky_config,
-                assets = get_ghost_assets("blinky", cw, ch)
-            )
-        )
-
-        game_manager.add_entity(
-            Pinky(
-                x = 15 * cw + cw // 2,
-                y = 15 * ch + ch // 2,
-                manager = game_manager,
-                config = teleport_config | ghost_config | pinky_config,
-                assets = get_ghost_assets("pinky", cw, ch)
-            )
-        )
-
-        game_manager.add_entity(
-            Inky(
-                x = 13 * cw + cw // 2,
-                y = 15 * ch + ch // 2,
-                manager = game_manager,
-                config = teleport_config | ghost_config | inky_config,
-                assets = get_ghost_assets("inky", cw, ch)
-            )
-        )
-
-        game_manager.add_entity(
-            Clyde(
-                x = 17 * cw + cw // 2,
-                y = 15 * ch + ch // 2,
-                manager = game_manager,
-                config = teleport_config | ghost_config | clyde_config,
-                assets = get_ghost_assets("clyde", cw, ch)
-            )
-        )
+        seed = random.randrange(2 ** 32)
+        self._replay_log = create_replay_log(seed, config_path, default_maze_path(), self._width, self._height, self._tick_rate)
 
-        return game_manager
\ No newline at end of file
+        return build_game_manager(
+            screen = self._screen, 
+            config_path = config_path,
+            profiler = self._profiler,
+            clock = RecordingClock(self._simulation_clock, self._replay_log),
+            input_source = RecordingInput(KeyboardInput(), self._replay_log),
+            rng = random.Random(seed),
+            sprite_atlas = sprite_atlas,
+            sounds = sounds
+        )
\ No newline at end of file
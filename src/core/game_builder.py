@@ -0,0 +1,198 @@
+import os
+import random
+from typing import Optional
+
+import pygame
+
+from src.core.game_manager import GameManager
+from src.core.asset_pipeline import AssetPipeline
+from src.core.paths import resolve_base_dir
+from src.core.audio_manager import AudioManager
+from src.entities.pacman import PacMan
+from src.core.settings import Settings
+from src.entities.blinky import Blinky
+from src.entities.clyde import Clyde
+from src.entities.pinky import Pinky
+from src.entities.inky import Inky
+from src.ui.sprite_atlas import SpriteAtlas
+from src.ui.entity_sprites import PacManSprites, GhostSprites
+
+GHOST_SPAWN_TILES: dict[str, tuple[int, int]] = {
+    "blinky": (12, 15),
+    "pinky": (15, 15),
+    "inky": (15, 13),
+    "clyde": (15, 17)
+}
+
+GHOST_SPRITE_NAMES: tuple[str, ...] = ("blinky", "pinky", "inky", "clyde")
+PACMAN_SPRITES: tuple[str, ...] = ("pacman_eat_0.png", "pacman_eat_1.png", "pacman_eat_2.png")
+VULNERABLE_SPRITES: tuple[str, ...] = ("vulnerable_sprite.png", "vulnerable_sprite_white.png")
+DIRECTION_SUFFIXES: dict[int, str] = { 1: "up", 2: "down", 3: "left", 4: "right" }
+
+def default_maze_path() -> str:
+    return os.path.join(resolve_base_dir(), 'data', 'settings', 'default_maze.txt')
+
+def merge_config(base: dict, overrides: dict) -> dict:
+    """ Cópia de `base` com `overrides` aplicado por cima, recursivamente nos sub-dicionários. """
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def load_entity_configs(config_path: str, overrides: Optional[dict] = None) -> dict[str, dict]:
+    """ 
+    Lê o arquivo de configuração e monta o dicionário final de cada participante 
+    ("manager", "pacman", "blinky", "pinky", "inky", "clyde").
+
+    :param overrides: Seções do arquivo a sobrescrever, no mesmo formato dele
+        (ex.: `{"clyde": {"distance_threshold_squared": 36}}`).
+    """
+    settings = Settings(config_path)
+    overrides = overrides or {}
+
+    def section(name: str) -> dict:
+        return merge_config(settings.get(name, {}), overrides.get(name, {}))
+
+    teleport_config: dict = section("teleport")
+    ghost_config: dict = section("ghost")
+    audio_manager_config: dict = section("audio_manager")
+    environment_config: dict = section("environment")
+    maze_config: dict = section("maze")
+    hud_config: dict = section("hud")
+    pacman_config: dict = section("pacman")
+    blinky_config: dict = section("blinky")
+    inky_config: dict = section("inky")
+    clyde_config: dict = section("clyde")
+    pinky_config: dict = section("pinky")
+
+    return {
+        "manager": environment_config | maze_config | audio_manager_config | hud_config,
+        "pacman": teleport_config | pacman_config,
+        "blinky": teleport_config | ghost_config | blinky_config,
+        "pinky": teleport_config | ghost_config | pinky_config,
+        "inky": teleport_config | ghost_config | inky_config,
+        "clyde": teleport_config | ghost_config | clyde_config
+    }
+
+def pacman_start_tile(pacman_config: dict) -> tuple[int, int]:
+    start_row, start_col = pacman_config.get("start_grid_pos", [18, 15])
+    return start_row, start_col
+
+def sprite_images_dir() -> str:
+    return os.path.join(resolve_base_dir(), "data", "images")
+
+def sprite_angles() -> dict[str, tuple[int, ...]]:
+    """ Arquivo de cada sprite do jogo e os ângulos necessários (as rotações do Pac-Man). """
+    pacman_angles = tuple(sorted(set(PacManSprites.ORIENTATION_ANGLES.values())))
+
+    angles = { name: pacman_angles for name in PACMAN_SPRITES }
+    angles.update({ name: (0,) for name in VULNERABLE_SPRITES })
+    for suffix in DIRECTION_SUFFIXES.values():
+        angles[f"eyes_{suffix}.png"] = (0,)
+        for ghost_name in GHOST_SPRITE_NAMES:
+            angles[f"{ghost_name}_{suffix}.png"] = (0,)
+
+    return angles
+
+def build_sprite_atlas(cell_size: tuple[int, int], images: Optional[dict[str, pygame.Surface]] = None) -> SpriteAtlas:
+    """
+    Atlas com todos os sprites do jogo, incluindo as rotações do Pac-Man.
+
+    :param images: Imagens já carregadas pelo `AssetPipeline` (as que faltarem são lidas do disco).
+    """
+    return SpriteAtlas(sprite_images_dir(), cell_size, sprite_angles(), images)
+
+def build_asset_pipeline(config_path: str, cell_size: tuple[int, int]) -> AssetPipeline:
+    """ Pipeline com todos os sprites, já na escala do tile, e os sons da configuração. """
+    pipeline = AssetPipeline()
+
+    for name in sprite_angles():
+        pipeline.add_image(name, os.path.join(sprite_images_dir(), name), cell_size)
+
+    for path in AudioManager.sound_paths(load_entity_configs(config_path)["manager"]):
+        pipeline.add_sound(path, path)
+
+    return pipeline
+
+def build_game_manager(
+    screen: pygame.Surface,
+    config_path: str,
+    clock = None,
+    input_source = None,
+    rng: Optional[random.Random] = None,
+    load_sprites: bool = True,
+    profiler = None,
+    sprite_atlas: Optional[SpriteAtlas] = None,
+    sounds: Optional[dict[str, pygame.mixer.Sound]] = None,
+    configs: Optional[dict[str, dict]] = None
+) -> GameManager:
+    """
+    Monta o GameManager com o labirinto, o Pac-Man e os quatro fantasmas.
+
+    :param load_sprites: Quando falso, nenhuma imagem é lida e o renderizador não desenha 
+        as entidades (modo sem janela). Os sprites ficam só no `GameRenderer`.
+    :param sprite_atlas: Atlas já montado (ex.: com o `AssetPipeline`); senão, é montado aqui.
+    :param sounds: Sons já decodificados, por caminho; os que faltarem são lidos do disco.
+    :param configs: Configurações já montadas por `load_entity_configs` (reaproveitadas entre
+        partidas); senão, o arquivo é lido aqui.
+    """
+    def get_pacman_sprites(atlas: SpriteAtlas) -> PacManSprites:
+        return PacManSprites({
+            orientation: [atlas.get(name, angle) for name in PACMAN_SPRITES]
+            for orientation, angle in PacManSprites.ORIENTATION_ANGLES.items()
+        })
+
+    def get_ghost_sprites(ghost_name: str, atlas: SpriteAtlas) -> GhostSprites:
+        return GhostSprites(
+            directional = { 
+                direction: atlas.get(f"{ghost_name}_{suffix}.png") for direction, suffix in DIRECTION_SUFFIXES.items() 
+            },
+            vulnerable = [atlas.get(name) for name in VULNERABLE_SPRITES],
+            eaten = { 
+                direction: atlas.get(f"eyes_{suffix}.png") for direction, suffix in DIRECTION_SUFFIXES.items() 
+            }
+        )
+
+    if configs is None:
+        configs = load_entity_configs(config_path)
+
+    game_manager = GameManager(
+        screen = screen, 
+        maze_file = default_maze_path(), 
+        config = configs["manager"],
+        clock = clock,
+        input_source = input_source,
+        rng = rng,
+        profiler = profiler,
+        sounds = sounds
+    )
+
+    cw, ch = game_manager.cell_width, game_manager.cell_height
+    start_row, start_col = pacman_start_tile(configs["pacman"])
+    atlas = sprite_atlas or (build_sprite_atlas((cw, ch)) if load_sprites else None)
+
+    pacman = PacMan(
+        x = start_col * cw + cw // 2, 
+        y = start_row * ch + ch // 2, 
+        manager = game_manager,
+        config = configs["pacman"]
+    )
+    game_manager.add_entity(pacman)
+    if atlas: game_manager.renderer.register_sprites(pacman, get_pacman_sprites(atlas))
+
+    for ghost_name, ghost_class in (("blinky", Blinky), ("pinky", Pinky), ("inky", Inky), ("clyde", Clyde)):
+        spawn_row, spawn_col = GHOST_SPAWN_TILES[ghost_name]
+
+        ghost = ghost_class(
+            x = spawn_col * cw + cw // 2,
+            y = spawn_row * ch + ch // 2,
+            manager = game_manager,
+            config = configs[ghost_name]
+        )
+        game_manager.add_entity(ghost)
+        if atlas: game_manager.renderer.register_sprites(ghost, get_ghost_sprites(ghost_name, atlas))
+
+    return game_manager
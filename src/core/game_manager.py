@@ -1,11 +1,23 @@
+import random
+from typing import Optional
+
 import pygame
 
+from src.core.clock import WallClock
+from src.core.input_source import KeyboardInput
+from src.core.paths import default_cache_dir
+from src.core.profiler import FrameProfiler
 from src.core.ghost_director import GhostDirector
 from src.core.audio_manager import AudioManager
 from src.ui.game_renderer import GameRenderer
 from src.core.states import GhostState
 from src.core.states import GameState
+from src.core.tick_context import TickContext
 from src.world.maze import Maze
+from src.world.path_table import PathTable
+from src.world.spatial_hash import SpatialHash
+from src.entities.pacman import PacMan
+from src.entities.ghost import Ghost
 from src.ui.hud import HUD
 
 class GameManager: 
@@ -18,15 +30,45 @@ class GameManager:
     _screen: pygame.Surface
     _game_state: GameState
     _entities: list
+    _pacman: Optional[PacMan]
+    _ghosts: tuple[Ghost, ...]
+    _blinky: Optional[Ghost]
+    _entities_by_name: dict[str, object]
+    _spatial_hash: SpatialHash
+    _entity_stages: dict[object, str]
+    _profiler: FrameProfiler
     _lives_remaining: int
     _initial_lives: int
     _vulnerable_duration_ms: int
     _game_over_screen_duration_ms: int
     _vulnerable_timer_ms: int
     _game_over_start_time_ms: int
-
-    def __init__(self, screen: pygame.Surface, maze_file: str, config: dict):
+    _clock: WallClock
+    _input_source: KeyboardInput
+    _rng: random.Random
+    _current_time_ms: int
+    _finished: bool
+    _path_tables: dict[bool, PathTable]
+
+    def __init__(
+        self, 
+        screen: pygame.Surface, 
+        maze_file: str, 
+        config: dict, 
+        clock = None, 
+        input_source = None, 
+        rng: Optional[random.Random] = None,
+        profiler: Optional[FrameProfiler] = None,
+        sounds: Optional[dict[str, pygame.mixer.Sound]] = None
+    ):
         self._screen = screen
+        self._clock = clock if clock is not None else WallClock()
+        self._input_source = input_source if input_source is not None else KeyboardInput()
+        self._rng = rng if rng is not None else random.Random()
+        self._profiler = profiler if profiler is not None else FrameProfiler()
+        self._current_time_ms = self._clock.get_ticks()
+        self._finished = False
+        self._path_tables = {}
         
         env_config: dict = config.get("environment", {})
         durations: dict = env_config.get("durations_ms", {})
@@ -39,22 +81,29 @@ class GameManager:
 
         self._game_state = GameState.CHASE
         self._entities = []
+        self._pacman = None
+        self._ghosts = ()
+        self._blinky = None
+        self._entities_by_name = {}
+        self._entity_stages = {}
         self._vulnerable_timer_ms = 0
         self._game_over_start_time_ms = 0
 
         cell_width  = screen.get_width() // 30
         cell_height = screen.get_height() // 32
 
-        self._maze = Maze(maze_file, cell_width, cell_height, config)
+        self._maze = Maze(maze_file, cell_width, cell_height, config, default_cache_dir())
+        self._spatial_hash = SpatialHash()
         self._hud = HUD(screen, config)
-        self._audio_manager = AudioManager(config)
+        self._audio_manager = AudioManager(config, sounds)
         self._ghost_director = GhostDirector(config)
-        self._renderer = GameRenderer(screen)
+        self._renderer = GameRenderer(screen, self._profiler)
 
         self._audio_manager.play_chase()
 
     def update(self, delta_time: float) -> None:
-        current_time = pygame.time.get_ticks()
+        self._current_time_ms = self._clock.get_ticks()
+        current_time = self._current_time_ms
 
         if self._game_state in [GameState.GAME_OVER, GameState.VICTORY]:
             self._handle_end_game_timer()
@@ -67,14 +116,29 @@ class GameManager:
             self._ghost_director.set_paused(False)
             self._ghost_director.update(current_time)
         
-        for entity in self._entities[:]:
-            entity.update(delta_time)
+        if self._profiler.enabled:
+            self._update_entities_timed(delta_time)
+            return
+
+        # O Pac-Man anda primeiro: é ele quem muda o estado do jogo, as pastilhas e as vidas que
+        # o contexto do tick entrega às outras entidades.
+        entities = self._entities[:]
+        pacman = self._pacman
+
+        if pacman is not None:
+            pacman.update(delta_time)
+
+        context = self.tick_context()
+        for entity in entities:
+            if entity is not pacman:
+                entity.update(delta_time, context)
 
-    def draw(self) -> None:
+    def draw(self, alpha: float = 1.0) -> None:
+        """ :param alpha: Fração do tick atual já decorrida, para interpolar as entidades (1 = sem interpolação). """
         current_score = 0
 
-        if self._entities:
-             current_score = self._entities[0].total_points
+        if self._pacman:
+             current_score = self._pacman.total_points
 
         self._renderer.render(
             maze=self._maze,
@@ -82,15 +146,36 @@ class GameManager:
             hud=self._hud,
             game_state=self._game_state,
             score=current_score,
-            lives=self._lives_remaining
+            lives=self._lives_remaining,
+            alpha=alpha
         )
 
+    def frame_signature(self, alpha: float = 1.0) -> tuple:
+        """ Assinatura do quadro que `draw(alpha)` desenharia (ver `GameRenderer.frame_signature`). """
+        current_score = self._pacman.total_points if self._pacman else 0
+        return self._renderer.frame_signature(
+            self._maze, self._entities, self._game_state, current_score, self._lives_remaining, alpha
+        )
+
+    def store_previous_positions(self) -> None:
+        """ Guarda as posições de todas as entidades antes de um tick, para a interpolação do desenho. """
+        for entity in self._entities:
+            entity.store_previous_position()
+
     def add_entity(self, entity) -> None:
         if entity is None: raise ValueError('Entidade inválida.')
-        if entity not in self._entities: self._entities.append(entity)
+        if entity not in self._entities: 
+            self._entities.append(entity)
+            self._rebuild_entity_registry()
     
     def remove_entity(self, entity) -> None:
         self._entities = [e for e in self._entities if e is not entity]
+        self._renderer.unregister_sprites(entity)
+        self._rebuild_entity_registry()
+
+    def get_entity(self, name: str):
+        """ Entidade registrada pelo nome da classe em minúsculas (ex.: "blinky"), ou None. """
+        return self._entities_by_name.get(name)
 
     def set_vulnerable(self) -> None:
         if self._game_state in (GameState.GAME_OVER, GameState.VICTORY): return
@@ -99,7 +184,7 @@ class GameManager:
             self._game_state = GameState.VULNERABLE
             self._audio_manager.play_vulnerable()
 
-        self._vulnerable_timer_ms = pygame.time.get_ticks()
+        self._vulnerable_timer_ms = self._current_time_ms
     
     def set_chase(self) -> None:
         self._game_state = GameState.CHASE
@@ -112,35 +197,98 @@ class GameManager:
             self._reset_level()
         else:
             self._game_state = GameState.GAME_OVER
-            self._game_over_start_time_ms = pygame.time.get_ticks()
+            self._game_over_start_time_ms = self._current_time_ms
 
     def handle_victory(self):
         self._game_state = GameState.VICTORY
         self._audio_manager.stop_waka() 
-        pygame.mixer.music.stop() 
-        self._game_over_start_time_ms = pygame.time.get_ticks()
+        self._audio_manager.stop_music()
+        self._game_over_start_time_ms = self._current_time_ms
+
+    def tick_context(self) -> TickContext:
+        """ Estado do mundo lido pelas entidades neste tick (ver `TickContext`). """
+        pacman = self._pacman
+        if pacman is None:
+            return TickContext(
+                self._game_state, self._ghost_director.current_mode, self._current_time_ms,
+                None, (0, 0), 0, 0, self._ghosts, self._blinky
+            )
+
+        return TickContext(
+            self._game_state, self._ghost_director.current_mode, self._current_time_ms,
+            pacman, pacman.tile, pacman.orientation, pacman.total_points,
+            self._ghosts, self._blinky
+        )
 
     def get_global_ghost_mode(self) -> GhostState:
         return self._ghost_director.current_mode
 
+    def path_table(self, allow_door: bool = False) -> PathTable:
+        """ Tabela de caminhos mais curtos do labirinto, carregada na primeira consulta. """
+        table = self._path_tables.get(allow_door)
+
+        if table is None:
+            table = PathTable.load_or_build(self._maze, allow_door, default_cache_dir())
+            self._path_tables[allow_door] = table
+
+        return table
+
     def _reset_level(self):
-        pygame.time.delay(1000) 
+        self._clock.delay(1000)
+        self._current_time_ms = self._clock.get_ticks()
         self.set_chase()
         
-        self._ghost_director.reset()
+        self._ghost_director.reset(self._current_time_ms)
+        self._renderer.invalidate_pellet_layer()
 
         for entity in self._entities:
             if hasattr(entity, 'reset'):
                 entity.reset()
 
+    def _update_entities_timed(self, delta_time: float) -> None:
+        """ Mesma atualização das entidades, registrando o tempo de cada uma no profiler. """
+        profiler = self._profiler
+        entities = self._entities[:]
+        pacman = self._pacman
+        start = profiler.now()
+
+        if pacman is not None:
+            pacman.update(delta_time)
+            start = profiler.lap(self._entity_stages.get(pacman, "update.entity"), start)
+
+        context = self.tick_context()
+        start = profiler.lap("update.context", start)
+
+        for entity in entities:
+            if entity is not pacman:
+                entity.update(delta_time, context)
+                start = profiler.lap(self._entity_stages.get(entity, "update.entity"), start)
+
+    def _rebuild_entity_registry(self) -> None:
+        """ Atualiza os índices por papel e por nome; chamado só quando a lista de entidades muda. """
+        self._pacman = next((e for e in self._entities if isinstance(e, PacMan)), None)
+        self._ghosts = tuple(e for e in self._entities if isinstance(e, Ghost))
+
+        self._entities_by_name = {}
+        self._entity_stages = {}
+        for entity in self._entities:
+            name = type(entity).__name__.lower()
+            self._entities_by_name.setdefault(name, entity)
+            self._entity_stages[entity] = f"update.{name}"
+        self._blinky = self._entities_by_name.get("blinky")
+
+        self._spatial_hash.clear()
+        for ghost in self._ghosts:
+            self._spatial_hash.insert(ghost)
+
     def _handle_end_game_timer(self):
-        now = pygame.time.get_ticks()
+        now = self._current_time_ms
 
         if now - self._game_over_start_time_ms > self._game_over_screen_duration_ms:
-            pygame.event.post(pygame.event.Event(pygame.QUIT))
+            self._finished = True
 
     def _check_vulnerable_timeout(self):
-        now = pygame.time.get_ticks()
+        now = self._current_time_ms
 
         if now - self._vulnerable_timer_ms > self._vulnerable_duration_ms:
             self.set_chase()
@@ -149,6 +297,28 @@ class GameManager:
     def game_state(self) -> GameState:
         return self._game_state
 
+    @property
+    def is_finished(self) -> bool:
+        """ Indica se a tela de fim de jogo já foi exibida pelo tempo configurado. """
+        return self._finished
+
+    @property
+    def current_time_ms(self) -> int:
+        """ Tempo do relógio do jogo, amostrado no início de cada atualização. """
+        return self._current_time_ms
+
+    @property
+    def clock(self):
+        return self._clock
+
+    @property
+    def input_source(self):
+        return self._input_source
+
+    @property
+    def rng(self) -> random.Random:
+        return self._rng
+
     @property
     def lives(self) -> int:
         return self._lives_remaining
@@ -157,6 +327,24 @@ class GameManager:
     def entities(self) -> list:
         return self._entities
 
+    @property
+    def pacman(self) -> Optional[PacMan]:
+        return self._pacman
+
+    @property
+    def ghosts(self) -> tuple[Ghost, ...]:
+        """ Fantasmas na ordem em que foram adicionados. """
+        return self._ghosts
+
+    @property
+    def profiler(self) -> FrameProfiler:
+        return self._profiler
+
+    @property
+    def spatial_hash(self) -> SpatialHash:
+        """ Índice por tile dos fantasmas, usado na detecção de colisões do Pac-Man. """
+        return self._spatial_hash
+
     @property
     def maze(self) -> Maze:
         return self._maze
@@ -1,4 +1,3 @@
-import pygame
 from src.core.states import GhostState
 
 class GhostDirector:
@@ -36,10 +35,10 @@ class GhostDirector:
             if time_since_switch > self._chase_duration_ms:
                 self._switch_mode(GhostState.SCATTER, current_time_ms)
 
-    def reset(self):
+    def reset(self, current_time_ms: int):
         """ Reinicia o ciclo para o início do nível. """
         self._current_mode = GhostState.SCATTER
-        self._last_switch_time = pygame.time.get_ticks()
+        self._last_switch_time = current_time_ms
         self._paused = False
 
     def set_paused(self, is_paused: bool):
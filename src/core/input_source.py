@@ -0,0 +1,37 @@
+import pygame
+
+DIRECTION_KEYS: dict = { 1: pygame.K_UP, 2: pygame.K_DOWN, 3: pygame.K_LEFT, 4: pygame.K_RIGHT }
+
+class KeyboardInput:
+    """ Fonte de entrada que lê o teclado real. """
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+class ScriptedInput:
+    """ 
+    Fonte de entrada controlada por código. 
+    Simula o estado das setas a partir de uma direção (0 = nenhuma tecla).
+    """
+
+    _direction: int
+    _pressed_by_direction: dict[int, dict[int, bool]]
+
+    def __init__(self, direction: int = 0) -> None:
+        self._pressed_by_direction = {
+            direction: { key: (key_direction == direction) for key_direction, key in DIRECTION_KEYS.items() }
+            for direction in (0, 1, 2, 3, 4)
+        }
+        self.set_direction(direction)
+
+    def set_direction(self, direction: int) -> None:
+        if direction not in self._pressed_by_direction:
+            raise ValueError(f'Direção inválida: {direction}')
+        self._direction = direction
+
+    def get_pressed(self) -> dict[int, bool]:
+        return self._pressed_by_direction[self._direction]
+
+    @property
+    def direction(self) -> int:
+        return self._direction
@@ -0,0 +1,13 @@
+import sys
+import os
+
+def resolve_base_dir() -> str:
+    """ Retorna a pasta raiz do jogo, inclusive quando empacotado pelo PyInstaller. """
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+def default_cache_dir() -> str:
+    """ Pasta onde ficam os arquivos gerados (tabelas, imagens pré-renderizadas). """
+    return os.path.join(resolve_base_dir(), "data", "cache")
@@ -0,0 +1,120 @@
+import json
+import time
+from array import array
+
+class FrameProfiler:
+    """
+    Tempos por etapa do quadro (laço do jogo, atualização de cada entidade, etapas da renderização),
+    guardados em buffers circulares de tamanho fixo.
+
+    Quem mede deve checar `enabled` antes de ler o relógio; desativado, o custo é só esse teste.
+    """
+
+    _enabled: bool
+    _capacity: int
+    _starts: dict[str, array]
+    _durations: dict[str, array]
+    _counts: dict[str, int]
+    _origin: float
+
+    def __init__(self, capacity: int = 600, enabled: bool = False) -> None:
+        """
+        :param capacity: Amostras mantidas por etapa (600 = 10 segundos a 60 fps).
+        """
+        if capacity <= 0: raise ValueError('A capacidade do profiler deve ser positiva.')
+
+        self._enabled = enabled
+        self._capacity = capacity
+        self._starts = {}
+        self._durations = {}
+        self._counts = {}
+        self._origin = time.perf_counter()
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    def record(self, stage: str, start: float, end: float) -> None:
+        """ Registra uma amostra da etapa (instantes em segundos de `now()`). """
+        durations = self._durations.get(stage)
+        if durations is None:
+            durations = self._durations[stage] = array('d', bytes(8 * self._capacity))
+            self._starts[stage] = array('d', bytes(8 * self._capacity))
+            self._counts[stage] = 0
+
+        count = self._counts[stage]
+        slot = count % self._capacity
+        durations[slot] = end - start
+        self._starts[stage][slot] = start
+        self._counts[stage] = count + 1
+
+    def lap(self, stage: str, start: float) -> float:
+        """ Registra a etapa de `start` até agora e devolve o instante atual, início da próxima etapa. """
+        end = time.perf_counter()
+        self.record(stage, start, end)
+        return end
+
+    def toggle(self) -> bool:
+        self._enabled = not self._enabled
+        return self._enabled
+
+    def clear(self) -> None:
+        self._starts = {}
+        self._durations = {}
+        self._counts = {}
+
+    def samples_ms(self, stage: str) -> list[float]:
+        """ Durações guardadas da etapa, em milissegundos, sem ordem definida. """
+        count = min(self._counts.get(stage, 0), self._capacity)
+        durations = self._durations.get(stage)
+        return [durations[i] * 1000.0 for i in range(count)] if durations else []
+
+    def percentiles(self, stage: str, *quantiles: float) -> tuple[float, ...]:
+        """ Percentis (0-100) das durações da etapa em milissegundos; zeros se não houver amostras. """
+        samples = sorted(self.samples_ms(stage))
+        if not samples:
+            return tuple(0.0 for _ in quantiles)
+
+        last = len(samples) - 1
+        return tuple(samples[min(last, int(round(q / 100.0 * last)))] for q in quantiles)
+
+    def chrome_trace(self) -> dict:
+        """ Amostras no formato "Trace Event" do Chrome (chrome://tracing, Perfetto). """
+        events = []
+        for stage, durations in self._durations.items():
+            starts = self._starts[stage]
+            category = stage.split(".", 1)[0]
+
+            for i in range(min(self._counts[stage], self._capacity)):
+                events.append({
+                    "name": stage,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (starts[i] - self._origin) * 1e6,
+                    "dur": durations[i] * 1e6,
+                    "pid": 0,
+                    "tid": 0
+                })
+
+        events.sort(key=lambda event: (event["ts"], -event["dur"]))
+        return { "traceEvents": events, "displayTimeUnit": "ms" }
+
+    def export_chrome_trace(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+
+    @property
+    def stages(self) -> list[str]:
+        return sorted(self._durations)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
@@ -0,0 +1,267 @@
+import zlib
+import struct
+import hashlib
+from typing import Optional
+
+from src.core.input_source import DIRECTION_KEYS, ScriptedInput
+
+REPLAY_MAGIC: bytes = b"PMRP"
+# Versão 2: movimento em ponto fixo; replays da versão 1 não se reproduzem mais.
+REPLAY_FORMAT_VERSION: int = 2
+
+_HEADER = struct.Struct("<4sBQ32s32sHHH")
+
+def compute_file_hash(path: str) -> str:
+    """ Hash SHA-256 do arquivo, ou string vazia se ele não existir. """
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+def pressed_direction(keys) -> int:
+    """
+    Direção que o Pac-Man adotaria com as teclas pressionadas (0 = nenhuma seta).
+    Segue a mesma ordem de `PacMan._update_orientation`: a última seta pressionada vence.
+    """
+    direction = 0
+    for key_direction, key in DIRECTION_KEYS.items():
+        if keys[key]: direction = key_direction
+    return direction
+
+class ReplayLog:
+    """
+    Registro de uma partida: semente do RNG, hashes da configuração e do labirinto,
+    as mudanças de direção da entrada e as leituras do relógio.
+
+    Entradas e leituras são indexadas pela ordem das chamadas (uma por tick), pois o jogo
+    é determinístico dados o relógio, a entrada e a semente.
+    No arquivo, tudo é gravado como deltas em varint e comprimido com zlib.
+    """
+
+    seed: int
+    config_hash: str
+    maze_hash: str
+    width: int
+    height: int
+    fps: int
+    input_events: list[tuple[int, int]]
+    clock_readings: list[int]
+
+    def __init__(self, seed: int, config_hash: str, maze_hash: str, width: int, height: int, fps: int) -> None:
+        self.seed = seed
+        self.config_hash = config_hash
+        self.maze_hash = maze_hash
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.input_events = []
+        self.clock_readings = []
+
+    def encode(self) -> bytes:
+        header = _HEADER.pack(
+            REPLAY_MAGIC, REPLAY_FORMAT_VERSION, self.seed,
+            self._hash_to_bytes(self.config_hash), self._hash_to_bytes(self.maze_hash),
+            self.width, self.height, self.fps
+        )
+
+        body = bytearray()
+        self._write_varint(body, len(self.input_events))
+        previous_call = 0
+        for call_index, direction in self.input_events:
+            self._write_varint(body, call_index - previous_call)
+            body.append(direction)
+            previous_call = call_index
+
+        self._write_varint(body, len(self.clock_readings))
+        previous_reading = 0
+        for reading in self.clock_readings:
+            self._write_varint(body, self._zigzag(reading - previous_reading))
+            previous_reading = reading
+
+        return header + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "ReplayLog":
+        if len(data) < _HEADER.size:
+            raise ValueError('Arquivo de replay truncado.')
+
+        magic, version, seed, config_hash, maze_hash, width, height, fps = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError('Arquivo não é um replay do Pac-Man.')
+        if version != REPLAY_FORMAT_VERSION:
+            raise ValueError(f'Versão de replay não suportada: {version}')
+
+        log = cls(seed, cls._bytes_to_hash(config_hash), cls._bytes_to_hash(maze_hash), width, height, fps)
+
+        try:
+            body = zlib.decompress(data[_HEADER.size:])
+        except zlib.error as e:
+            raise ValueError(f'Replay corrompido: {e}')
+
+        offset = 0
+        event_count, offset = cls._read_varint(body, offset)
+        call_index = 0
+        for _ in range(event_count):
+            call_delta, offset = cls._read_varint(body, offset)
+            call_index += call_delta
+            log.input_events.append((call_index, body[offset]))
+            offset += 1
+
+        reading_count, offset = cls._read_varint(body, offset)
+        reading = 0
+        for _ in range(reading_count):
+            delta, offset = cls._read_varint(body, offset)
+            reading += cls._unzigzag(delta)
+            log.clock_readings.append(reading)
+
+        return log
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path: str) -> "ReplayLog":
+        with open(path, 'rb') as f:
+            return cls.decode(f.read())
+
+    @staticmethod
+    def _hash_to_bytes(hex_hash: str) -> bytes:
+        return bytes.fromhex(hex_hash) if hex_hash else bytes(32)
+
+    @staticmethod
+    def _bytes_to_hash(raw: bytes) -> str:
+        return raw.hex() if any(raw) else ""
+
+    @staticmethod
+    def _zigzag(value: int) -> int:
+        return value * 2 if value >= 0 else -value * 2 - 1
+
+    @staticmethod
+    def _unzigzag(value: int) -> int:
+        return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+    @staticmethod
+    def _write_varint(buffer: bytearray, value: int) -> None:
+        while value >= 0x80:
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    @staticmethod
+    def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+        value, shift = 0, 0
+        while True:
+            if offset >= len(data):
+                raise ValueError('Replay corrompido: varint incompleto.')
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, offset
+            shift += 7
+
+class RecordingInput:
+    """ Repassa a entrada original e registra no log cada mudança da direção efetiva. """
+
+    _source: object
+    _log: ReplayLog
+    _call_index: int
+    _last_direction: int
+
+    def __init__(self, source, log: ReplayLog) -> None:
+        self._source = source
+        self._log = log
+        self._call_index = 0
+        self._last_direction = 0
+
+    def get_pressed(self):
+        keys = self._source.get_pressed()
+
+        direction = pressed_direction(keys)
+        if direction != self._last_direction:
+            self._log.input_events.append((self._call_index, direction))
+            self._last_direction = direction
+
+        self._call_index += 1
+        return keys
+
+class RecordingClock:
+    """ Repassa o relógio original e registra no log cada leitura. """
+
+    _clock: object
+    _log: ReplayLog
+
+    def __init__(self, clock, log: ReplayLog) -> None:
+        self._clock = clock
+        self._log = log
+
+    def get_ticks(self) -> int:
+        reading = self._clock.get_ticks()
+        self._log.clock_readings.append(reading)
+        return reading
+
+    def delay(self, duration_ms: int) -> None:
+        self._clock.delay(duration_ms)
+
+class ReplayInput:
+    """ Reproduz as direções gravadas, na mesma ordem de chamadas da gravação. """
+
+    _pressed: ScriptedInput
+    _events: list[tuple[int, int]]
+    _next_event: int
+    _call_index: int
+
+    def __init__(self, log: ReplayLog) -> None:
+        self._pressed = ScriptedInput()
+        self._events = log.input_events
+        self._next_event = 0
+        self._call_index = 0
+
+    def get_pressed(self) -> dict[int, bool]:
+        while self._next_event < len(self._events) and self._events[self._next_event][0] <= self._call_index:
+            self._pressed.set_direction(self._events[self._next_event][1])
+            self._next_event += 1
+
+        self._call_index += 1
+        return self._pressed.get_pressed()
+
+class ReplayClock:
+    """
+    Devolve as leituras gravadas, sem esperar o tempo real.
+    Ao fim do log, repete a última leitura e marca o relógio como esgotado.
+    """
+
+    _readings: list[int]
+    _index: int
+
+    def __init__(self, log: ReplayLog) -> None:
+        self._readings = log.clock_readings
+        self._index = 0
+
+    def get_ticks(self) -> int:
+        if self._index < len(self._readings):
+            self._index += 1
+        return self._readings[self._index - 1] if self._index else 0
+
+    def delay(self, duration_ms: int) -> None:
+        pass
+
+    @property
+    def remaining(self) -> int:
+        return len(self._readings) - self._index
+
+    @property
+    def exhausted(self) -> bool:
+        return self._index >= len(self._readings)
+
+def create_replay_log(seed: int, config_path: str, maze_path: str, width: int, height: int, fps: int) -> ReplayLog:
+    return ReplayLog(seed, compute_file_hash(config_path), compute_file_hash(maze_path), width, height, fps)
+
+def verify_replay_sources(log: ReplayLog, config_path: str, maze_path: Optional[str] = None) -> None:
+    """ Garante que a configuração e o labirinto atuais são os mesmos da gravação. """
+    if log.config_hash and compute_file_hash(config_path) != log.config_hash:
+        raise ValueError(f'A configuração {config_path} difere da usada na gravação do replay.')
+    if maze_path and log.maze_hash and compute_file_hash(maze_path) != log.maze_hash:
+        raise ValueError(f'O labirinto {maze_path} difere do usado na gravação do replay.')
@@ -0,0 +1,45 @@
+from typing import Iterable, Optional
+
+import pygame
+
+class SoundBank:
+    """
+    Sons decodificados inteiros em memória, uma vez, por caminho. Depois de construído, tocar
+    um som nunca lê o disco.
+    """
+
+    _sounds: dict[str, pygame.mixer.Sound]
+
+    def __init__(self, paths: Iterable[str], preloaded: Optional[dict[str, pygame.mixer.Sound]] = None) -> None:
+        """
+        :param paths: Arquivos de som; os que falharem são avisados aqui e ficam de fora.
+        :param preloaded: Sons já decodificados (ex.: pelo `AssetPipeline`), por caminho.
+        """
+        self._sounds = {}
+        preloaded = preloaded or {}
+
+        if pygame.mixer.get_init() is None:
+            return
+
+        for path in paths:
+            if not path or path in self._sounds:
+                continue
+
+            sound = preloaded.get(path)
+            if sound is None:
+                try:
+                    sound = pygame.mixer.Sound(path)
+                except (OSError, pygame.error) as e:
+                    print(f"Erro ao carregar '{path}': {e}")
+                    continue
+
+            self._sounds[path] = sound
+
+    def get(self, path: str) -> Optional[pygame.mixer.Sound]:
+        return self._sounds.get(path)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._sounds
+
+    def __len__(self) -> int:
+        return len(self._sounds)
@@ -0,0 +1,28 @@
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from src.core.states import GameState, GhostState
+
+if TYPE_CHECKING:
+    from src.entities.pacman import PacMan
+    from src.entities.ghost import Ghost
+
+class TickContext(NamedTuple):
+    """
+    Estado do mundo compartilhado pelas entidades em um tick, montado uma vez pelo
+    `GameManager` logo depois da atualização do Pac-Man (que é quem muda o estado do jogo,
+    as pastilhas e as vidas). Os valores derivados (tile do Pac-Man, modo global dos
+    fantasmas) são calculados uma vez, e não por fantasma.
+
+    O Blinky vai como referência, não como tile: o Inky usa a posição dele depois de ele
+    andar no mesmo tick, como o `BatchEngine` e os replays gravados esperam.
+    """
+
+    game_state: GameState
+    ghost_mode: GhostState
+    current_time_ms: int
+    pacman: Optional["PacMan"]
+    pacman_tile: tuple[int, int]
+    pacman_orientation: int
+    pacman_points: int
+    ghosts: tuple["Ghost", ...]
+    blinky: Optional["Ghost"]
@@ -10,16 +10,18 @@ if TYPE_CHECKING:
 
 class Blinky(Ghost):
 
-    def __init__(self, x: float, y: float, manager: "GameManager", config: dict, assets: dict):
-        super().__init__(x, y, manager, config, assets)
+    __slots__ = ()
+
+    def __init__(self, x: float, y: float, manager: "GameManager", config: dict):
+        super().__init__(x, y, manager, config)
 
         self._start_mode = GhostState.SCATTER
         self._current_mode = GhostState.SCATTER
         
         self._release_ghost_from_house()
 
-    def _compute_target_tile(self, pacman, all_ghosts) -> tuple[int, int]:
-        return pacman._get_grid_coordinates()
+    def _compute_target_tile(self, context) -> tuple[int, int]:
+        return context.pacman_tile
     
-    def _should_exit_house(self, pacman, all_ghosts) -> bool:
+    def _should_exit_house(self, context) -> bool:
         return True
\ No newline at end of file
@@ -11,14 +11,16 @@ class Clyde(Ghost):
     _points_required_to_exit: int
     _distance_threshold_squared: int
     
-    def __init__(self, x: float, y: float, manager: "GameManager", config: dict, assets: dict):
-        super().__init__(x, y, manager, config, assets)
+    __slots__ = ("_points_required_to_exit", "_distance_threshold_squared")
+
+    def __init__(self, x: float, y: float, manager: "GameManager", config: dict):
+        super().__init__(x, y, manager, config)
 
         self._points_required_to_exit = config.get("points_to_exit", 60)
         self._distance_threshold_squared = config.get("distance_threshold_squared", 64)
 
-    def _compute_target_tile(self, pacman, all_ghosts) -> tuple[int, int]:
-        prow, pcol = pacman._get_grid_coordinates()
+    def _compute_target_tile(self, context) -> tuple[int, int]:
+        prow, pcol = context.pacman_tile
         grow, gcol = self._get_grid_coordinates()
 
         distance_sq = (prow - grow) ** 2 + (pcol - gcol) ** 2
@@ -28,5 +30,5 @@ class Clyde(Ghost):
         else: 
             return self._scatter_target_tile
 
-    def _should_exit_house(self, pacman, all_ghosts) -> bool:
-        return pacman.total_points >= self._points_required_to_exit
\ No newline at end of file
+    def _should_exit_house(self, context) -> bool:
+        return context.pacman_points >= self._points_required_to_exit
\ No newline at end of file
@@ -1,84 +1,166 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import pygame
 
+from src.world import fixed_point
+from src.world.fixed_point import UNITS_PER_TILE
+
 if TYPE_CHECKING:
     from src.core.game_manager import GameManager
+    from src.core.tick_context import TickContext
 
 class Entity(ABC):
-    """ Classe abstrata base para as entidades do jogo. """
+    """
+    Classe abstrata base para as entidades do jogo.
+    Guarda apenas o estado da simulação; os sprites ficam com o `GameRenderer`.
+
+    A posição é inteira, em unidades de `src.world.fixed_point`; `position` a converte para
+    pixels da tela atual. A posição do tick anterior (`store_previous_position`) permite
+    desenhar a entidade entre dois ticks (`interpolated_position`).
+    """
 
-    _start_position: pygame.Vector2
-    _position: pygame.Vector2
+    _start_tile: tuple[int, int]
+    _x: int
+    _y: int
+    _previous_x: int
+    _previous_y: int
     _manager: "GameManager"
-    
-    _teleport_x_limits: tuple[int, int] 
+
+    _teleport_x_limits: tuple[int, int]
     _teleport_x_wrap: tuple[int, int]
     _collision_rect_size: int
-    
+    _collision_size: int
+
+    __slots__ = (
+        "_start_tile", "_x", "_y", "_previous_x", "_previous_y", "_manager", "_teleport_x_limits", "_teleport_x_wrap",
+        "_collision_rect_size", "_collision_size"
+    )
+
     def __init__(self, x: float, y: float, manager: "GameManager", config: dict) -> None:
-        self._start_position = pygame.Vector2(x, y)
-        self._position = pygame.Vector2(x, y)
+        """
+        :param x, y: Posição inicial em pixels; a entidade começa no centro do tile que a contém.
+        """
         self._manager = manager
+        self._start_tile = (int(y // manager.cell_height), int(x // manager.cell_width))
+        self._place_at_tile(*self._start_tile)
+        self.store_previous_position()
+
+        to_units = fixed_point.reference_pixels_to_units
+        self._teleport_x_limits = (to_units(config.get("min_x", 0)), to_units(config.get("max_x", 0)))
+        self._teleport_x_wrap = (to_units(config.get("wrap_x_min", 0)), to_units(config.get("wrap_x_max", 0)))
 
-        self._teleport_x_limits = (config.get("min_x", 0), config.get("max_x", 0))
-        self._teleport_x_wrap = (config.get("wrap_x_min", 0), config.get("wrap_x_max", 0))
-        
         self._collision_rect_size = config.get("collision_rect_size", 32)
+        self._collision_size = to_units(self._collision_rect_size)
 
     @abstractmethod
-    def update(self, delta_time: float) -> None:
-        """ Atualiza o estado da entidade. """
-        pass
-    
-    @abstractmethod
-    def draw(self, screen: pygame.Surface) -> None:
-        """ 
-        A Entidade desenha a si mesma na superfície fornecida.
+    def update(self, delta_time: float, context: Optional["TickContext"] = None) -> None:
+        """
+        Atualiza o estado da entidade.
+
+        :param context: Estado do mundo no tick, montado uma vez pelo `GameManager` (o Pac-Man,
+            que atualiza primeiro, não o recebe).
         """
         pass
-    
+
     def reset(self) -> None:
         """ Reseta a entidade. """
-        self._position = self._start_position.copy() 
+        self._place_at_tile(*self._start_tile)
 
-    @property
-    def rect(self) -> pygame.Rect:
-        """ 
-        Retorna o retângulo de colisão baseado na posição atual. 
-        Centraliza o rect na posição (x, y).
-        """
-        rect = pygame.Rect(0, 0, self._collision_rect_size, self._collision_rect_size)
-        rect.center = (int(self._position.x), int(self._position.y))
-        return rect
+    def store_previous_position(self) -> None:
+        """ Guarda a posição atual como a do tick anterior; chamado antes de cada tick. """
+        self._previous_x, self._previous_y = self._x, self._y
+
+    def collides_with(self, other: "Entity") -> bool:
+        """ Sobreposição dos quadrados de colisão, centrados nas posições fixas. """
+        reach = self._collision_size + other._collision_size
+        return 2 * abs(self._x - other._x) < reach and 2 * abs(self._y - other._y) < reach
+
+    def _place_at_tile(self, row: int, col: int) -> None:
+        self._x, self._y = fixed_point.tile_center(row, col)
+
+    def _is_at_tile_center(self) -> bool:
+        return self._x % UNITS_PER_TILE == fixed_point.HALF_TILE and self._y % UNITS_PER_TILE == fixed_point.HALF_TILE
+
+    def _move(self, orientation: int, speed: int) -> None:
+        """ Anda na direção, parando no centro do próximo tile se ele estiver a menos de `speed`. """
+        if   orientation == 1: self._y = fixed_point.advance(self._y, -speed)
+        elif orientation == 2: self._y = fixed_point.advance(self._y, speed)
+        elif orientation == 3: self._x = fixed_point.advance(self._x, -speed)
+        elif orientation == 4: self._x = fixed_point.advance(self._x, speed)
 
     def _handle_teleport(self) -> None:
         """ Lida com o teleporte da entidade (túnel). """
         min_x, max_x = self._teleport_x_limits
         wrap_min, wrap_max = self._teleport_x_wrap
 
-        if self._position.x <= min_x: 
-            self._position.x = wrap_min
-        elif self._position.x >= max_x: 
-            self._position.x = wrap_max
+        if self._x <= min_x:
+            self._x = wrap_min
+        elif self._x >= max_x:
+            self._x = wrap_max
+
+    def _get_grid_coordinates(self) -> tuple[int, int]:
+        return self._y // UNITS_PER_TILE, self._x // UNITS_PER_TILE
 
     @property
     def position(self) -> pygame.Vector2:
-        return self._position
-    
+        """ Posição em pixels da tela (uma cópia; alterá-la não move a entidade). """
+        return pygame.Vector2(
+            fixed_point.units_to_pixels(self._x, self._manager.cell_width),
+            fixed_point.units_to_pixels(self._y, self._manager.cell_height)
+        )
+
+    def interpolated_position(self, alpha: float) -> pygame.Vector2:
+        """
+        Posição em pixels entre a do tick anterior (`alpha` = 0) e a atual (`alpha` = 1).
+        Saltos de um tile ou mais (túnel, reinício) não são interpolados.
+        """
+        x, y = self._x, self._y
+        dx, dy = x - self._previous_x, y - self._previous_y
+
+        if alpha < 1.0 and abs(dx) < UNITS_PER_TILE and abs(dy) < UNITS_PER_TILE:
+            x -= dx * (1.0 - alpha)
+            y -= dy * (1.0 - alpha)
+
+        return pygame.Vector2(
+            fixed_point.units_to_pixels(x, self._manager.cell_width),
+            fixed_point.units_to_pixels(y, self._manager.cell_height)
+        )
+
     @position.setter
     def position(self, new_position: pygame.Vector2) -> None:
-        self._position = new_position
+        self._x = fixed_point.pixels_to_units(new_position.x, self._manager.cell_width)
+        self._y = fixed_point.pixels_to_units(new_position.y, self._manager.cell_height)
+
+    @property
+    def tile(self) -> tuple[int, int]:
+        """ Tile (linha, coluna) que contém a posição. """
+        return self._y // UNITS_PER_TILE, self._x // UNITS_PER_TILE
+
+    @property
+    def fixed_position(self) -> tuple[int, int]:
+        """ Posição (x, y) em unidades fixas. """
+        return self._x, self._y
+
+    @property
+    def collision_size(self) -> int:
+        """ Lado do quadrado de colisão, em unidades fixas. """
+        return self._collision_size
 
     @property
     def rect(self) -> pygame.Rect:
-        """ Retorna o retângulo de colisão. """
+        """ Retângulo de colisão em pixels, centrado na posição (para desenho e depuração). """
+        position = self.position
         rect = pygame.Rect(0, 0, self._collision_rect_size, self._collision_rect_size)
-        rect.center = (int(self._position.x), int(self._position.y))
+        rect.center = (int(position.x), int(position.y))
         return rect
-        
+
     @property
     def start_position(self) -> pygame.Vector2:
-        """ Posição inicial (spawn). """
-        return self._start_position
\ No newline at end of file
+        """ Posição inicial (spawn), em pixels. """
+        row, col = self._start_tile
+        x, y = fixed_point.tile_center(row, col)
+        return pygame.Vector2(
+            fixed_point.units_to_pixels(x, self._manager.cell_width),
+            fixed_point.units_to_pixels(y, self._manager.cell_height)
+        )
@@ -1,15 +1,13 @@
-import random
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Optional
 
-import pygame
-
 from src.entities.entity import Entity
+from src.world import fixed_point
 from src.core.states import GhostState, GameState 
 
 if TYPE_CHECKING:
     from src.core.game_manager import GameManager
-    from src.entities.pacman import PacMan
+    from src.core.tick_context import TickContext
 
 class Ghost(Entity):
     """ Classe base abstrata para todos os fantasmas. """
@@ -17,13 +15,11 @@ class Ghost(Entity):
     _house_respawn_time_ms: int
     _normal_speed: int
     _eaten_speed: int
+    _vulnerable_speed: int
     _scatter_target_tile: tuple[int, int]
     _house_exit_position: tuple[int, int]
     _house_door_position: tuple[int, int]
     _house_wait_position: tuple[int, int]
-    _directional_sprites: dict[int, pygame.Surface]
-    _vulnerable_sprites: list[pygame.Surface]
-    _eaten_sprites: list[pygame.Surface]
     _current_speed: int
     _current_orientation: int
     _start_mode: GhostState
@@ -35,27 +31,44 @@ class Ghost(Entity):
     _vulnerable_animation_timer_ms: float
     _vulnerable_animation_speed_ms: float
     _vulnerable_animation_frame_index: int
+    _routing_mode: str
+    _route_chase: bool
+
+    __slots__ = (
+        "_house_respawn_time_ms", "_normal_speed", "_eaten_speed", "_vulnerable_speed", "_scatter_target_tile",
+        "_house_exit_position", "_house_door_position", "_house_wait_position", "_current_speed", "_current_orientation",
+        "_start_mode", "_current_mode", "_previous_mode", "_last_game_state", "_is_immune", "_exit_timer_ms",
+        "_vulnerable_animation_timer_ms", "_vulnerable_animation_speed_ms", "_vulnerable_animation_frame_index",
+        "_routing_mode", "_route_chase"
+    )
     
+    VULNERABLE_ANIMATION_FRAMES: int = 2
     OPPOSITE_ORIENTATION: dict = { 1: 2, 2: 1, 3: 4, 4: 3, 0: 0 }
+    ROUTING_MODES: tuple = ("greedy", "shortest_path")
 
-    def __init__(self, x: float, y: float, manager: "GameManager", config: dict, assets: dict):
+    def __init__(self, x: float, y: float, manager: "GameManager", config: dict):
         super().__init__(x, y, manager, config)
 
         self._house_respawn_time_ms = config.get("spawn_time", 1)
         self._scatter_target_tile = config.get("scatter_target", (0, 0))
 
         speed_config: dict = config.get("speed", {})
-        self._normal_speed = speed_config.get("normal", 1)
-        self._eaten_speed = speed_config.get("eaten", 1)
+        normal_speed = speed_config.get("normal", 1)
+        self._normal_speed = fixed_point.reference_pixels_to_units(normal_speed)
+        self._vulnerable_speed = fixed_point.reference_pixels_to_units(normal_speed * 0.75)
+        self._eaten_speed = fixed_point.reference_pixels_to_units(speed_config.get("eaten", 1))
 
         positions_config: dict = config.get("positions", {})
         self._house_exit_position = positions_config.get("house_exit", (0, 0))
         self._house_door_position = positions_config.get("house_door", (0, 0))
         self._house_wait_position = positions_config.get("house_wait", (0, 0))
 
-        self._directional_sprites = assets.get("directional")
-        self._vulnerable_sprites = assets.get("vulnerable")
-        self._eaten_sprites = assets.get("eaten")
+        routing_config: dict = config.get("routing", {})
+        self._routing_mode = routing_config.get("mode", "greedy")
+        self._route_chase = routing_config.get("chase", False)
+
+        if self._routing_mode not in self.ROUTING_MODES:
+            raise ValueError(f'Modo de rota inválido: {self._routing_mode}')
 
         self._current_speed = self._normal_speed 
         self._current_orientation = 4 
@@ -71,40 +84,27 @@ class Ghost(Entity):
         self._vulnerable_animation_frame_index = 0
         self._vulnerable_animation_speed_ms = 0.15 
 
-    def update(self, delta_time: float) -> None:
-        if self._manager.game_state == GameState.GAME_OVER: 
-            return
+    def update(self, delta_time: float, context: Optional["TickContext"] = None) -> None:
+        if context is None:
+            context = self._manager.tick_context()
 
-        pacman = self._get_pacman()
-        if not pacman: return 
+        if context.game_state == GameState.GAME_OVER: 
+            return
 
-        all_ghosts = [e for e in self._manager.entities if isinstance(e, Ghost)]
+        if not context.pacman: return 
         
-        self._synchronize_immunity_with_game_state()
+        self._synchronize_immunity_with_game_state(context.game_state)
         
         self._previous_mode = self._current_mode
-        self._update_ghost_behavior_state(pacman, all_ghosts)
+        self._update_ghost_behavior_state(context)
         self._handle_direction_reversal_on_state_change()
 
         self._update_animation_frames(delta_time)
 
         if self._current_mode != GhostState.IN_HOUSE:
-            self._process_movement_physics(pacman, all_ghosts)
-
-    def draw(self, screen: pygame.Surface):
-        x_position, y_position = int(self.position.x), int(self.position.y)
-        current_sprite = None
-
-        if self._current_mode == GhostState.VULNERABLE:
-            current_sprite = self._vulnerable_sprites[self._vulnerable_animation_frame_index]
-        elif self._current_mode == GhostState.EATEN:
-            current_sprite = self._eaten_sprites.get(self._current_orientation)
-        else:
-            current_sprite = self._directional_sprites.get(self._current_orientation)
+            self._process_movement_physics(context)
 
-        if current_sprite: 
-            rectangle = current_sprite.get_rect(center=(x_position, y_position))
-            screen.blit(current_sprite, rectangle)
+        self._manager.spatial_hash.update(self)
 
     def set_eaten(self):
         self._current_mode = GhostState.EATEN
@@ -122,22 +122,22 @@ class Ghost(Entity):
         if self._current_mode == GhostState.SCATTER:
             self._release_ghost_from_house()
 
-    def _synchronize_immunity_with_game_state(self):
+        self._manager.spatial_hash.update(self)
+
+    def _synchronize_immunity_with_game_state(self, current_game_state: GameState):
         """ Garante que se o fantasma já foi comido, ele não fique vulnerável de novo na mesma pílula. """
-        current_game_state = self._manager.game_state
-        
         if (current_game_state == GameState.VULNERABLE and 
             self._last_game_state != GameState.VULNERABLE):
             self._is_immune = False
             
         self._last_game_state = current_game_state
 
-    def _update_ghost_behavior_state(self, pacman, all_ghosts):
-        game_mode = self._manager.game_state
+    def _update_ghost_behavior_state(self, context: "TickContext"):
+        game_mode = context.game_state
 
         if self._current_mode == GhostState.IN_HOUSE:
-            if self._should_exit_house(pacman, all_ghosts):
-                self._release_ghost_from_house()
+            if self._should_exit_house(context):
+                self._release_ghost_from_house(context.ghost_mode)
             return 
 
         if self._current_mode == GhostState.EATEN:
@@ -145,7 +145,7 @@ class Ghost(Entity):
             door_row, door_column = self._house_door_position
 
             if abs(current_row - door_row) < 1 and abs(current_column - door_column) < 1:
-                self._enter_house_to_respawn()
+                self._enter_house_to_respawn(context.current_time_ms)
 
             return
 
@@ -155,29 +155,27 @@ class Ghost(Entity):
                 if self._current_mode != GhostState.EATEN and not self._is_immune:
                     self._current_mode = GhostState.VULNERABLE
                 elif self._is_immune:
-                     self._current_mode = self._manager.get_global_ghost_mode()
+                     self._current_mode = context.ghost_mode
             
             else:
-                 self._current_mode = self._manager.get_global_ghost_mode()
+                 self._current_mode = context.ghost_mode
 
-    def _process_movement_physics(self, pacman, all_ghosts):
-        if self._align_to_grid_center():
+    def _process_movement_physics(self, context: "TickContext"):
+        if self._is_at_tile_center():
             is_dead_end = not self._is_move_valid(self._current_orientation)
             is_intersection = self._is_intersection()
 
             if is_dead_end or is_intersection:
-                self._current_orientation = self._calculate_best_direction(pacman, all_ghosts)
+                self._current_orientation = self._calculate_best_direction(context)
 
         self._apply_velocity()
         self._handle_teleport()
 
-    def _calculate_best_direction(self, pacman, all_ghosts):
+    def _calculate_best_direction(self, context: "TickContext"):
         current_row, current_column = self._get_grid_coordinates()
-        valid_choices = []
-
-        for direction in (1, 2, 3, 4):
-            if self._is_move_valid(direction) and direction != self.OPPOSITE_ORIENTATION[self._current_orientation]:
-                valid_choices.append(direction)
+        valid_choices = self._manager.maze.forward_exits(
+            current_row, current_column, self._current_orientation, self._current_mode == GhostState.EATEN
+        )
         
         if not valid_choices:
             if self._is_move_valid(self.OPPOSITE_ORIENTATION[self._current_orientation]):
@@ -185,18 +183,23 @@ class Ghost(Entity):
             return 0 
 
         if self._current_mode == GhostState.VULNERABLE:
-            return random.choice(valid_choices)
+            return self._manager.rng.choice(valid_choices)
 
         target_tile = None
         if self._current_mode == GhostState.CHASE:
-            target_tile = self._compute_target_tile(pacman, all_ghosts)
+            target_tile = self._compute_target_tile(context)
         elif self._current_mode == GhostState.SCATTER:
             target_tile = self._scatter_target_tile
         elif self._current_mode == GhostState.EATEN:
             target_tile = self._house_door_position
 
         if target_tile is None: 
-            return random.choice(valid_choices)
+            return self._manager.rng.choice(valid_choices)
+
+        if self._uses_path_routing():
+            path_direction = self._choose_direction_by_path((current_row, current_column), valid_choices, target_tile)
+            if path_direction:
+                return path_direction
 
         target_row, target_column = target_tile
         column_offset = {1: 0, 2: 0, 3: -1, 4: 1, 0: 0}
@@ -209,50 +212,47 @@ class Ghost(Entity):
 
         return min(valid_choices, key=distance_squared)
 
-    def _get_pacman(self) -> Optional["PacMan"]:
-        from src.entities.pacman import PacMan
-        for entity in self._manager.entities:
-            if isinstance(entity, PacMan):
-                return entity
-        return None
+    def _uses_path_routing(self) -> bool:
+        """ No modo "shortest_path", os olhos sempre voltam pelo caminho real; a perseguição, se configurada. """
+        if self._routing_mode != "shortest_path":
+            return False
+        return self._current_mode == GhostState.EATEN or (self._route_chase and self._current_mode == GhostState.CHASE)
 
-    def _is_move_valid(self, direction) -> bool:
-        if direction == 0: return True
-        
-        row, col = self._get_grid_coordinates()
-        
-        if direction == 1:   row -= 1 
-        elif direction == 2: row += 1 
-        elif direction == 3: col -= 1 
-        elif direction == 4: col += 1 
+    def _choose_direction_by_path(self, tile: tuple[int, int], valid_choices: tuple[int, ...], target_tile) -> int:
+        """ 
+        Escolhe a saída que mais aproxima do alvo pela tabela de caminhos.
+        Retorna 0 se o alvo for inalcançável (parede ou fora do labirinto).
+        """
+        path_table = self._manager.path_table(allow_door = self._current_mode == GhostState.EATEN)
+        target_tile = tuple(target_tile)
 
-        maze = self._manager.maze
-        
-        if row < 0 or col < 0 or row >= maze.rows or col >= maze.cols:
-            return False
+        next_direction = path_table.next_direction(tile, target_tile)
+        if next_direction in valid_choices:
+            return next_direction
 
-        if self._current_mode == GhostState.EATEN and maze.maze_layout[row][col] == 9:
-            return True
+        best_direction, best_distance = 0, None
+        for direction in valid_choices:
+            neighbor = path_table.neighbor(tile, direction)
+            distance = path_table.distance(neighbor, target_tile) if neighbor else None
 
-        return maze.matrix[row][col] != -1
+            if distance is not None and (best_distance is None or distance < best_distance):
+                best_direction, best_distance = direction, distance
+
+        return best_direction
+
+    def _is_move_valid(self, direction) -> bool:
+        row, col = self._get_grid_coordinates()
+        return self._manager.maze.can_move(row, col, direction, self._current_mode == GhostState.EATEN)
 
-    def _get_grid_coordinates(self):
-        row = int(self.position.y // self._manager.cell_height)
-        col = int(self.position.x // self._manager.cell_width)
-        return row, col
-        
     def _apply_velocity(self):
         if self._current_mode == GhostState.EATEN:
             self._current_speed = self._eaten_speed
         elif self._current_mode == GhostState.VULNERABLE:
-            self._current_speed = self._normal_speed * 0.75
+            self._current_speed = self._vulnerable_speed
         else:
             self._current_speed = self._normal_speed
 
-        if self._current_orientation == 1: self.position.y -= self._current_speed
-        elif self._current_orientation == 2: self.position.y += self._current_speed
-        elif self._current_orientation == 3: self.position.x -= self._current_speed
-        elif self._current_orientation == 4: self.position.x += self._current_speed
+        self._move(self._current_orientation, self._current_speed)
 
     def _handle_direction_reversal_on_state_change(self):
         if self._current_mode != self._previous_mode:
@@ -264,61 +264,37 @@ class Ghost(Entity):
             if (is_becoming_vulnerable or was_vulnerable) and valid_previous_state:
                 self._current_orientation = self.OPPOSITE_ORIENTATION[self._current_orientation]
 
-    def _align_to_grid_center(self):
-        current_row, current_column = self._get_grid_coordinates()
-        cell_width, cell_height = self._manager.cell_width, self._manager.cell_height
-        
-        center_x = current_column * cell_width + cell_width / 2
-        center_y = current_row * cell_height + cell_height / 2
-
-        if abs(self.position.x - center_x) < self._current_speed and abs(self.position.y - center_y) < self._current_speed:
-            self.position.x = center_x
-            self.position.y = center_y
-            return True
-        return False
-        
     def _is_intersection(self) -> bool:
-        valid_directions_count = 0
-        for direction in (1, 2, 3, 4):
-            if direction != self.OPPOSITE_ORIENTATION[self._current_orientation] and self._is_move_valid(direction):
-                valid_directions_count += 1
-        return valid_directions_count > 1
-
-    def _release_ghost_from_house(self):
-        cell_width = self._manager.cell_width
-        cell_height = self._manager.cell_height
-        row, col = self._house_exit_position
-        
-        self.position = pygame.Vector2(x = col * cell_width + cell_width // 2, y = row * cell_height + cell_height // 2)
-        self._current_mode = self._manager.get_global_ghost_mode()
+        row, col = self._get_grid_coordinates()
+        return self._manager.maze.is_intersection(row, col, self._current_orientation, self._current_mode == GhostState.EATEN)
+
+    def _release_ghost_from_house(self, ghost_mode: Optional[GhostState] = None):
+        """ :param ghost_mode: Modo global dos fantasmas (lido do `GameManager` se não informado). """
+        self._place_at_tile(*self._house_exit_position)
+        self._current_mode = ghost_mode if ghost_mode is not None else self._manager.get_global_ghost_mode()
         self._current_orientation = 1 
         self._exit_timer_ms = 0
 
-    def _enter_house_to_respawn(self):
+    def _enter_house_to_respawn(self, current_time_ms: int):
         self._current_mode = GhostState.IN_HOUSE
         self._current_speed = self._normal_speed
-
-        cell_width = self._manager.cell_width
-        cell_height = self._manager.cell_height
-        row, col = self._house_wait_position
-
-        self.position = pygame.Vector2(x = col * cell_width + cell_width / 2, y = row * cell_height + cell_height / 2)
-        self._exit_timer_ms = pygame.time.get_ticks() + self._house_respawn_time_ms
+        self._place_at_tile(*self._house_wait_position)
+        self._exit_timer_ms = current_time_ms + self._house_respawn_time_ms
 
     def _update_animation_frames(self, delta_time):
         if self._current_mode == GhostState.VULNERABLE:
             self._vulnerable_animation_timer_ms += delta_time
             if self._vulnerable_animation_timer_ms >= self._vulnerable_animation_speed_ms:
                 self._vulnerable_animation_timer_ms -= self._vulnerable_animation_speed_ms
-                self._vulnerable_animation_frame_index = (self._vulnerable_animation_frame_index + 1) % len(self._vulnerable_sprites)
+                self._vulnerable_animation_frame_index = (self._vulnerable_animation_frame_index + 1) % self.VULNERABLE_ANIMATION_FRAMES
 
     @abstractmethod
-    def _compute_target_tile(self, pacman, all_ghosts) -> tuple[int, int]:
+    def _compute_target_tile(self, context: "TickContext") -> tuple[int, int]:
         """ Define para qual quadrado o fantasma quer ir no modo CHASE. """
         pass
     
     @abstractmethod
-    def _should_exit_house(self, pacman, all_ghosts) -> bool:
+    def _should_exit_house(self, context: "TickContext") -> bool:
         """ Define a regra para sair da casa. """
         pass
 
@@ -334,8 +310,14 @@ class Ghost(Entity):
     def orientation(self) -> int:
         return self._current_orientation
 
+    @property
+    def vulnerable_frame(self) -> int:
+        """ Quadro atual da animação de vulnerabilidade. """
+        return self._vulnerable_animation_frame_index
+
     @property
     def speed(self) -> int:
+        """ Velocidade atual, em unidades fixas por tick. """
         return self._current_speed
 
     @property
@@ -2,7 +2,6 @@ from typing import TYPE_CHECKING
 
 import pygame
 
-from src.entities.blinky import Blinky
 from src.entities.ghost import Ghost
 
 if TYPE_CHECKING:
@@ -13,30 +12,34 @@ class Inky(Ghost):
     _chase_offset: int
     _points_required_to_exit: int
     
-    def __init__(self, x: float, y: float, manager: "GameManager", config: dict, assets: dict):
-        super().__init__(x, y, manager, config, assets)
+    __slots__ = ("_chase_offset", "_points_required_to_exit")
+
+    def __init__(self, x: float, y: float, manager: "GameManager", config: dict):
+        super().__init__(x, y, manager, config)
 
         self._chase_offset = config.get("chase_offset", 2)
         self._points_required_to_exit = config.get("points_to_exit", 30)
 
-    def _compute_target_tile(self, pacman, all_ghosts) -> tuple[int, int]:
-        blinky = next((g for g in all_ghosts if isinstance(g, Blinky)), None)
+    def _compute_target_tile(self, context) -> tuple[int, int]:
+        blinky = context.blinky
         
         if not blinky:
-            return pacman._get_grid_coordinates()
+            return context.pacman_tile
         
-        brow, bcol = blinky._get_grid_coordinates()
-        prow, pcol = pacman._get_grid_coordinates()
+        # O tile do Blinky é lido agora: ele já andou neste tick.
+        brow, bcol = blinky.tile
+        prow, pcol = context.pacman_tile
+        orientation = context.pacman_orientation
         
-        if   pacman._current_orientation == 1: prow -= self._chase_offset
-        elif pacman._current_orientation == 2: prow += self._chase_offset
-        elif pacman._current_orientation == 3: pcol -= self._chase_offset
-        elif pacman._current_orientation == 4: pcol += self._chase_offset
+        if   orientation == 1: prow -= self._chase_offset
+        elif orientation == 2: prow += self._chase_offset
+        elif orientation == 3: pcol -= self._chase_offset
+        elif orientation == 4: pcol += self._chase_offset
 
         target_row = 2 * prow - brow
         target_col = 2 * pcol - bcol
         
         return (target_row, target_col)
     
-    def _should_exit_house(self, pacman, all_ghosts) -> bool:
-        return pacman.total_points >= self._points_required_to_exit
\ No newline at end of file
+    def _should_exit_house(self, context) -> bool:
+        return context.pacman_points >= self._points_required_to_exit
\ No newline at end of file
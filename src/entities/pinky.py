@@ -12,22 +12,25 @@ class Pinky(Ghost):
     _chase_offset: int
     _initial_exit_delay_ms: int
 
-    def __init__(self, x: float, y: float, manager: "GameManager", config: dict, assets: dict):
-        super().__init__(x, y, manager, config, assets)
+    __slots__ = ("_chase_offset", "_initial_exit_delay_ms")
+
+    def __init__(self, x: float, y: float, manager: "GameManager", config: dict):
+        super().__init__(x, y, manager, config)
 
         self._initial_exit_delay_ms = config.get("initial_exit_delay", 0)
         self._chase_offset = config.get("chase_offset", 4)
-        self._exit_timer_ms = pygame.time.get_ticks() + self._initial_exit_delay_ms
+        self._exit_timer_ms = manager.current_time_ms + self._initial_exit_delay_ms
 
-    def _compute_target_tile(self, pacman, all_ghosts) -> tuple[int, int]:
-        prow, pcol = pacman._get_grid_coordinates()
+    def _compute_target_tile(self, context) -> tuple[int, int]:
+        prow, pcol = context.pacman_tile
+        orientation = context.pacman_orientation
         
-        if   pacman._current_orientation == 1: prow -= self._chase_offset
-        elif pacman._current_orientation == 2: prow += self._chase_offset
-        elif pacman._current_orientation == 3: pcol -= self._chase_offset
-        elif pacman._current_orientation == 4: pcol += self._chase_offset
+        if   orientation == 1: prow -= self._chase_offset
+        elif orientation == 2: prow += self._chase_offset
+        elif orientation == 3: pcol -= self._chase_offset
+        elif orientation == 4: pcol += self._chase_offset
 
         return (prow, pcol)
     
-    def _should_exit_house(self, pacman, all_ghosts) -> bool:
-        return pygame.time.get_ticks() >= self._exit_timer_ms
\ No newline at end of file
+    def _should_exit_house(self, context) -> bool:
+        return context.current_time_ms >= self._exit_timer_ms
\ No newline at end of file
@@ -0,0 +1,167 @@
+import sys
+import asyncio
+import argparse
+from typing import Optional
+
+import numpy as np
+import pygame
+
+from src.core.states import GameState
+from src.net.spectator_protocol import (
+    MESSAGE_HELLO, MESSAGE_KEYFRAME, MESSAGE_SNAPSHOT, RemoteMaze, SpectatorSnapshot,
+    decode_hello, decode_keyframe, decode_snapshot, encode_ack, read_message
+)
+from src.ui.observation_renderer import ObservationRenderer
+
+class SpectatorClient:
+    """
+    Cliente de um `SpectatorServer`: confirma cada keyframe recebido e reconstrói a grade de
+    pastilhas de cada snapshot a partir do keyframe base e do delta.
+    """
+
+    _reader: Optional[asyncio.StreamReader]
+    _writer: Optional[asyncio.StreamWriter]
+    _maze: Optional[RemoteMaze]
+    _keyframes: dict[int, np.ndarray]
+    _pellets: Optional[np.ndarray]
+    _bytes_received: int
+
+    def __init__(self) -> None:
+        self._reader = None
+        self._writer = None
+        self._maze = None
+        self._keyframes = {}
+        self._pellets = None
+        self._bytes_received = 0
+
+    async def connect(self, host: str, port: int) -> RemoteMaze:
+        """ Conecta e lê o HELLO com o labirinto. """
+        self._reader, self._writer = await asyncio.open_connection(host, port)
+
+        message_type, body = await self._read()
+        if message_type != MESSAGE_HELLO:
+            raise ValueError('O servidor não começou a conversa com HELLO.')
+
+        self._maze = decode_hello(body)
+        self._pellets = np.zeros((self._maze.rows, self._maze.cols), dtype=np.int8)
+        return self._maze
+
+    async def receive(self) -> SpectatorSnapshot:
+        """
+        Espera o próximo snapshot. A grade dele (`pellets`) é um array do cliente reaproveitado
+        a cada chamada.
+        """
+        while True:
+            message_type, body = await self._read()
+
+            if message_type == MESSAGE_KEYFRAME:
+                keyframe_id, pellets = decode_keyframe(body, self._pellets.shape)
+                self._keyframes[keyframe_id] = pellets
+                self._writer.write(encode_ack(keyframe_id))
+
+            elif message_type == MESSAGE_SNAPSHOT:
+                snapshot, base_id, cells = decode_snapshot(body)
+                base = self._keyframes.get(base_id)
+                if base is None:
+                    raise ValueError(f'Snapshot relativo a um keyframe desconhecido: {base_id}')
+
+                # Keyframes mais antigos que a base nunca mais serão usados pelo servidor.
+                for keyframe_id in [k for k in self._keyframes if k < base_id]:
+                    del self._keyframes[keyframe_id]
+
+                np.copyto(self._pellets, base)
+                self._pellets.ravel()[cells["index"]] = cells["value"]
+                snapshot.pellets = self._pellets
+                return snapshot
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def _read(self) -> tuple[int, bytes]:
+        message_type, body = await read_message(self._reader)
+        self._bytes_received += 5 + len(body)
+        return message_type, body
+
+    @property
+    def maze(self) -> Optional[RemoteMaze]:
+        return self._maze
+
+    @property
+    def bytes_received(self) -> int:
+        return self._bytes_received
+
+class SpectatorView:
+    """ Desenha os snapshots recebidos em uma superfície, com o `ObservationRenderer` e um placar. """
+
+    _screen: pygame.Surface
+    _renderer: ObservationRenderer
+    _font: pygame.font.Font
+    _hud_height: int
+
+    def __init__(self, screen: pygame.Surface, maze: RemoteMaze, hud_height: int = 32) -> None:
+        self._screen = screen
+        self._hud_height = hud_height
+        width, height = screen.get_size()
+        self._renderer = ObservationRenderer(maze, (width, height - hud_height))
+        self._font = pygame.font.Font(None, hud_height)
+
+    def draw(self, snapshot: SpectatorSnapshot) -> None:
+        ghosts = np.array(snapshot.ghosts, dtype=np.int64).reshape(-1, 4)
+        frame = self._renderer.render_state(
+            snapshot.pellets[None],
+            np.array([snapshot.pacman[:2]], dtype=np.int64),
+            ghosts[None, :, :2],
+            ghosts[None, :, 3]
+        )[0]
+
+        self._screen.fill("black")
+        self._screen.blit(ObservationRenderer.as_surface(frame), (0, self._hud_height))
+
+        text = f"SCORE {snapshot.score}   LIVES {snapshot.lives}"
+        if snapshot.game_state == GameState.GAME_OVER.value:
+            text += "   GAME OVER"
+        elif snapshot.game_state == GameState.VICTORY.value:
+            text += "   VICTORY"
+        self._screen.blit(self._font.render(text, True, "white"), (8, 6))
+
+async def _watch(args: argparse.Namespace) -> None:
+    client = SpectatorClient()
+    maze = await client.connect(args.host, args.port)
+
+    pygame.init()
+    pygame.display.set_caption("Pac-Man (espectador)")
+    screen = pygame.display.set_mode((maze.cols * args.scale, maze.rows * args.scale + 32))
+    view = SpectatorView(screen, maze)
+
+    try:
+        while True:
+            snapshot = await client.receive()
+            if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                break
+            view.draw(snapshot)
+            pygame.display.flip()
+    except asyncio.IncompleteReadError:
+        print("Transmissão encerrada pelo servidor.")
+    finally:
+        await client.close()
+        pygame.quit()
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Assiste a uma partida transmitida por um SpectatorServer.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--scale", type=int, default=20, help="pixels por tile")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(_watch(args))
+    except (ConnectionError, ValueError) as e:
+        print(f"[ERRO] {e}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+import struct
+import asyncio
+from typing import Optional
+
+import numpy as np
+import pygame
+
+# Protocolo binário dos espectadores. Cada mensagem é: tipo (1 byte), tamanho do corpo (4 bytes)
+# e o corpo. O servidor manda HELLO ao conectar, KEYFRAME com a grade completa de pastilhas e um
+# SNAPSHOT por tick, com as entidades e só os tiles que diferem do último keyframe confirmado
+# (ACK) pelo cliente.
+SPECTATOR_MAGIC: bytes = b"PMSP"
+SPECTATOR_PROTOCOL_VERSION: int = 1
+
+MESSAGE_HELLO: int = 1
+MESSAGE_KEYFRAME: int = 2
+MESSAGE_SNAPSHOT: int = 3
+MESSAGE_ACK: int = 4
+
+_MESSAGE_HEADER = struct.Struct("<BI")
+# magic, versão, linhas, colunas, código da porta, cores RGB (parede, porta, pastilha, pílula)
+_HELLO = struct.Struct("<4sBHHB12s")
+_KEYFRAME = struct.Struct("<I")
+_ACK = struct.Struct("<I")
+# tick, keyframe base, estado da partida, pontos, vidas, Pac-Man (x, y, orientação), fantasmas
+_SNAPSHOT = struct.Struct("<IIBqBiiBB")
+_GHOST = struct.Struct("<iiBB")
+_DELTA_COUNT = struct.Struct("<H")
+_CELL_DTYPE = np.dtype([("index", "<u2"), ("value", "i1")])
+
+MAX_MESSAGE_SIZE: int = 1 << 20
+
+class RemoteMaze:
+    """ O que o cliente sabe do labirinto (layout e cores), no formato que o `ObservationRenderer` lê. """
+
+    rows: int
+    cols: int
+    maze_layout: np.ndarray
+    door_code: int
+    wall_color: tuple[int, int, int]
+    door_color: tuple[int, int, int]
+    small_pellet_color: tuple[int, int, int]
+    power_pellet_color: tuple[int, int, int]
+
+    def __init__(self, layout: np.ndarray, door_code: int, colors: tuple[tuple[int, int, int], ...]) -> None:
+        self.rows, self.cols = layout.shape
+        self.maze_layout = layout
+        self.door_code = door_code
+        self.wall_color, self.door_color, self.small_pellet_color, self.power_pellet_color = colors
+
+class SpectatorSnapshot:
+    """ Estado de uma partida em um tick, capturado na thread do jogo. """
+
+    tick: int
+    game_state: int
+    score: int
+    lives: int
+    pacman: tuple[int, int, int]
+    ghosts: list[tuple[int, int, int, int]]
+    pellets: Optional[np.ndarray]
+
+    def __init__(
+        self,
+        tick: int,
+        game_state: int,
+        score: int,
+        lives: int,
+        pacman: tuple[int, int, int],
+        ghosts: list[tuple[int, int, int, int]],
+        pellets: Optional[np.ndarray]
+    ) -> None:
+        self.tick = tick
+        self.game_state = game_state
+        self.score = score
+        self.lives = lives
+        self.pacman = pacman
+        self.ghosts = ghosts
+        self.pellets = pellets
+
+    @classmethod
+    def capture(cls, manager, tick: int) -> "SpectatorSnapshot":
+        """ Copia do `GameManager` só o que os espectadores veem (a grade de pastilhas é copiada). """
+        pacman = manager.pacman
+        x, y = pacman.fixed_position
+        ghosts = [(*ghost.fixed_position, ghost.orientation, ghost.mode.value) for ghost in manager.ghosts]
+
+        return cls(
+            tick, manager.game_state.value, pacman.total_points, manager.lives,
+            (x, y, pacman.orientation), ghosts, manager.maze.pellet_grid.copy()
+        )
+
+def encode_message(message_type: int, body: bytes) -> bytes:
+    return _MESSAGE_HEADER.pack(message_type, len(body)) + body
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """ Lê uma mensagem inteira; `asyncio.IncompleteReadError` quando a conexão fecha. """
+    message_type, size = _MESSAGE_HEADER.unpack(await reader.readexactly(_MESSAGE_HEADER.size))
+    if size > MAX_MESSAGE_SIZE:
+        raise ValueError(f'Mensagem de espectador grande demais: {size} bytes')
+    return message_type, await reader.readexactly(size)
+
+def encode_hello(maze) -> bytes:
+    layout = np.asarray(maze.maze_layout, dtype=np.int8)
+    colors = b"".join(
+        bytes(pygame.Color(color)[:3])
+        for color in (maze.wall_color, maze.door_color, maze.small_pellet_color, maze.power_pellet_color)
+    )
+    header = _HELLO.pack(SPECTATOR_MAGIC, SPECTATOR_PROTOCOL_VERSION, maze.rows, maze.cols, maze.door_code, colors)
+    return encode_message(MESSAGE_HELLO, header + layout.tobytes())
+
+def decode_hello(body: bytes) -> RemoteMaze:
+    if len(body) < _HELLO.size:
+        raise ValueError('HELLO de espectador truncado.')
+
+    magic, version, rows, cols, door_code, colors = _HELLO.unpack_from(body)
+    if magic != SPECTATOR_MAGIC:
+        raise ValueError('O servidor não é um servidor de espectadores do Pac-Man.')
+    if version != SPECTATOR_PROTOCOL_VERSION:
+        raise ValueError(f'Versão de protocolo de espectador não suportada: {version}')
+    if len(body) != _HELLO.size + rows * cols:
+        raise ValueError('HELLO de espectador truncado.')
+
+    layout = np.frombuffer(body, dtype=np.int8, offset=_HELLO.size).reshape(rows, cols)
+    rgb = tuple(tuple(colors[i:i + 3]) for i in range(0, 12, 3))
+    return RemoteMaze(layout, door_code, rgb)
+
+def encode_keyframe(keyframe_id: int, pellets: np.ndarray) -> bytes:
+    return encode_message(MESSAGE_KEYFRAME, _KEYFRAME.pack(keyframe_id) + pellets.astype(np.int8).tobytes())
+
+def decode_keyframe(body: bytes, shape: tuple[int, int]) -> tuple[int, np.ndarray]:
+    (keyframe_id,) = _KEYFRAME.unpack_from(body)
+    pellets = np.frombuffer(body, dtype=np.int8, offset=_KEYFRAME.size)
+    if pellets.size != shape[0] * shape[1]:
+        raise ValueError('KEYFRAME de espectador truncado.')
+    return keyframe_id, pellets.reshape(shape)
+
+def encode_ack(keyframe_id: int) -> bytes:
+    return encode_message(MESSAGE_ACK, _ACK.pack(keyframe_id))
+
+def decode_ack(body: bytes) -> int:
+    return _ACK.unpack(body)[0]
+
+def encode_snapshot_state(snapshot: SpectatorSnapshot, base_id: int) -> bytes:
+    """ Parte do SNAPSHOT que não depende do cliente (tudo menos o delta de pastilhas). """
+    x, y, orientation = snapshot.pacman
+    parts = [_SNAPSHOT.pack(
+        snapshot.tick, base_id, snapshot.game_state, snapshot.score, snapshot.lives,
+        x, y, orientation, len(snapshot.ghosts)
+    )]
+    parts.extend(_GHOST.pack(*ghost) for ghost in snapshot.ghosts)
+    return b"".join(parts)
+
+def encode_pellet_delta(base: np.ndarray, pellets: np.ndarray) -> bytes:
+    """ Tiles em que a grade atual difere do keyframe base: (índice linear, valor novo). """
+    changed = np.flatnonzero(base.ravel() != pellets.ravel())
+    cells = np.empty(changed.size, dtype=_CELL_DTYPE)
+    cells["index"] = changed
+    cells["value"] = pellets.ravel()[changed]
+    return _DELTA_COUNT.pack(changed.size) + cells.tobytes()
+
+def encode_snapshot(state: bytes, delta: bytes) -> bytes:
+    return encode_message(MESSAGE_SNAPSHOT, state + delta)
+
+def decode_snapshot(body: bytes) -> tuple[SpectatorSnapshot, int, np.ndarray]:
+    """
+    :return: O snapshot (sem a grade), o id do keyframe base e as células alteradas
+        (array estruturado com `index` e `value`).
+    """
+    tick, base_id, game_state, score, lives, x, y, orientation, ghost_count = _SNAPSHOT.unpack_from(body)
+    offset = _SNAPSHOT.size
+
+    ghosts = []
+    for _ in range(ghost_count):
+        ghosts.append(_GHOST.unpack_from(body, offset))
+        offset += _GHOST.size
+
+    (cell_count,) = _DELTA_COUNT.unpack_from(body, offset)
+    offset += _DELTA_COUNT.size
+    cells = np.frombuffer(body, dtype=_CELL_DTYPE, count=cell_count, offset=offset)
+
+    snapshot = SpectatorSnapshot(tick, game_state, score, lives, (x, y, orientation), ghosts, None)
+    return snapshot, base_id, cells
@@ -0,0 +1,256 @@
+import sys
+import time
+import asyncio
+import argparse
+import threading
+from typing import Optional
+
+import numpy as np
+
+from src.net.spectator_protocol import (
+    MESSAGE_ACK, SpectatorSnapshot, decode_ack, encode_hello, encode_keyframe, encode_pellet_delta,
+    encode_snapshot, encode_snapshot_state, read_message
+)
+
+class _Spectator:
+    """ Conexão de um espectador e o que ele já confirmou. """
+
+    writer: asyncio.StreamWriter
+    acked_keyframe: Optional[int]
+    sent_keyframe: Optional[int]
+    dropped: int
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.acked_keyframe = None
+        self.sent_keyframe = None
+        self.dropped = 0
+
+class SpectatorServer:
+    """
+    Servidor asyncio que transmite uma partida para espectadores (`SpectatorClient`).
+
+    A cada tick, `publish` manda as posições, os modos, os pontos e as vidas, e só os tiles de
+    pastilhas que mudaram desde o último keyframe que cada espectador confirmou. Quando essa
+    diferença passa de `keyframe_threshold` tiles, um keyframe novo (a grade inteira) é
+    criado e enviado; enquanto o espectador não o confirma, os deltas continuam relativos ao
+    anterior. Espectadores lentos perdem snapshots (o próximo delta os corrige) em vez de
+    acumular dados no buffer.
+    """
+
+    _host: str
+    _port: int
+    _keyframe_threshold: int
+    _max_buffered_bytes: int
+    _server: Optional[asyncio.AbstractServer]
+    _spectators: dict[asyncio.StreamWriter, _Spectator]
+    _handlers: set[asyncio.Task]
+    _keyframes: dict[int, np.ndarray]
+    _latest_keyframe: int
+    _hello: bytes
+    _loop: Optional[asyncio.AbstractEventLoop]
+    _thread: Optional[threading.Thread]
+    _bytes_sent: int
+
+    def __init__(
+        self,
+        maze,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        keyframe_threshold: int = 64,
+        max_buffered_bytes: int = 64 * 1024
+    ) -> None:
+        """
+        :param maze: `Maze` da partida (layout, cores e a grade inicial do primeiro keyframe).
+        :param port: Porta TCP (0 = escolhida pelo sistema; veja `port` depois de `start`).
+        """
+        self._host = host
+        self._port = port
+        self._keyframe_threshold = keyframe_threshold
+        self._max_buffered_bytes = max_buffered_bytes
+        self._server = None
+        self._spectators = {}
+        self._handlers = set()
+        self._keyframes = { 0: maze.pellet_grid.copy() }
+        self._latest_keyframe = 0
+        self._hello = encode_hello(maze)
+        self._loop = None
+        self._thread = None
+        self._bytes_sent = 0
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._handle_spectator, self._host, self._port)
+        self._port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+
+        self._server.close()
+        for writer in list(self._spectators):
+            writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions = True)
+        await self._server.wait_closed()
+        self._server = None
+
+    def start_in_thread(self) -> None:
+        """ Roda o servidor em uma thread própria, para jogos com laço síncrono (use `publish_threadsafe`). """
+        started = threading.Event()
+
+        def run() -> None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+            loop.run_until_complete(self.close())
+            loop.close()
+
+        self._thread = threading.Thread(target = run, name = "spectators", daemon = True)
+        self._thread.start()
+        started.wait()
+
+    def stop_thread(self) -> None:
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def publish(self, manager, tick: int) -> None:
+        """ Captura e transmite o estado do tick. Deve ser chamado na thread do laço asyncio. """
+        if self._spectators:
+            self.broadcast(SpectatorSnapshot.capture(manager, tick))
+
+    def publish_threadsafe(self, manager, tick: int) -> None:
+        """ Captura o estado na thread do jogo e agenda a transmissão no laço do servidor. """
+        if self._spectators and self._loop is not None:
+            self._loop.call_soon_threadsafe(self.broadcast, SpectatorSnapshot.capture(manager, tick))
+
+    def broadcast(self, snapshot: SpectatorSnapshot) -> None:
+        latest = self._keyframes[self._latest_keyframe]
+        if np.count_nonzero(latest != snapshot.pellets) > self._keyframe_threshold:
+            self._latest_keyframe += 1
+            self._keyframes[self._latest_keyframe] = snapshot.pellets
+            self._prune_keyframes()
+
+        # O estado e o delta são codificados uma vez por keyframe base, não por espectador.
+        encoded: dict[int, bytes] = {}
+
+        for spectator in list(self._spectators.values()):
+            writer = spectator.writer
+            if writer.is_closing():
+                continue
+
+            if spectator.sent_keyframe != self._latest_keyframe:
+                self._send(spectator, encode_keyframe(self._latest_keyframe, self._keyframes[self._latest_keyframe]))
+                spectator.sent_keyframe = self._latest_keyframe
+
+            base_id = spectator.acked_keyframe
+            if base_id is None:
+                continue
+
+            if writer.transport.get_write_buffer_size() > self._max_buffered_bytes:
+                spectator.dropped += 1
+                continue
+
+            message = encoded.get(base_id)
+            if message is None:
+                message = encoded[base_id] = encode_snapshot(
+                    encode_snapshot_state(snapshot, base_id),
+                    encode_pellet_delta(self._keyframes[base_id], snapshot.pellets)
+                )
+            self._send(spectator, message)
+
+    def _send(self, spectator: _Spectator, message: bytes) -> None:
+        spectator.writer.write(message)
+        self._bytes_sent += len(message)
+
+    def _prune_keyframes(self) -> None:
+        """ Descarta keyframes que nenhum espectador usa mais como base. """
+        in_use = { self._latest_keyframe }
+        in_use.update(s.acked_keyframe for s in self._spectators.values() if s.acked_keyframe is not None)
+        oldest = min(in_use)
+        for keyframe_id in [k for k in self._keyframes if k < oldest]:
+            del self._keyframes[keyframe_id]
+
+    async def _handle_spectator(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        spectator = self._spectators[writer] = _Spectator(writer)
+        self._send(spectator, self._hello)
+        self._send(spectator, encode_keyframe(self._latest_keyframe, self._keyframes[self._latest_keyframe]))
+        spectator.sent_keyframe = self._latest_keyframe
+
+        try:
+            while True:
+                message_type, body = await read_message(reader)
+                if message_type == MESSAGE_ACK:
+                    keyframe_id = decode_ack(body)
+                    if keyframe_id in self._keyframes:
+                        spectator.acked_keyframe = keyframe_id
+                        self._prune_keyframes()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            del self._spectators[writer]
+            self._handlers.discard(task)
+            writer.close()
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def spectator_count(self) -> int:
+        return len(self._spectators)
+
+    @property
+    def bytes_sent(self) -> int:
+        return self._bytes_sent
+
+async def _serve_headless(args: argparse.Namespace) -> None:
+    from src.simulation.headless_game import HeadlessGame
+    from src.simulation.tournament import NearestPelletAgent
+
+    seed = args.seed
+    game = HeadlessGame(args.config, seed = seed)
+    server = SpectatorServer(game.manager.maze, args.host, args.port)
+    await server.start()
+    print(f"Transmitindo em {args.host}:{server.port} (Ctrl+C para sair)")
+
+    tick_seconds = 1.0 / args.fps
+    while True:
+        agent = NearestPelletAgent(seed)
+        next_tick = time.perf_counter()
+
+        while not game.is_finished:
+            game.set_direction(agent.act(game))
+            game.step(1)
+            server.publish(game.manager, game.ticks)
+
+            next_tick += tick_seconds
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+
+        # Uma partida nova no mesmo labirinto: o primeiro delta grande vira um keyframe.
+        seed += 1
+        game = HeadlessGame(args.config, seed = seed)
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Transmite partidas sem janela (agente de pastilhas) para espectadores.")
+    parser.add_argument("--config", default="data/settings/config.json")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(_serve_headless(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
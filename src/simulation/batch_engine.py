@@ -0,0 +1,772 @@
+import random
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.core.game_builder import GHOST_SPAWN_TILES, default_maze_path, load_entity_configs, pacman_start_tile
+from src.core.states import GameState, GhostState
+from src.core.paths import default_cache_dir
+from src.world import fixed_point
+from src.world.fixed_point import UNITS_PER_TILE, HALF_TILE
+from src.world.maze import Maze
+from src.world.path_table import PathTable
+
+GHOST_NAMES: tuple[str, ...] = ("blinky", "pinky", "inky", "clyde")
+
+DIRECTION_ROW_OFFSET = np.array([0, -1, 1, 0, 0], dtype=np.int64)
+DIRECTION_COL_OFFSET = np.array([0, 0, 0, -1, 1], dtype=np.int64)
+OPPOSITE_ORIENTATION = np.array([0, 2, 1, 4, 3], dtype=np.int8)
+MOVE_DIRECTIONS = np.array([1, 2, 3, 4], dtype=np.int8)
+DISTANCE_TO_NEXT_CENTER = np.array(fixed_point.DISTANCE_TO_NEXT_CENTER, dtype=np.int64)
+DISTANCE_TO_PREVIOUS_CENTER = np.array(fixed_point.DISTANCE_TO_PREVIOUS_CENTER, dtype=np.int64)
+
+GAME_CHASE = GameState.CHASE.value
+GAME_VULNERABLE = GameState.VULNERABLE.value
+GAME_OVER = GameState.GAME_OVER.value
+GAME_VICTORY = GameState.VICTORY.value
+
+GHOST_IN_HOUSE = GhostState.IN_HOUSE.value
+GHOST_EXITING = GhostState.EXITING.value
+GHOST_CHASE = GhostState.CHASE.value
+GHOST_SCATTER = GhostState.SCATTER.value
+GHOST_VULNERABLE = GhostState.VULNERABLE.value
+GHOST_EATEN = GhostState.EATEN.value
+
+UNREACHABLE_DISTANCE = np.iinfo(np.int64).max
+
+class BatchEngine:
+    """
+    Simula N partidas em paralelo, com o estado de todas guardado em arrays NumPy.
+
+    Reproduz tick a tick as regras de `src/entities` sob um relógio simulado de passo
+    fixo (como o `HeadlessGame`): mesma física de movimento, alvos de cada fantasma,
+    escolha de direção, colisões, vidas e temporizadores. Cada partida tem seu próprio
+    `random.Random`, consumido na mesma ordem que o `GameManager.rng`, então uma
+    partida com a mesma semente e as mesmas entradas evolui de forma idêntica.
+
+    Os estados são guardados pelos valores de `GameState` e `GhostState`, e as posições em
+    unidades fixas inteiras (`src.world.fixed_point`), como nas entidades.
+    """
+
+    _n_games: int
+    _tick_ms: float
+    _rows: int
+    _cols: int
+    _maze: Maze
+    _cell_width: int
+    _cell_height: int
+    _initial_matrix: np.ndarray
+    _initial_tablets: int
+    _valid_moves: np.ndarray
+    _valid_moves_eaten: np.ndarray
+    _rngs: list[random.Random]
+
+    def __init__(
+        self,
+        config_path: str,
+        n_games: int,
+        width: int = 900,
+        height: int = 950,
+        fps: int = 60,
+        seeds: Optional[Sequence[Optional[int]]] = None,
+        maze_file: Optional[str] = None
+    ) -> None:
+        if n_games <= 0: raise ValueError('O número de partidas deve ser positivo.')
+        if fps <= 0: raise ValueError('O fps da simulação deve ser positivo.')
+
+        configs = load_entity_configs(config_path)
+
+        self._n_games = n_games
+        self._tick_ms = 1000.0 / fps
+        self._cell_width = width // 30
+        self._cell_height = height // 32
+
+        self._load_manager_config(configs["manager"])
+        self._load_maze(maze_file or default_maze_path(), configs["manager"])
+        self._load_pacman_config(configs["pacman"])
+        self._load_ghost_configs([configs[name] for name in GHOST_NAMES])
+        self._allocate_state()
+
+        self.reset(seeds = seeds)
+
+    def reset(self, game_indices: Optional[Sequence[int]] = None, seeds: Optional[Sequence[Optional[int]]] = None) -> None:
+        """
+        Reinicia as partidas indicadas (todas, por padrão) para o estado inicial.
+
+        :param seeds: Uma semente por partida reiniciada (None = aleatória).
+        """
+        if game_indices is None:
+            indices = np.arange(self._n_games)
+        else:
+            indices = np.asarray(game_indices, dtype=np.int64)
+
+        if seeds is not None and len(seeds) != len(indices):
+            raise ValueError('É preciso informar uma semente por partida reiniciada.')
+
+        for position, game in enumerate(indices):
+            self._rngs[game] = random.Random(None if seeds is None else seeds[position])
+
+        self._reset_games(indices)
+
+    def set_directions(self, directions) -> None:
+        """ Define a seta pressionada em cada partida (0 = nenhuma tecla). """
+        directions = np.asarray(directions)
+        if np.any((directions < 0) | (directions > 4)):
+            raise ValueError('Direções devem estar entre 0 e 4.')
+        self._input_directions[:] = directions
+
+    def step(self, n_ticks: int = 1) -> None:
+        """ Avança todas as partidas ainda não encerradas em `n_ticks` ticks. """
+        for _ in range(n_ticks):
+            self._tick()
+
+    def _tick(self) -> None:
+        active = np.flatnonzero(~self._finished)
+        if active.size == 0:
+            return
+
+        self._elapsed_ms[active] += self._tick_ms
+        self._now_ms[active] = self._elapsed_ms[active].astype(np.int64)
+
+        state = self._game_state[active]
+        ended = (state == GAME_OVER) | (state == GAME_VICTORY)
+        self._handle_end_game_timer(active[ended])
+
+        running = active[~ended]
+        vulnerable = self._game_state[running] == GAME_VULNERABLE
+        self._check_vulnerable_timeout(running[vulnerable])
+        self._update_ghost_director(running[~vulnerable])
+
+        self._update_pacman(running)
+
+        for ghost in range(len(GHOST_NAMES)):
+            alive = running[self._game_state[running] != GAME_OVER]
+            self._update_ghost(ghost, alive)
+
+    # ----------------------------------------------------------------- gerente
+
+    def _handle_end_game_timer(self, games: np.ndarray) -> None:
+        elapsed = self._now_ms[games] - self._game_over_start_ms[games]
+        self._finished[games[elapsed > self._game_over_screen_duration_ms]] = True
+
+    def _check_vulnerable_timeout(self, games: np.ndarray) -> None:
+        elapsed = self._now_ms[games] - self._vulnerable_timer_ms[games]
+        self._game_state[games[elapsed > self._vulnerable_duration_ms]] = GAME_CHASE
+
+    def _update_ghost_director(self, games: np.ndarray) -> None:
+        mode = self._director_mode[games]
+        since_switch = self._now_ms[games] - self._director_last_switch_ms[games]
+
+        to_chase = games[(mode == GHOST_SCATTER) & (since_switch > self._scatter_duration_ms)]
+        to_scatter = games[(mode == GHOST_CHASE) & (since_switch > self._chase_duration_ms)]
+
+        self._director_mode[to_chase] = GHOST_CHASE
+        self._director_last_switch_ms[to_chase] = self._now_ms[to_chase]
+        self._director_mode[to_scatter] = GHOST_SCATTER
+        self._director_last_switch_ms[to_scatter] = self._now_ms[to_scatter]
+
+    def _set_vulnerable(self, games: np.ndarray) -> None:
+        state = self._game_state[games]
+        games = games[(state != GAME_OVER) & (state != GAME_VICTORY)]
+        self._game_state[games] = GAME_VULNERABLE
+        self._vulnerable_timer_ms[games] = self._now_ms[games]
+
+    def _handle_player_death(self, games: np.ndarray) -> None:
+        self._lives[games] -= 1
+        survivors = self._lives[games] > 0
+
+        self._reset_level(games[survivors])
+
+        game_over = games[~survivors]
+        self._game_state[game_over] = GAME_OVER
+        self._game_over_start_ms[game_over] = self._now_ms[game_over]
+
+    def _reset_level(self, games: np.ndarray) -> None:
+        if games.size == 0:
+            return
+
+        self._elapsed_ms[games] += 1000
+        self._now_ms[games] = self._elapsed_ms[games].astype(np.int64)
+        self._game_state[games] = GAME_CHASE
+
+        self._director_mode[games] = GHOST_SCATTER
+        self._director_last_switch_ms[games] = self._now_ms[games]
+
+        self._pacman_position[games] = self._pacman_start_position
+        self._pacman_orientation[games] = 0
+        self._pacman_next_orientation[games] = 0
+        self._pacman_streak[games] = 0
+
+        for ghost in range(len(GHOST_NAMES)):
+            self._reset_ghost(ghost, games)
+
+    def _reset_games(self, games: np.ndarray) -> None:
+        self._pellets[games] = self._initial_matrix
+        self._tablets[games] = self._initial_tablets
+        self._finished[games] = False
+        self._input_directions[games] = 0
+
+        self._elapsed_ms[games] = 0.0
+        self._now_ms[games] = 0
+        self._game_state[games] = GAME_CHASE
+        self._lives[games] = self._initial_lives
+        self._vulnerable_timer_ms[games] = 0
+        self._game_over_start_ms[games] = 0
+        self._director_mode[games] = GHOST_SCATTER
+        self._director_last_switch_ms[games] = 0
+
+        self._pacman_position[games] = self._pacman_start_position
+        self._pacman_orientation[games] = 0
+        self._pacman_next_orientation[games] = 0
+        self._pacman_previous_orientation[games] = 0
+        self._pacman_points[games] = 0
+        self._pacman_streak[games] = 0
+
+        self._ghost_previous_mode[games] = GHOST_IN_HOUSE
+        self._ghost_last_game_state[games] = GAME_CHASE
+
+        for ghost in range(len(GHOST_NAMES)):
+            self._reset_ghost(ghost, games)
+            self._ghost_exit_timer_ms[games, ghost] = self._ghost_initial_exit_delay_ms[ghost]
+
+    # ----------------------------------------------------------------- pac-man
+
+    def _update_pacman(self, games: np.ndarray) -> None:
+        if games.size == 0:
+            return
+
+        pressed = self._input_directions[games]
+        has_input = pressed != 0
+        self._pacman_next_orientation[games[has_input]] = pressed[has_input]
+
+        self._handle_pacman_movement(games)
+        self._update_pacman_orientation_memory(games)
+        self._check_pacman_collisions(games)
+
+    def _handle_pacman_movement(self, games: np.ndarray) -> None:
+        speed = self._pacman_speed
+        position = self._pacman_position[games]
+        row, col = self._grid_coordinates(position)
+
+        aligned = self._at_tile_center(position)
+        aligned_games = games[aligned]
+        aligned_row, aligned_col = row[aligned], col[aligned]
+        self._process_pellet_interaction(aligned_games, aligned_row, aligned_col)
+
+        valid = self._lookup_valid_moves(self._valid_moves, aligned_row, aligned_col)
+        lines = np.arange(aligned_games.size)
+        next_orientation = self._pacman_next_orientation[aligned_games]
+        orientation = self._pacman_orientation[aligned_games]
+
+        can_turn = valid[lines, next_orientation]
+        can_continue = valid[lines, orientation]
+        self._pacman_orientation[aligned_games] = np.where(can_turn, next_orientation, np.where(can_continue, orientation, 0))
+
+        orientation = self._pacman_orientation[games]
+        self._pacman_position[games] = self._apply_velocity(self._pacman_position[games], orientation, speed)
+
+    def _process_pellet_interaction(self, games: np.ndarray, row: np.ndarray, col: np.ndarray) -> None:
+        inside = (row >= 0) & (row < self._rows) & (col >= 0) & (col < self._cols)
+        games, row, col = games[inside], row[inside], col[inside]
+
+        point_type = self._pellets[games, row, col]
+        small = point_type == 1
+        power = point_type == 2
+
+        self._pacman_points[games[small]] += self._small_pellet_points
+        self._pacman_points[games[power]] += self._power_pellet_points
+        self._set_vulnerable(games[power])
+        self._pacman_streak[games[power]] = 0
+
+        eaten = small | power
+        games = games[eaten]
+        self._pellets[games, row[eaten], col[eaten]] = 0
+
+        remaining = self._tablets[games]
+        self._tablets[games] = np.where(remaining > 0, remaining - 1, remaining)
+
+        cleared = games[self._tablets[games] <= 0]
+        self._game_state[cleared] = GAME_VICTORY
+        self._game_over_start_ms[cleared] = self._now_ms[cleared]
+
+    def _update_pacman_orientation_memory(self, games: np.ndarray) -> None:
+        """ Espelha `PacMan._update_sprite`: parado, volta a olhar para a última direção. """
+        orientation = self._pacman_orientation[games]
+        stopped = orientation == 0
+
+        self._pacman_orientation[games[stopped]] = self._pacman_previous_orientation[games[stopped]]
+        self._pacman_previous_orientation[games[~stopped]] = orientation[~stopped]
+
+    def _check_pacman_collisions(self, games: np.ndarray) -> None:
+        """ Equivale a `Entity.collides_with`: sobreposição dos quadrados de colisão. """
+        position = self._pacman_position[games]
+
+        for ghost in range(len(GHOST_NAMES)):
+            reach = self._pacman_collision_size + self._ghost_collision_size[ghost]
+            distance = np.abs(position - self._ghost_position[games, ghost])
+            hit = (2 * distance[:, 0] < reach) & (2 * distance[:, 1] < reach)
+
+            mode = self._ghost_mode[games, ghost]
+            eaten = games[hit & (mode == GHOST_VULNERABLE)]
+            killed = games[hit & ((mode == GHOST_CHASE) | (mode == GHOST_SCATTER))]
+
+            self._pacman_streak[eaten] += 1
+            self._pacman_points[eaten] += self._ghost_base_points * (2 ** self._pacman_streak[eaten])
+            self._ghost_mode[eaten, ghost] = GHOST_EATEN
+            self._ghost_immune[eaten, ghost] = True
+
+            self._handle_player_death(killed)
+
+    # ---------------------------------------------------------------- fantasmas
+
+    def _update_ghost(self, ghost: int, games: np.ndarray) -> None:
+        if games.size == 0:
+            return
+
+        game_state = self._game_state[games]
+        mode = self._ghost_mode[games, ghost]
+
+        just_vulnerable = (game_state == GAME_VULNERABLE) & (self._ghost_last_game_state[games, ghost] != GAME_VULNERABLE)
+        self._ghost_immune[games[just_vulnerable], ghost] = False
+        self._ghost_last_game_state[games, ghost] = game_state
+        self._ghost_previous_mode[games, ghost] = mode
+
+        self._update_ghost_behavior_state(ghost, games, game_state, mode)
+        self._handle_direction_reversal_on_state_change(ghost, games)
+
+        moving = games[self._ghost_mode[games, ghost] != GHOST_IN_HOUSE]
+        self._process_ghost_movement(ghost, moving)
+
+    def _update_ghost_behavior_state(self, ghost: int, games: np.ndarray, game_state: np.ndarray, mode: np.ndarray) -> None:
+        in_house = mode == GHOST_IN_HOUSE
+        house_games = games[in_house]
+        self._release_ghost_from_house(ghost, house_games[self._should_exit_house(ghost, house_games)])
+
+        eaten = mode == GHOST_EATEN
+        eaten_games = games[eaten]
+        row, col = self._grid_coordinates(self._ghost_position[eaten_games, ghost])
+        door_row, door_col = self._ghost_house_door[ghost]
+        self._enter_house_to_respawn(ghost, eaten_games[(row == door_row) & (col == door_col)])
+
+        roaming = ~in_house & ~eaten
+        roaming_games = games[roaming]
+        global_mode = self._director_mode[roaming_games]
+        becomes_vulnerable = (game_state[roaming] == GAME_VULNERABLE) & ~self._ghost_immune[roaming_games, ghost]
+        self._ghost_mode[roaming_games, ghost] = np.where(becomes_vulnerable, GHOST_VULNERABLE, global_mode)
+
+    def _should_exit_house(self, ghost: int, games: np.ndarray) -> np.ndarray:
+        name = GHOST_NAMES[ghost]
+
+        if name == "pinky":
+            return self._now_ms[games] >= self._ghost_exit_timer_ms[games, ghost]
+        if name in ("inky", "clyde"):
+            return self._pacman_points[games] >= self._ghost_points_to_exit[ghost]
+
+        return np.ones(games.size, dtype=bool)
+
+    def _handle_direction_reversal_on_state_change(self, ghost: int, games: np.ndarray) -> None:
+        mode = self._ghost_mode[games, ghost]
+        previous = self._ghost_previous_mode[games, ghost]
+
+        involves_vulnerable = (mode == GHOST_VULNERABLE) | (previous == GHOST_VULNERABLE)
+        valid_previous = (previous != GHOST_IN_HOUSE) & (previous != GHOST_EATEN) & (previous != GHOST_EXITING)
+        reversing = games[(mode != previous) & involves_vulnerable & valid_previous]
+
+        self._ghost_orientation[reversing, ghost] = OPPOSITE_ORIENTATION[self._ghost_orientation[reversing, ghost]]
+
+    def _process_ghost_movement(self, ghost: int, games: np.ndarray) -> None:
+        if games.size == 0:
+            return
+
+        position = self._ghost_position[games, ghost]
+        row, col = self._grid_coordinates(position)
+
+        aligned = self._at_tile_center(position)
+        aligned_games = games[aligned]
+        self._choose_ghost_directions(ghost, aligned_games, row[aligned], col[aligned])
+
+        mode = self._ghost_mode[games, ghost]
+        normal_speed = self._ghost_normal_speed[ghost]
+        speed = np.where(
+            mode == GHOST_EATEN, self._ghost_eaten_speed[ghost],
+            np.where(mode == GHOST_VULNERABLE, self._ghost_vulnerable_speed[ghost], normal_speed)
+        )
+        self._ghost_speed[games, ghost] = speed
+
+        orientation = self._ghost_orientation[games, ghost]
+        self._ghost_position[games, ghost] = self._apply_velocity(self._ghost_position[games, ghost], orientation, speed)
+
+    def _choose_ghost_directions(self, ghost: int, games: np.ndarray, row: np.ndarray, col: np.ndarray) -> None:
+        """ Equivale a `_is_move_valid`, `_is_intersection` e `_calculate_best_direction`. """
+        if games.size == 0:
+            return
+
+        mode = self._ghost_mode[games, ghost]
+        is_eaten = (mode == GHOST_EATEN)[:, None]
+        valid = np.where(
+            is_eaten,
+            self._lookup_valid_moves(self._valid_moves_eaten, row, col),
+            self._lookup_valid_moves(self._valid_moves, row, col)
+        )
+
+        lines = np.arange(games.size)
+        orientation = self._ghost_orientation[games, ghost]
+        opposite = OPPOSITE_ORIENTATION[orientation]
+
+        choices = valid[:, 1:] & (MOVE_DIRECTIONS[None, :] != opposite[:, None])
+        choice_count = choices.sum(axis=1)
+        is_dead_end = ~valid[lines, orientation]
+        deciding = is_dead_end | (choice_count > 1)
+
+        games, row, col, mode = games[deciding], row[deciding], col[deciding], mode[deciding]
+        valid, choices, opposite = valid[deciding], choices[deciding], opposite[deciding]
+        lines = np.arange(games.size)
+
+        no_choice = ~choices.any(axis=1)
+        new_orientation = np.where(valid[lines, opposite], opposite, 0).astype(np.int8)
+
+        target_row = np.zeros(games.size, dtype=np.int64)
+        target_col = np.zeros(games.size, dtype=np.int64)
+
+        chasing = ~no_choice & (mode == GHOST_CHASE)
+        target_row[chasing], target_col[chasing] = self._compute_target_tile(ghost, games[chasing], row[chasing], col[chasing])
+
+        scattering = ~no_choice & (mode == GHOST_SCATTER)
+        target_row[scattering], target_col[scattering] = self._ghost_scatter_target[ghost]
+
+        returning = ~no_choice & (mode == GHOST_EATEN)
+        target_row[returning], target_col[returning] = self._ghost_house_door[ghost]
+
+        targeted = chasing | scattering | returning
+        if targeted.any():
+            new_orientation[targeted] = self._closest_direction(
+                row[targeted], col[targeted], target_row[targeted], target_col[targeted], choices[targeted]
+            )
+
+        routing = self._ghost_routing[ghost]
+        routed_by_graph = ((returning, self._path_arrays_eaten), (chasing, self._path_arrays))
+        for routed, path_arrays in routed_by_graph:
+            if routing == "greedy" or (routed is chasing and not self._ghost_route_chase[ghost]) or not routed.any():
+                continue
+
+            direction, found = self._closest_direction_by_path(
+                path_arrays, row[routed], col[routed], target_row[routed], target_col[routed], choices[routed]
+            )
+            lines = np.flatnonzero(routed)[found]
+            new_orientation[lines] = direction[found]
+
+        randomized = np.flatnonzero(~no_choice & ~targeted)
+        for line in randomized:
+            options = [int(direction) for direction in MOVE_DIRECTIONS[choices[line]]]
+            new_orientation[line] = self._rngs[games[line]].choice(options)
+
+        self._ghost_orientation[games, ghost] = new_orientation
+
+    def _closest_direction(self, row, col, target_row, target_col, choices) -> np.ndarray:
+        next_row = row[:, None] + DIRECTION_ROW_OFFSET[None, 1:]
+        next_col = col[:, None] + DIRECTION_COL_OFFSET[None, 1:]
+        distance_squared = (next_row - target_row[:, None]) ** 2 + (next_col - target_col[:, None]) ** 2
+        distance_squared = np.where(choices, distance_squared, UNREACHABLE_DISTANCE)
+        return MOVE_DIRECTIONS[np.argmin(distance_squared, axis=1)]
+
+    def _closest_direction_by_path(self, path_arrays, row, col, target_row, target_col, choices) -> tuple[np.ndarray, np.ndarray]:
+        """ Equivale a `Ghost._choose_direction_by_path`; `found` é falso quando o alvo é inalcançável. """
+        distances, next_hops, neighbors = path_arrays
+        lines = np.arange(row.size)
+
+        inside = (target_row >= 0) & (target_row < self._rows) & (target_col >= 0) & (target_col < self._cols)
+        source = row * self._cols + col
+        target = np.where(inside, target_row * self._cols + target_col, 0)
+
+        next_hop = np.where(inside, next_hops[source, target], 0).astype(np.int64)
+        follows_next_hop = (next_hop > 0) & choices[lines, np.maximum(next_hop - 1, 0)]
+
+        neighbor = neighbors[source, 1:]
+        neighbor_distance = distances[np.maximum(neighbor, 0), target[:, None]].astype(np.int64)
+        usable = choices & (neighbor >= 0) & (neighbor_distance != PathTable.UNREACHABLE) & inside[:, None]
+        best = MOVE_DIRECTIONS[np.argmin(np.where(usable, neighbor_distance, UNREACHABLE_DISTANCE), axis=1)]
+
+        return np.where(follows_next_hop, next_hop, best), follows_next_hop | usable.any(axis=1)
+
+    def _compute_target_tile(self, ghost: int, games: np.ndarray, row: np.ndarray, col: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """ Alvo no modo CHASE, seguindo a regra de cada fantasma. """
+        name = GHOST_NAMES[ghost]
+        pacman_row, pacman_col = self._grid_coordinates(self._pacman_position[games])
+
+        if name == "clyde":
+            distance_squared = (pacman_row - row) ** 2 + (pacman_col - col) ** 2
+            far = distance_squared > self._ghost_distance_threshold_squared[ghost]
+            scatter_row, scatter_col = self._ghost_scatter_target[ghost]
+            return np.where(far, pacman_row, scatter_row), np.where(far, pacman_col, scatter_col)
+
+        if name in ("pinky", "inky"):
+            orientation = self._pacman_orientation[games]
+            offset = self._ghost_chase_offset[ghost]
+            pacman_row = pacman_row + DIRECTION_ROW_OFFSET[orientation] * offset
+            pacman_col = pacman_col + DIRECTION_COL_OFFSET[orientation] * offset
+
+        if name == "inky":
+            blinky_row, blinky_col = self._grid_coordinates(self._ghost_position[games, GHOST_NAMES.index("blinky")])
+            return 2 * pacman_row - blinky_row, 2 * pacman_col - blinky_col
+
+        return pacman_row, pacman_col
+
+    def _release_ghost_from_house(self, ghost: int, games: np.ndarray) -> None:
+        self._ghost_position[games, ghost] = self._ghost_exit_position[ghost]
+        self._ghost_mode[games, ghost] = self._director_mode[games]
+        self._ghost_orientation[games, ghost] = 1
+        self._ghost_exit_timer_ms[games, ghost] = 0
+
+    def _enter_house_to_respawn(self, ghost: int, games: np.ndarray) -> None:
+        self._ghost_mode[games, ghost] = GHOST_IN_HOUSE
+        self._ghost_speed[games, ghost] = self._ghost_normal_speed[ghost]
+        self._ghost_position[games, ghost] = self._ghost_wait_position[ghost]
+        self._ghost_exit_timer_ms[games, ghost] = self._now_ms[games] + self._ghost_respawn_time_ms[ghost]
+
+    def _reset_ghost(self, ghost: int, games: np.ndarray) -> None:
+        self._ghost_position[games, ghost] = self._ghost_start_position[ghost]
+        self._ghost_orientation[games, ghost] = 4
+        self._ghost_mode[games, ghost] = self._ghost_start_mode[ghost]
+        self._ghost_speed[games, ghost] = self._ghost_normal_speed[ghost]
+        self._ghost_exit_timer_ms[games, ghost] = 0
+        self._ghost_immune[games, ghost] = False
+
+        if self._ghost_start_mode[ghost] == GHOST_SCATTER:
+            self._release_ghost_from_house(ghost, games)
+
+    # ------------------------------------------------------------------ física
+
+    def _grid_coordinates(self, position: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return position[..., 1] // UNITS_PER_TILE, position[..., 0] // UNITS_PER_TILE
+
+    def _at_tile_center(self, position: np.ndarray) -> np.ndarray:
+        return (position[:, 0] % UNITS_PER_TILE == HALF_TILE) & (position[:, 1] % UNITS_PER_TILE == HALF_TILE)
+
+    def _apply_velocity(self, position: np.ndarray, orientation: np.ndarray, speed) -> np.ndarray:
+        """ Equivale a `Entity._move` seguido de `_handle_teleport`; altera `position`. """
+        for axis, offsets in ((0, DIRECTION_COL_OFFSET), (1, DIRECTION_ROW_OFFSET)):
+            step = offsets[orientation] * speed
+            offset = position[:, axis] % UNITS_PER_TILE
+            position[:, axis] += np.where(
+                step > 0, np.minimum(step, DISTANCE_TO_NEXT_CENTER[offset]), -np.minimum(-step, DISTANCE_TO_PREVIOUS_CENTER[offset])
+            )
+
+        min_x, max_x = self._teleport_x_limits
+        wrap_min, wrap_max = self._teleport_x_wrap
+        x = position[:, 0]
+        position[:, 0] = np.where(x <= min_x, wrap_min, np.where(x >= max_x, wrap_max, x))
+        return position
+
+    def _lookup_valid_moves(self, table: np.ndarray, row: np.ndarray, col: np.ndarray) -> np.ndarray:
+        return table[np.clip(row, 0, self._rows - 1), np.clip(col, 0, self._cols - 1)]
+
+    # ------------------------------------------------------------ configuração
+
+    def _load_manager_config(self, config: dict) -> None:
+        env_config: dict = config.get("environment", {})
+        durations: dict = env_config.get("durations_ms", {})
+
+        self._initial_lives = env_config.get("initial_lives", 3)
+        self._vulnerable_duration_ms = durations.get("vulnerable", 7000)
+        self._game_over_screen_duration_ms = durations.get("game_over_screen", 4000)
+        self._chase_duration_ms = durations.get("chase", 20000)
+        self._scatter_duration_ms = durations.get("scatter", 7000)
+
+    def _load_maze(self, maze_file: str, config: dict) -> None:
+        maze = self._maze = Maze(maze_file, self._cell_width, self._cell_height, config)
+
+        self._rows, self._cols = maze.rows, maze.cols
+        self._initial_matrix = np.array(maze.matrix, dtype=np.int8)
+        self._initial_tablets = maze.total_tablets
+
+        self._valid_moves = np.array(maze.move_table(allow_door = False), dtype=bool)
+        self._valid_moves_eaten = np.array(maze.move_table(allow_door = True), dtype=bool)
+
+        self._path_arrays = self._load_path_arrays(maze, allow_door = False)
+        self._path_arrays_eaten = self._load_path_arrays(maze, allow_door = True)
+
+    def _load_path_arrays(self, maze: Maze, allow_door: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        table = PathTable.load_or_build(maze, allow_door, default_cache_dir())
+        return table.distances, table.next_hops, table.neighbors
+
+    def _tile_position(self, tile) -> np.ndarray:
+        return np.array(fixed_point.tile_center(*tile), dtype=np.int64)
+
+    def _load_pacman_config(self, config: dict) -> None:
+        to_units = fixed_point.reference_pixels_to_units
+
+        self._pacman_speed = to_units(config.get("speed", 2))
+        self._pacman_collision_size = to_units(config.get("collision_rect_size", 32))
+        self._pacman_start_position = self._tile_position(pacman_start_tile(config))
+
+        points_config: dict = config.get("points", {})
+        self._small_pellet_points = points_config.get("small_pellet", 10)
+        self._power_pellet_points = points_config.get("power_pellet", 20)
+        self._ghost_base_points = points_config.get("ghost_base", 100)
+
+        self._teleport_x_limits = (to_units(config.get("min_x", 0)), to_units(config.get("max_x", 0)))
+        self._teleport_x_wrap = (to_units(config.get("wrap_x_min", 0)), to_units(config.get("wrap_x_max", 0)))
+
+    def _load_ghost_configs(self, configs: list[dict]) -> None:
+        to_units = fixed_point.reference_pixels_to_units
+
+        self._ghost_start_position = []
+        self._ghost_exit_position = []
+        self._ghost_wait_position = []
+        self._ghost_house_door = []
+        self._ghost_scatter_target = []
+        self._ghost_normal_speed = []
+        self._ghost_eaten_speed = []
+        self._ghost_vulnerable_speed = []
+        self._ghost_respawn_time_ms = []
+        self._ghost_collision_size = []
+        self._ghost_start_mode = []
+        self._ghost_initial_exit_delay_ms = []
+        self._ghost_chase_offset = []
+        self._ghost_points_to_exit = []
+        self._ghost_distance_threshold_squared = []
+        self._ghost_routing = []
+        self._ghost_route_chase = []
+
+        for name, config in zip(GHOST_NAMES, configs):
+            positions: dict = config.get("positions", {})
+            speed: dict = config.get("speed", {})
+
+            self._ghost_start_position.append(self._tile_position(GHOST_SPAWN_TILES[name]))
+            self._ghost_exit_position.append(self._tile_position(positions.get("house_exit", (0, 0))))
+            self._ghost_wait_position.append(self._tile_position(positions.get("house_wait", (0, 0))))
+            self._ghost_house_door.append(tuple(positions.get("house_door", (0, 0))))
+            self._ghost_scatter_target.append(tuple(config.get("scatter_target", (0, 0))))
+            self._ghost_normal_speed.append(to_units(speed.get("normal", 1)))
+            self._ghost_vulnerable_speed.append(to_units(speed.get("normal", 1) * 0.75))
+            self._ghost_eaten_speed.append(to_units(speed.get("eaten", 1)))
+            self._ghost_respawn_time_ms.append(config.get("spawn_time", 1))
+            self._ghost_collision_size.append(to_units(config.get("collision_rect_size", 32)))
+            self._ghost_start_mode.append(GHOST_SCATTER if name == "blinky" else GHOST_IN_HOUSE)
+            self._ghost_initial_exit_delay_ms.append(config.get("initial_exit_delay", 0) if name == "pinky" else 0)
+            self._ghost_chase_offset.append(config.get("chase_offset", 4 if name == "pinky" else 2))
+            self._ghost_points_to_exit.append(config.get("points_to_exit", 30 if name == "inky" else 60))
+            self._ghost_distance_threshold_squared.append(config.get("distance_threshold_squared", 64))
+
+            routing: dict = config.get("routing", {})
+            self._ghost_routing.append(routing.get("mode", "greedy"))
+            self._ghost_route_chase.append(routing.get("chase", False))
+
+    def _allocate_state(self) -> None:
+        n, ghosts = self._n_games, len(GHOST_NAMES)
+
+        self._rngs = [random.Random() for _ in range(n)]
+        self._input_directions = np.zeros(n, dtype=np.int8)
+        self._finished = np.zeros(n, dtype=bool)
+
+        self._pellets = np.zeros((n, self._rows, self._cols), dtype=np.int8)
+        self._tablets = np.zeros(n, dtype=np.int64)
+
+        self._elapsed_ms = np.zeros(n, dtype=np.float64)
+        self._now_ms = np.zeros(n, dtype=np.int64)
+        self._game_state = np.zeros(n, dtype=np.int8)
+        self._lives = np.zeros(n, dtype=np.int64)
+        self._vulnerable_timer_ms = np.zeros(n, dtype=np.int64)
+        self._game_over_start_ms = np.zeros(n, dtype=np.int64)
+        self._director_mode = np.zeros(n, dtype=np.int8)
+        self._director_last_switch_ms = np.zeros(n, dtype=np.int64)
+
+        self._pacman_position = np.zeros((n, 2), dtype=np.int64)
+        self._pacman_orientation = np.zeros(n, dtype=np.int8)
+        self._pacman_next_orientation = np.zeros(n, dtype=np.int8)
+        self._pacman_previous_orientation = np.zeros(n, dtype=np.int8)
+        self._pacman_points = np.zeros(n, dtype=np.int64)
+        self._pacman_streak = np.zeros(n, dtype=np.int64)
+
+        self._ghost_position = np.zeros((n, ghosts, 2), dtype=np.int64)
+        self._ghost_orientation = np.zeros((n, ghosts), dtype=np.int8)
+        self._ghost_mode = np.zeros((n, ghosts), dtype=np.int8)
+        self._ghost_previous_mode = np.zeros((n, ghosts), dtype=np.int8)
+        self._ghost_last_game_state = np.zeros((n, ghosts), dtype=np.int8)
+        self._ghost_immune = np.zeros((n, ghosts), dtype=bool)
+        self._ghost_speed = np.zeros((n, ghosts), dtype=np.int64)
+        self._ghost_exit_timer_ms = np.zeros((n, ghosts), dtype=np.int64)
+
+    # -------------------------------------------------------------- consultas
+
+    @property
+    def n_games(self) -> int:
+        return self._n_games
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    @property
+    def cell_width(self) -> int:
+        return self._cell_width
+
+    @property
+    def cell_height(self) -> int:
+        return self._cell_height
+
+    @property
+    def maze(self) -> Maze:
+        """ Labirinto de origem (só o layout e as cores; as pastilhas de cada partida estão em `pellets`). """
+        return self._maze
+
+    @property
+    def pellets(self) -> np.ndarray:
+        """ Grade de pastilhas de cada partida, (N, linhas, colunas). """
+        return self._pellets
+
+    @property
+    def remaining_tablets(self) -> np.ndarray:
+        return self._tablets
+
+    @property
+    def elapsed_ms(self) -> np.ndarray:
+        return self._now_ms
+
+    @property
+    def game_states(self) -> np.ndarray:
+        """ Estado de cada partida, como `GameState.value`. """
+        return self._game_state
+
+    @property
+    def finished(self) -> np.ndarray:
+        return self._finished
+
+    @property
+    def scores(self) -> np.ndarray:
+        return self._pacman_points
+
+    @property
+    def lives(self) -> np.ndarray:
+        return self._lives
+
+    @property
+    def ghost_director_modes(self) -> np.ndarray:
+        return self._director_mode
+
+    @property
+    def pacman_positions(self) -> np.ndarray:
+        """ Posição (x, y) em unidades fixas do Pac-Man de cada partida, (N, 2). """
+        return self._pacman_position
+
+    @property
+    def pacman_orientations(self) -> np.ndarray:
+        return self._pacman_orientation
+
+    @property
+    def ghost_positions(self) -> np.ndarray:
+        """ Posição (x, y) em unidades fixas de cada fantasma, (N, 4, 2), na ordem de `GHOST_NAMES`. """
+        return self._ghost_position
+
+    @property
+    def ghost_orientations(self) -> np.ndarray:
+        return self._ghost_orientation
+
+    @property
+    def ghost_modes(self) -> np.ndarray:
+        """ Modo de cada fantasma, como `GhostState.value`, (N, 4). """
+        return self._ghost_mode
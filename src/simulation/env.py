@@ -0,0 +1,246 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.core.game_builder import load_entity_configs
+from src.core.states import GameState
+from src.simulation.batch_engine import BatchEngine, GHOST_NAMES, GAME_OVER, GAME_VICTORY
+from src.simulation.headless_game import HeadlessGame
+
+# Ações: 0 = nenhuma seta, 1 = cima, 2 = baixo, 3 = esquerda, 4 = direita.
+NUM_ACTIONS: int = 5
+
+class PacManEnv:
+    """
+    Ambiente no estilo Gym sobre uma partida sem janela (`HeadlessGame`).
+
+    As observações são um dicionário de arrays NumPy que o ambiente reaproveita: `pellets` é
+    uma vista somente leitura da grade viva do `Maze`, e os arrays das entidades e da partida
+    são preenchidos no lugar a cada passo. Eles mudam no próximo `step`/`reset`; quem precisar
+    guardá-los deve copiá-los.
+
+    Chaves: `pellets` (linhas, colunas), `pacman_position` (2,) e `ghost_positions` (4, 2) em
+    unidades fixas (x, y), `pacman_orientation` (), `ghost_orientations` (4,),
+    `ghost_modes` (4,) como `GhostState.value`, `game_state` () como `GameState.value`,
+    `lives` () e `score` (). Os fantasmas seguem a ordem de `GHOST_NAMES`.
+    """
+
+    _config_path: str
+    _configs: dict[str, dict]
+    _width: int
+    _height: int
+    _fps: int
+    _frame_skip: int
+    _max_episode_ticks: int
+    _game: Optional[HeadlessGame]
+    _last_score: int
+    _observation: dict[str, np.ndarray]
+
+    def __init__(
+        self,
+        config_path: str,
+        width: int = 900,
+        height: int = 950,
+        fps: int = 60,
+        frame_skip: int = 1,
+        max_episode_ticks: int = 60 * 60 * 5
+    ) -> None:
+        """
+        :param frame_skip: Ticks simulados por `step`, repetindo a ação.
+        :param max_episode_ticks: Ticks até o episódio ser truncado.
+        """
+        if frame_skip <= 0: raise ValueError('O frame_skip deve ser positivo.')
+
+        self._config_path = config_path
+        self._configs = load_entity_configs(config_path)
+        self._width = width
+        self._height = height
+        self._fps = fps
+        self._frame_skip = frame_skip
+        self._max_episode_ticks = max_episode_ticks
+        self._game = None
+        self._last_score = 0
+
+        ghosts = len(GHOST_NAMES)
+        self._observation = {
+            "pellets": np.zeros((0, 0), dtype=np.int8),
+            "pacman_position": np.zeros(2, dtype=np.int64),
+            "pacman_orientation": np.zeros((), dtype=np.int8),
+            "ghost_positions": np.zeros((ghosts, 2), dtype=np.int64),
+            "ghost_orientations": np.zeros(ghosts, dtype=np.int8),
+            "ghost_modes": np.zeros(ghosts, dtype=np.int8),
+            "game_state": np.zeros((), dtype=np.int8),
+            "lives": np.zeros((), dtype=np.int64),
+            "score": np.zeros((), dtype=np.int64)
+        }
+
+    def reset(self, seed: Optional[int] = None) -> tuple[dict[str, np.ndarray], dict]:
+        """ Começa uma partida nova (com a configuração lida na construção). """
+        self._game = HeadlessGame(
+            self._config_path, self._width, self._height, self._fps, seed = seed, configs = self._configs
+        )
+        self._last_score = 0
+        self._observation["pellets"] = self._game.manager.maze.pellet_grid
+        self._refresh_observation()
+        return self._observation, { "seed": self._game.seed }
+
+    def step(self, action: int) -> tuple[dict[str, np.ndarray], int, bool, bool, dict]:
+        """
+        Aplica a ação por `frame_skip` ticks (menos, se a partida terminar antes).
+
+        :return: observação, recompensa (pontos ganhos), terminado (fim de jogo ou vitória),
+            truncado (limite de ticks) e informações extras.
+        """
+        game = self._game
+        if game is None:
+            raise ValueError('Chame reset() antes de step().')
+
+        game.set_direction(action)
+        for _ in range(self._frame_skip):
+            game.step(1)
+            if game.game_state in (GameState.GAME_OVER, GameState.VICTORY):
+                break
+
+        self._refresh_observation()
+
+        score = game.score
+        reward = score - self._last_score
+        self._last_score = score
+
+        terminated = game.game_state in (GameState.GAME_OVER, GameState.VICTORY)
+        truncated = not terminated and game.ticks >= self._max_episode_ticks
+        return self._observation, reward, terminated, truncated, {}
+
+    def _refresh_observation(self) -> None:
+        manager = self._game.manager
+        observation = self._observation
+
+        pacman = manager.pacman
+        observation["pacman_position"][:] = pacman.fixed_position
+        observation["pacman_orientation"][()] = pacman.orientation
+
+        ghost_positions = observation["ghost_positions"]
+        ghost_orientations = observation["ghost_orientations"]
+        ghost_modes = observation["ghost_modes"]
+        for index, ghost in enumerate(manager.ghosts):
+            ghost_positions[index] = ghost.fixed_position
+            ghost_orientations[index] = ghost.orientation
+            ghost_modes[index] = ghost.mode.value
+
+        observation["game_state"][()] = manager.game_state.value
+        observation["lives"][()] = manager.lives
+        observation["score"][()] = pacman.total_points
+
+    @property
+    def game(self) -> Optional[HeadlessGame]:
+        return self._game
+
+class VectorPacManEnv:
+    """
+    N ambientes avançados juntos por um `BatchEngine`, com as mesmas chaves de observação do
+    `PacManEnv` acrescidas da dimensão das partidas.
+
+    As observações são os próprios arrays do motor (sem cópia) e mudam a cada `step`/`reset`.
+    Partidas que terminam ou são truncadas recomeçam sozinhas no mesmo `step`; a observação
+    final delas (uma cópia só dessas linhas) fica em `info["final_observation"]`.
+    """
+
+    _engine: BatchEngine
+    _frame_skip: int
+    _max_episode_ticks: int
+    _next_seed: Optional[int]
+    _last_scores: np.ndarray
+    _episode_ticks: np.ndarray
+    _observation: dict[str, np.ndarray]
+
+    def __init__(
+        self,
+        config_path: str,
+        n_envs: int,
+        width: int = 900,
+        height: int = 950,
+        fps: int = 60,
+        frame_skip: int = 1,
+        max_episode_ticks: int = 60 * 60 * 5
+    ) -> None:
+        if frame_skip <= 0: raise ValueError('O frame_skip deve ser positivo.')
+
+        self._engine = BatchEngine(config_path, n_envs, width, height, fps)
+        self._frame_skip = frame_skip
+        self._max_episode_ticks = max_episode_ticks
+        self._next_seed = None
+        self._last_scores = np.zeros(n_envs, dtype=np.int64)
+        self._episode_ticks = np.zeros(n_envs, dtype=np.int64)
+
+        engine = self._engine
+        self._observation = {
+            "pellets": engine.pellets,
+            "pacman_position": engine.pacman_positions,
+            "pacman_orientation": engine.pacman_orientations,
+            "ghost_positions": engine.ghost_positions,
+            "ghost_orientations": engine.ghost_orientations,
+            "ghost_modes": engine.ghost_modes,
+            "game_state": engine.game_states,
+            "lives": engine.lives,
+            "score": engine.scores
+        }
+
+    def reset(self, seed: Optional[int] = None) -> tuple[dict[str, np.ndarray], dict]:
+        """
+        Reinicia todas as partidas. Com `seed`, a partida i usa `seed + i`, e os recomeços
+        automáticos continuam a sequência a partir de `seed + N`.
+        """
+        n = self._engine.n_games
+        seeds = None if seed is None else list(range(seed, seed + n))
+        self._next_seed = None if seed is None else seed + n
+
+        self._engine.reset(seeds = seeds)
+        self._last_scores[:] = 0
+        self._episode_ticks[:] = 0
+        return self._observation, {}
+
+    def step(self, actions: Sequence[int]) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray, dict]:
+        """
+        :param actions: Uma ação por partida.
+        :return: observação, recompensas, terminados, truncados e informações extras, com uma
+            posição por partida.
+        """
+        engine = self._engine
+        engine.set_directions(actions)
+        engine.step(self._frame_skip)
+        self._episode_ticks += self._frame_skip
+
+        scores = engine.scores
+        rewards = scores - self._last_scores
+        self._last_scores[:] = scores
+
+        game_states = engine.game_states
+        terminated = (game_states == GAME_OVER) | (game_states == GAME_VICTORY)
+        truncated = ~terminated & (self._episode_ticks >= self._max_episode_ticks)
+
+        info = {}
+        done = np.flatnonzero(terminated | truncated)
+        if done.size:
+            info["final_observation"] = { key: value[done].copy() for key, value in self._observation.items() }
+            info["final_indices"] = done
+            self._reset_envs(done)
+
+        return self._observation, rewards, terminated, truncated, info
+
+    def _reset_envs(self, envs: np.ndarray) -> None:
+        seeds = None
+        if self._next_seed is not None:
+            seeds = list(range(self._next_seed, self._next_seed + envs.size))
+            self._next_seed += envs.size
+
+        self._engine.reset(envs, seeds)
+        self._last_scores[envs] = 0
+        self._episode_ticks[envs] = 0
+
+    @property
+    def n_envs(self) -> int:
+        return self._engine.n_games
+
+    @property
+    def engine(self) -> BatchEngine:
+        return self._engine
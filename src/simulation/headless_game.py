@@ -0,0 +1,153 @@
+import random
+from typing import Optional
+
+import pygame
+
+from src.core.clock import SimulationClock
+from src.core.game_builder import build_game_manager, default_maze_path
+from src.core.game_manager import GameManager
+from src.core.input_source import ScriptedInput
+from src.core.replay import ReplayLog, RecordingClock, RecordingInput, create_replay_log
+from src.core.states import GameState
+
+class HeadlessGame:
+    """ 
+    Executa o jogo sem janela, com um relógio simulado de passo fixo.
+    Cada tick avança o tempo em 1000 / fps milissegundos, sem esperar o tempo real.
+    """
+
+    _clock: SimulationClock
+    _input_source: ScriptedInput
+    _manager: GameManager
+    _tick_ms: float
+    _tick_seconds: float
+    _ticks: int
+    _seed: int
+    _replay_log: Optional[ReplayLog]
+    _shared_screens: dict[tuple[int, int], pygame.Surface] = {}
+
+    def __init__(
+        self, 
+        config_path: str, 
+        width: int = 900, 
+        height: int = 950, 
+        fps: int = 60, 
+        seed: Optional[int] = None,
+        input_source = None,
+        record: bool = False,
+        load_sprites: bool = False,
+        configs: Optional[dict[str, dict]] = None
+    ) -> None:
+        """
+        :param record: Se verdadeiro, grava a partida em um `ReplayLog` (ver `save_replay`).
+        :param load_sprites: Carrega as imagens reais, para quando a superfície for desenhada.
+        :param configs: Configurações já montadas por `load_entity_configs`, para não reler o
+            arquivo a cada partida.
+        """
+        if fps <= 0: raise ValueError('O fps da simulação deve ser positivo.')
+
+        pygame.font.init()
+
+        self._clock = SimulationClock()
+        self._input_source = input_source if input_source is not None else ScriptedInput()
+        self._tick_ms = 1000.0 / fps
+        self._tick_seconds = 1.0 / fps
+        self._ticks = 0
+        self._seed = seed if seed is not None else random.randrange(2 ** 32)
+
+        clock, manager_input = self._clock, self._input_source
+        self._replay_log = None
+        if record:
+            self._replay_log = create_replay_log(self._seed, config_path, default_maze_path(), width, height, fps)
+            clock = RecordingClock(clock, self._replay_log)
+            manager_input = RecordingInput(manager_input, self._replay_log)
+
+        self._manager = build_game_manager(
+            screen = self._shared_screen(width, height),
+            config_path = config_path,
+            clock = clock,
+            input_source = manager_input,
+            rng = random.Random(self._seed),
+            load_sprites = load_sprites,
+            configs = configs
+        )
+
+    def step(self, n_ticks: int = 1) -> int:
+        """
+        Avança a simulação em até `n_ticks` ticks.
+        
+        :return: Quantidade de ticks executados (menor que o pedido se o jogo terminar).
+        :rtype: int
+        """
+        manager = self._manager
+        executed = 0
+
+        while executed < n_ticks and not manager.is_finished:
+            self._clock.advance(self._tick_ms)
+            manager.update(self._tick_seconds)
+            executed += 1
+
+        self._ticks += executed
+        return executed
+
+    def run_until_finished(self, max_ticks: int) -> int:
+        """ Avança até o fim do jogo ou até `max_ticks`. """
+        return self.step(max_ticks)
+
+    def set_direction(self, direction: int) -> None:
+        """ Define a seta pressionada (0 = nenhuma). Requer a entrada padrão. """
+        self._input_source.set_direction(direction)
+
+    @classmethod
+    def _shared_screen(cls, width: int, height: int) -> pygame.Surface:
+        """ 
+        Superfície fora da tela compartilhada por todas as partidas do mesmo tamanho: 
+        a simulação não depende dos pixels, só das dimensões.
+        """
+        screen = cls._shared_screens.get((width, height))
+        if screen is None:
+            screen = cls._shared_screens[(width, height)] = pygame.Surface((width, height))
+        return screen
+
+    def save_replay(self, path: str) -> None:
+        """ Salva o replay da partida. Requer `record=True` na criação. """
+        if self._replay_log is None:
+            raise ValueError('A partida não está sendo gravada.')
+        self._replay_log.save(path)
+
+    @property
+    def replay_log(self) -> Optional[ReplayLog]:
+        return self._replay_log
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def manager(self) -> GameManager:
+        return self._manager
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def elapsed_ms(self) -> int:
+        return self._clock.get_ticks()
+
+    @property
+    def is_finished(self) -> bool:
+        return self._manager.is_finished
+
+    @property
+    def game_state(self) -> GameState:
+        return self._manager.game_state
+
+    @property
+    def score(self) -> int:
+        pacman = self._manager.entities[0] if self._manager.entities else None
+        return pacman.total_points if pacman else 0
+
+    @property
+    def lives(self) -> int:
+        return self._manager.lives
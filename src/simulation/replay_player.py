@@ -0,0 +1,95 @@
+import random
+from typing import Optional
+
+import pygame
+
+from src.core.game_builder import build_game_manager, default_maze_path
+from src.core.game_manager import GameManager
+from src.core.replay import ReplayLog, ReplayClock, ReplayInput, verify_replay_sources
+from src.core.states import GameState
+
+class ReplayPlayer:
+    """
+    Reproduz um replay sem janela, na velocidade máxima da CPU.
+    O relógio e a entrada vêm do log, e o RNG dos fantasmas usa a semente gravada.
+    """
+
+    _log: ReplayLog
+    _clock: ReplayClock
+    _input_source: ReplayInput
+    _manager: GameManager
+    _tick_seconds: float
+    _ticks: int
+
+    def __init__(self, replay: "str | ReplayLog", config_path: str, verify: bool = True) -> None:
+        """
+        :param replay: Caminho do arquivo de replay ou um log já carregado.
+        :param verify: Se verdadeiro, recusa configuração ou labirinto diferentes dos da gravação.
+        """
+        self._log = ReplayLog.load(replay) if isinstance(replay, str) else replay
+        if verify:
+            verify_replay_sources(self._log, config_path, default_maze_path())
+
+        pygame.font.init()
+
+        self._clock = ReplayClock(self._log)
+        self._input_source = ReplayInput(self._log)
+        self._tick_seconds = 1.0 / self._log.fps if self._log.fps > 0 else 0.0
+        self._ticks = 0
+
+        self._manager = build_game_manager(
+            screen = pygame.Surface((self._log.width, self._log.height)),
+            config_path = config_path,
+            clock = self._clock,
+            input_source = self._input_source,
+            rng = random.Random(self._log.seed),
+            load_sprites = False
+        )
+
+    def run(self, max_ticks: Optional[int] = None) -> int:
+        """
+        Executa até o fim do jogo, o fim das leituras gravadas ou `max_ticks`.
+
+        :return: Quantidade de ticks executados nesta chamada.
+        :rtype: int
+        """
+        manager = self._manager
+        executed = 0
+
+        while not manager.is_finished and not self._clock.exhausted:
+            if max_ticks is not None and executed >= max_ticks: break
+
+            manager.update(self._tick_seconds)
+            executed += 1
+
+        self._ticks += executed
+        return executed
+
+    @property
+    def log(self) -> ReplayLog:
+        return self._log
+
+    @property
+    def manager(self) -> GameManager:
+        return self._manager
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def is_finished(self) -> bool:
+        return self._manager.is_finished
+
+    @property
+    def game_state(self) -> GameState:
+        return self._manager.game_state
+
+    @property
+    def score(self) -> int:
+        pacman = self._manager.pacman
+        return pacman.total_points if pacman else 0
+
+    @property
+    def lives(self) -> int:
+        return self._manager.lives
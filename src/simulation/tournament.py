@@ -0,0 +1,320 @@
+import os
+import sys
+import math
+import time
+import random
+import argparse
+import multiprocessing
+from collections import deque
+from typing import Callable, Iterable, Iterator, Optional
+
+from src.core.game_builder import load_entity_configs
+from src.core.states import GameState
+from src.simulation.headless_game import HeadlessGame
+from src.world.fixed_point import UNITS_PER_TILE
+
+DIRECTION_OFFSETS: dict[int, tuple[int, int]] = { 1: (-1, 0), 2: (1, 0), 3: (0, -1), 4: (0, 1) }
+
+class RandomTurnAgent:
+    """
+    Anda em linha reta e, em cada tile novo, troca para uma direção aleatória com probabilidade
+    `turn_chance`; parado contra uma parede, sempre troca.
+    """
+
+    _rng: random.Random
+    _turn_chance: float
+    _direction: int
+    _last_tile: Optional[tuple[int, int]]
+
+    def __init__(self, seed: int, turn_chance: float = 0.25) -> None:
+        self._rng = random.Random(seed)
+        self._turn_chance = turn_chance
+        self._direction = self._rng.randint(1, 4)
+        self._last_tile = None
+
+    def act(self, game: HeadlessGame) -> int:
+        tile = pacman_tile(game)
+        stopped = game.manager.pacman.orientation == 0
+        if tile != self._last_tile or stopped:
+            self._last_tile = tile
+            if stopped or self._rng.random() < self._turn_chance:
+                self._direction = self._rng.randint(1, 4)
+        return self._direction
+
+class NearestPelletAgent:
+    """ Segue o caminho mais curto (busca em largura) até a pastilha mais próxima, recalculado a cada tile novo. """
+
+    _direction: int
+    _last_tile: Optional[tuple[int, int]]
+
+    def __init__(self, seed: int) -> None:
+        self._direction = 0
+        self._last_tile = None
+
+    def act(self, game: HeadlessGame) -> int:
+        tile = pacman_tile(game)
+        if tile != self._last_tile:
+            self._last_tile = tile
+            self._direction = self._first_step_to_pellet(game, *tile) or self._direction
+        return self._direction
+
+    @staticmethod
+    def _first_step_to_pellet(game: HeadlessGame, row: int, col: int) -> int:
+        maze = game.manager.maze
+        matrix = maze.matrix
+        cols = maze.cols
+
+        first_steps = { (row, col): 0 }
+        pending = deque([(row, col)])
+
+        while pending:
+            r, c = pending.popleft()
+            if matrix[r][c] in (1, 2) and (r, c) != (row, col):
+                return first_steps[(r, c)]
+
+            for direction, (dr, dc) in DIRECTION_OFFSETS.items():
+                if not maze.can_move(r, c, direction):
+                    continue
+                neighbor = (r + dr, (c + dc) % cols)
+                if neighbor not in first_steps:
+                    first_steps[neighbor] = first_steps[(r, c)] or direction
+                    pending.append(neighbor)
+
+        return 0
+
+AGENTS: dict[str, Callable] = {
+    "random": RandomTurnAgent,
+    "nearest_pellet": NearestPelletAgent
+}
+
+def pacman_tile(game: HeadlessGame) -> tuple[int, int]:
+    x, y = game.manager.pacman.fixed_position
+    return y // UNITS_PER_TILE, x // UNITS_PER_TILE
+
+class TournamentEntry:
+    """
+    Um participante: o agente que controla o Pac-Man e os ajustes de configuração (ex.: dos
+    fantasmas) aplicados sobre o arquivo base, no formato de `load_entity_configs`.
+
+    `agent_factory(seed)` cria um agente novo por partida, com `act(game) -> direção`; precisa
+    ser importável pelos processos (uma classe ou função de módulo).
+    """
+
+    name: str
+    agent_factory: Callable
+    overrides: dict
+
+    def __init__(self, name: str, agent_factory: Callable, overrides: Optional[dict] = None) -> None:
+        self.name = name
+        self.agent_factory = agent_factory
+        self.overrides = overrides or {}
+
+class GameResult:
+    """ Resultado de uma partida do torneio. """
+
+    entry: str
+    seed: int
+    score: int
+    lives: int
+    survival_ms: int
+    ticks: int
+    cleared: bool
+
+    def __init__(self, entry: str, seed: int, score: int, lives: int, survival_ms: int, ticks: int, cleared: bool) -> None:
+        self.entry = entry
+        self.seed = seed
+        self.score = score
+        self.lives = lives
+        self.survival_ms = survival_ms
+        self.ticks = ticks
+        self.cleared = cleared
+
+class EntryStats:
+    """ Estatísticas acumuladas de um participante (média e desvio padrão por Welford). """
+
+    games: int
+    cleared: int
+    best_score: int
+    _score_mean: float
+    _score_m2: float
+    _survival_mean: float
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.cleared = 0
+        self.best_score = 0
+        self._score_mean = 0.0
+        self._score_m2 = 0.0
+        self._survival_mean = 0.0
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.cleared += result.cleared
+        self.best_score = max(self.best_score, result.score)
+
+        delta = result.score - self._score_mean
+        self._score_mean += delta / self.games
+        self._score_m2 += delta * (result.score - self._score_mean)
+        self._survival_mean += (result.survival_ms - self._survival_mean) / self.games
+
+    @property
+    def mean_score(self) -> float:
+        return self._score_mean
+
+    @property
+    def score_stdev(self) -> float:
+        return math.sqrt(self._score_m2 / (self.games - 1)) if self.games > 1 else 0.0
+
+    @property
+    def mean_survival_seconds(self) -> float:
+        return self._survival_mean / 1000.0
+
+    @property
+    def clear_rate(self) -> float:
+        return self.cleared / self.games if self.games else 0.0
+
+# Estado de cada processo do pool, montado uma vez por `_init_worker`.
+_worker_state: dict = {}
+
+def _init_worker(config_path: str, entries: list[TournamentEntry], width: int, height: int, fps: int, max_ticks: int) -> None:
+    _worker_state.update(
+        entries = entries,
+        configs = [load_entity_configs(config_path, entry.overrides) for entry in entries],
+        config_path = config_path,
+        size = (width, height),
+        fps = fps,
+        max_ticks = max_ticks
+    )
+
+def _play_game(job: tuple[int, int]) -> GameResult:
+    entry_index, seed = job
+    state = _worker_state
+    entry: TournamentEntry = state["entries"][entry_index]
+    width, height = state["size"]
+
+    game = HeadlessGame(
+        state["config_path"], width, height, state["fps"], seed = seed, configs = state["configs"][entry_index]
+    )
+    agent = entry.agent_factory(seed)
+    max_ticks = state["max_ticks"]
+
+    # A partida acaba na tela de fim de jogo; o tempo de sobrevivência não conta essa tela.
+    playing = True
+    while playing and game.ticks < max_ticks:
+        game.set_direction(agent.act(game))
+        game.step(1)
+        playing = game.game_state not in (GameState.GAME_OVER, GameState.VICTORY)
+
+    return GameResult(
+        entry = entry.name,
+        seed = seed,
+        score = game.score,
+        lives = game.lives,
+        survival_ms = game.elapsed_ms,
+        ticks = game.ticks,
+        cleared = game.game_state == GameState.VICTORY
+    )
+
+class Tournament:
+    """
+    Roda partidas sem janela de vários participantes, com as mesmas sementes, em um pool de
+    processos. Cada processo lê a configuração de cada participante uma vez e reaproveita o
+    labirinto (tabelas compartilhadas do `Maze`) em todas as suas partidas; os resultados
+    chegam um a um, na ordem em que terminam.
+    """
+
+    _config_path: str
+    _entries: list[TournamentEntry]
+    _width: int
+    _height: int
+    _fps: int
+    _max_ticks: int
+
+    def __init__(
+        self,
+        config_path: str,
+        entries: list[TournamentEntry],
+        width: int = 900,
+        height: int = 950,
+        fps: int = 60,
+        max_ticks: int = 60 * 60 * 5
+    ) -> None:
+        """
+        :param max_ticks: Limite de ticks por partida (por padrão, 5 minutos simulados).
+        """
+        if not entries: raise ValueError('O torneio precisa de pelo menos um participante.')
+        if len({ entry.name for entry in entries }) != len(entries):
+            raise ValueError('Os nomes dos participantes devem ser únicos.')
+
+        self._config_path = config_path
+        self._entries = entries
+        self._width = width
+        self._height = height
+        self._fps = fps
+        self._max_ticks = max_ticks
+
+    def run(self, seeds: Iterable[int], processes: Optional[int] = None, chunksize: Optional[int] = None) -> Iterator[GameResult]:
+        """
+        Joga cada semente com cada participante.
+
+        :param processes: Processos do pool (None = número de CPUs). Com 1, roda no próprio processo.
+        :param chunksize: Partidas enviadas por vez a cada processo (None = automático).
+        :return: Gerador com os resultados, na ordem em que as partidas terminam.
+        """
+        jobs = [(entry_index, seed) for seed in seeds for entry_index in range(len(self._entries))]
+        processes = processes or os.cpu_count() or 1
+        init_args = (self._config_path, self._entries, self._width, self._height, self._fps, self._max_ticks)
+
+        if processes == 1:
+            _init_worker(*init_args)
+            for job in jobs:
+                yield _play_game(job)
+            return
+
+        if chunksize is None:
+            chunksize = max(1, len(jobs) // (processes * 8))
+
+        with multiprocessing.Pool(processes, initializer = _init_worker, initargs = init_args) as pool:
+            yield from pool.imap_unordered(_play_game, jobs, chunksize)
+
+    def summarize(self, results: Iterable[GameResult]) -> dict[str, EntryStats]:
+        """ Agrega os resultados por participante, na ordem dos participantes. """
+        stats = { entry.name: EntryStats() for entry in self._entries }
+        for result in results:
+            stats[result.entry].add(result)
+        return stats
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Torneio de agentes e configurações de fantasmas, em paralelo.")
+    parser.add_argument("--config", default=os.path.join("data", "settings", "config.json"))
+    parser.add_argument("--agents", nargs="+", default=list(AGENTS), choices=list(AGENTS))
+    parser.add_argument("--games", type=int, default=100, help="partidas (sementes) por participante")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--max-ticks", type=int, default=60 * 60 * 5)
+    args = parser.parse_args(argv)
+
+    tournament = Tournament(
+        args.config,
+        [TournamentEntry(name, AGENTS[name]) for name in args.agents],
+        max_ticks = args.max_ticks
+    )
+
+    start = time.perf_counter()
+    stats = tournament.summarize(tournament.run(range(args.first_seed, args.first_seed + args.games), args.processes))
+    elapsed = time.perf_counter() - start
+
+    total_games = sum(entry_stats.games for entry_stats in stats.values())
+    print(f"{'participante':<16}{'partidas':>9}{'pontos (média ± dp)':>24}{'sobrevivência':>15}{'limpos':>9}")
+    for name, entry_stats in stats.items():
+        score = f"{entry_stats.mean_score:.1f} ± {entry_stats.score_stdev:.1f}"
+        print(
+            f"{name:<16}{entry_stats.games:>9}{score:>24}"
+            f"{entry_stats.mean_survival_seconds:>14.1f}s{entry_stats.clear_rate:>9.1%}"
+        )
+    print(f"{total_games} partidas em {elapsed:.2f} s ({total_games / elapsed:.1f} partidas/s)")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
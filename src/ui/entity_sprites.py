@@ -0,0 +1,60 @@
+from typing import Optional
+
+import pygame
+
+from src.core.states import GhostState
+
+class PacManSprites:
+    """ Quadros do Pac-Man já girados para cada orientação; desenha a partir do estado da entidade. """
+
+    _rotated_frames: dict[int, list[pygame.Surface]]
+
+    ORIENTATION_ANGLES: dict = { 0: 0, 1: 90, 2: -90, 3: 180, 4: 0 }
+
+    def __init__(self, rotated_frames: dict[int, list[pygame.Surface]]) -> None:
+        """
+        :param rotated_frames: Quadros da animação para cada orientação (0 a 4).
+        """
+        self._rotated_frames = rotated_frames
+
+    def draw(self, screen: pygame.Surface, pacman, alpha: float = 1.0) -> None:
+        """ :param alpha: Fração do tempo entre o tick anterior e o atual (ver `Entity.interpolated_position`). """
+        sprite, center = self.placement(pacman, alpha)
+        screen.blit(sprite, sprite.get_rect(center=center))
+
+    def placement(self, pacman, alpha: float = 1.0) -> tuple[pygame.Surface, tuple[int, int]]:
+        """ Quadro e centro, em pixels, em que o Pac-Man seria desenhado. """
+        sprite = self._rotated_frames[pacman.orientation][pacman.animation_frame]
+        position = pacman.interpolated_position(alpha)
+        return sprite, (int(position.x), int(position.y))
+
+class GhostSprites:
+    """ Quadros de um fantasma por direção, além dos de vulnerabilidade e dos olhos (compartilháveis). """
+
+    _directional: dict[int, pygame.Surface]
+    _vulnerable: list[pygame.Surface]
+    _eaten: dict[int, pygame.Surface]
+
+    def __init__(self, directional: dict[int, pygame.Surface], vulnerable: list[pygame.Surface], eaten: dict[int, pygame.Surface]) -> None:
+        self._directional = directional
+        self._vulnerable = vulnerable
+        self._eaten = eaten
+
+    def draw(self, screen: pygame.Surface, ghost, alpha: float = 1.0) -> None:
+        sprite, center = self.placement(ghost, alpha)
+        if sprite:
+            screen.blit(sprite, sprite.get_rect(center=center))
+
+    def placement(self, ghost, alpha: float = 1.0) -> tuple[Optional[pygame.Surface], tuple[int, int]]:
+        """ Quadro (None se não houver um para a orientação) e centro, em pixels, do fantasma. """
+        mode = ghost.mode
+
+        if mode == GhostState.VULNERABLE:
+            sprite = self._vulnerable[ghost.vulnerable_frame]
+        elif mode == GhostState.EATEN:
+            sprite = self._eaten.get(ghost.orientation)
+        else:
+            sprite = self._directional.get(ghost.orientation)
+
+        position = ghost.interpolated_position(alpha)
+        return sprite, (int(position.x), int(position.y))
@@ -1,22 +1,46 @@
+from typing import Optional
+
 import pygame
 
 from src.core.states import GameState
+from src.core.profiler import FrameProfiler
 
 class GameRenderer:
 
     _screen: pygame.Surface
+    _pellet_layer: Optional[pygame.Surface]
+    _pellet_layer_maze: object
+    _profiler: Optional[FrameProfiler]
+    _entity_sprites: dict[object, object]
     
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, profiler: Optional[FrameProfiler] = None):
         self._screen = screen
+        self._profiler = profiler
+        self._entity_sprites = {}
+        self._pellet_layer = None
+        self._pellet_layer_maze = None
+
+    def render(self, maze, entities, hud, game_state, score, lives, alpha: float = 1.0):
+        """ :param alpha: Interpolação das entidades entre o tick anterior e o atual (1 = posição atual). """
+        profiler = self._profiler
+        timed = profiler is not None and profiler.enabled
+        if timed: start = profiler.now()
 
-    def render(self, maze, entities, hud, game_state, score, lives):
         self._screen.fill('black')
-        self._screen.blit(maze.wall_surface, (0, 0))
+        if timed: start = profiler.lap("render.clear", start)
 
         self._draw_pellets(maze)
+        if timed: start = profiler.lap("render.pellets", start)
+
+        self._screen.blit(maze.wall_surface, (0, 0))
+        if timed: start = profiler.lap("render.walls", start)
         
+        entity_sprites = self._entity_sprites
         for entity in entities:
-            entity.draw(self._screen)
+            sprites = entity_sprites.get(entity)
+            if sprites is not None:
+                sprites.draw(self._screen, entity, alpha)
+        if timed: start = profiler.lap("render.entities", start)
             
         hud.draw_score(score, lives)
         
@@ -24,8 +48,50 @@ class GameRenderer:
             hud.draw_game_over()
         elif game_state == GameState.VICTORY:
             hud.draw_victory()
+        if timed: profiler.lap("render.hud", start)
+
+    def frame_signature(self, maze, entities, game_state, score, lives, alpha: float = 1.0) -> tuple:
+        """
+        Resumo do que `render` desenharia: o quadro e o centro de cada sprite, as pastilhas
+        restantes e o placar. Dois quadros com a mesma assinatura são iguais na tela.
+        """
+        entity_sprites = self._entity_sprites
+        placements = tuple(
+            sprites.placement(entity, alpha)
+            for entity in entities
+            if (sprites := entity_sprites.get(entity)) is not None
+        )
+        return game_state, score, lives, maze.total_tablets, placements
+
+    def register_sprites(self, entity, sprites) -> None:
+        """ Associa à entidade o conjunto de sprites (com os métodos `draw(screen, entity, alpha)` e `placement(entity, alpha)`) usado para desenhá-la. """
+        self._entity_sprites[entity] = sprites
+
+    def unregister_sprites(self, entity) -> None:
+        self._entity_sprites.pop(entity, None)
+
+    def invalidate_pellet_layer(self) -> None:
+        """ Força a reconstrução completa da camada de pastilhas no próximo quadro. """
+        self._pellet_layer = None
 
     def _draw_pellets(self, maze):
+        """ 
+        Desenha a camada pré-renderizada de pastilhas. 
+        Apenas os tiles comidos desde o último quadro são apagados dela.
+        """
+        if self._pellet_layer is None or self._pellet_layer_maze is not maze:
+            self._build_pellet_layer(maze)
+        else:
+            for row, col in maze.consume_eaten_cells():
+                self._erase_pellet(maze, row, col)
+
+        self._screen.blit(self._pellet_layer, (0, 0))
+
+    def _build_pellet_layer(self, maze):
+        layer = pygame.Surface((maze.cols * maze.cell_width, maze.rows * maze.cell_height))
+        layer.fill('black')
+        maze.consume_eaten_cells()
+
         for row in range(maze.rows):
             for col in range(maze.cols):
                 val = maze.matrix[row][col]
@@ -35,6 +101,13 @@ class GameRenderer:
                     y = row * maze.cell_height + maze.cell_height // 2
                     
                     if val == 1:
-                        pygame.draw.circle(self._screen, maze.small_pellet_color, (x, y), maze.small_pellet_radius)
+                        pygame.draw.circle(layer, maze.small_pellet_color, (x, y), maze.small_pellet_radius)
                     else:
-                        pygame.draw.circle(self._screen, maze.power_pellet_color, (x, y), maze.power_pellet_radius)
\ No newline at end of file
+                        pygame.draw.circle(layer, maze.power_pellet_color, (x, y), maze.power_pellet_radius)
+
+        self._pellet_layer = layer
+        self._pellet_layer_maze = maze
+
+    def _erase_pellet(self, maze, row: int, col: int):
+        cell_rect = (col * maze.cell_width, row * maze.cell_height, maze.cell_width, maze.cell_height)
+        self._pellet_layer.fill('black', cell_rect)
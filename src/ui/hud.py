@@ -1,5 +1,52 @@
+from typing import Optional
+
 import pygame
 
+class GlyphStrip:
+    """
+    Dígitos 0-9 renderizados uma única vez, lado a lado, em uma única faixa.
+    Permite montar números apenas com cópias de superfície, sem renderizar texto.
+    """
+
+    _strip: pygame.Surface
+    _glyph_rects: dict[str, pygame.Rect]
+
+    DIGITS: str = "0123456789"
+
+    def __init__(self, font: pygame.font.Font, color: str) -> None:
+        glyphs = [font.render(digit, True, color) for digit in self.DIGITS]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        height = max(glyph.get_height() for glyph in glyphs)
+
+        self._strip = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._glyph_rects = {}
+
+        x = 0
+        for digit, glyph in zip(self.DIGITS, glyphs):
+            self._strip.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._glyph_rects[digit] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width()
+
+    def compose(self, prefix: pygame.Surface, value: int) -> Optional[pygame.Surface]:
+        """ Superfície com o prefixo seguido dos dígitos do valor, ou None se o valor não for um inteiro positivo. """
+        digits = str(value)
+        if not digits.isdigit():
+            return None
+
+        rects = [self._glyph_rects[digit] for digit in digits]
+        width = prefix.get_width() + sum(rect.width for rect in rects)
+        height = max(prefix.get_height(), self._strip.get_height())
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.blit(prefix, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+
+        x = prefix.get_width()
+        for rect in rects:
+            surface.blit(self._strip, (x, 0), area=rect, special_flags=pygame.BLEND_RGBA_MAX)
+            x += rect.width
+
+        return surface
+
 class HUD:
 
     _text_font_size: int
@@ -14,6 +61,15 @@ class HUD:
     _screen_height: int
     _text_font: pygame.font.Font
     _game_over_font: pygame.font.Font
+    _score_glyphs: GlyphStrip
+    _lives_glyphs: GlyphStrip
+    _score_label: pygame.Surface
+    _lives_label: pygame.Surface
+    _score_value: Optional[int]
+    _lives_value: Optional[int]
+    _score_surface: Optional[pygame.Surface]
+    _lives_surface: Optional[pygame.Surface]
+    _message_surfaces: dict[tuple[str, str], pygame.Surface]
 
     def __init__(self, screen: pygame.Surface, config: dict):
         font_config: dict = config.get("font_size", {})
@@ -33,6 +89,7 @@ class HUD:
         self._screen_height = screen.get_height()
 
         self._initialize_fonts()
+        self._initialize_text_cache()
 
     def draw_score(self, score: int, lives: int):
         self._draw_score_text(score)
@@ -53,17 +110,46 @@ class HUD:
             self._text_font = pygame.font.SysFont(default_font, self._text_font_size)
             self._game_over_font = pygame.font.SysFont(default_font, self._game_over_font_size)
 
+    def _initialize_text_cache(self):
+        """ Pré-renderiza os rótulos e as faixas de dígitos; os textos só são remontados quando o valor muda. """
+        self._score_glyphs = GlyphStrip(self._text_font, self._score_color)
+        self._lives_glyphs = GlyphStrip(self._text_font, self._lives_color)
+        self._score_label = self._text_font.render("SCORE: ", True, self._score_color)
+        self._lives_label = self._text_font.render("LIVES: ", True, self._lives_color)
+
+        self._score_value = None
+        self._lives_value = None
+        self._score_surface = None
+        self._lives_surface = None
+        self._message_surfaces = {}
+
     def _draw_score_text(self, score: int):
-        text_surface = self._text_font.render(f"SCORE: {score}", True, self._score_color)
-        text_rect = text_surface.get_rect(topleft=(self._padding, self._padding))
-        self._screen.blit(text_surface, text_rect)
+        if self._score_surface is None or score != self._score_value:
+            self._score_surface = self._compose_counter(self._score_glyphs, self._score_label, "SCORE: ", score, self._score_color)
+            self._score_value = score
+
+        text_rect = self._score_surface.get_rect(topleft=(self._padding, self._padding))
+        self._screen.blit(self._score_surface, text_rect)
 
     def _draw_lives_text(self, lives: int):
-        lives_surface = self._text_font.render(f"LIVES: {lives}", True, self._lives_color)
-        lives_rect = lives_surface.get_rect(topright=(self._screen_width - self._padding, self._padding))
-        self._screen.blit(lives_surface, lives_rect)
+        if self._lives_surface is None or lives != self._lives_value:
+            self._lives_surface = self._compose_counter(self._lives_glyphs, self._lives_label, "LIVES: ", lives, self._lives_color)
+            self._lives_value = lives
+
+        lives_rect = self._lives_surface.get_rect(topright=(self._screen_width - self._padding, self._padding))
+        self._screen.blit(self._lives_surface, lives_rect)
+
+    def _compose_counter(self, glyphs: GlyphStrip, label: pygame.Surface, label_text: str, value: int, color: str) -> pygame.Surface:
+        surface = glyphs.compose(label, value)
+        if surface is None:
+            surface = self._text_font.render(f"{label_text}{value}", True, color)
+        return surface
 
     def _draw_centered_message(self, message: str, color: str):
-        text_surface = self._game_over_font.render(message, True, color)
+        text_surface = self._message_surfaces.get((message, color))
+        if text_surface is None:
+            text_surface = self._game_over_font.render(message, True, color)
+            self._message_surfaces[(message, color)] = text_surface
+
         text_rect = text_surface.get_rect(center=(self._screen_width // 2, self._screen_height // 2))
         self._screen.blit(text_surface, text_rect)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import pygame
+
+class LoadingScreen:
+    """
+    Tela de carregamento com uma barra de progresso. Entre o primeiro e o último arquivo, só é
+    redesenhada a cada `min_interval_ms`, para que a troca de quadros não atrase o carregamento.
+    """
+
+    _screen: pygame.Surface
+    _font: pygame.font.Font
+    _bar_color: str
+    _text_color: str
+    _min_interval_ms: int
+    _last_draw_ms: int
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        font_size: int = 36,
+        bar_color: str = "yellow",
+        text_color: str = "white",
+        min_interval_ms: int = 33
+    ) -> None:
+        self._screen = screen
+        self._bar_color = bar_color
+        self._text_color = text_color
+        self._min_interval_ms = min_interval_ms
+        self._last_draw_ms = -min_interval_ms
+
+        try:
+            self._font = pygame.font.Font(None, font_size)
+        except IOError:
+            self._font = pygame.font.SysFont(pygame.font.get_default_font(), font_size)
+
+    def draw(self, done: int, total: int, name: str = "") -> None:
+        """ Desenha o progresso e atualiza a janela (o formato serve de callback do `AssetPipeline`). """
+        now_ms = pygame.time.get_ticks()
+        if 0 < done < total and now_ms - self._last_draw_ms < self._min_interval_ms:
+            pygame.event.pump()
+            return
+        self._last_draw_ms = now_ms
+
+        width, height = self._screen.get_size()
+        bar = pygame.Rect(0, 0, width // 2, 16)
+        bar.center = (width // 2, height // 2)
+
+        self._screen.fill("black")
+
+        label = self._font.render(f"CARREGANDO  {done}/{total}", True, self._text_color)
+        self._screen.blit(label, label.get_rect(midbottom = (bar.centerx, bar.top - 12)))
+
+        pygame.draw.rect(self._screen, self._bar_color, bar, 1)
+        if total > 0 and done > 0:
+            filled = bar.inflate(-4, -4)
+            filled.width = max(1, filled.width * done // total)
+            pygame.draw.rect(self._screen, self._bar_color, filled)
+
+        pygame.display.flip()
+        pygame.event.pump()
@@ -0,0 +1,168 @@
+from typing import Optional, Sequence
+
+import numpy as np
+import pygame
+
+from src.core.states import GhostState
+from src.world.fixed_point import UNITS_PER_TILE
+
+PACMAN_COLOR: tuple[int, int, int] = (255, 255, 0)
+GHOST_COLORS: tuple[tuple[int, int, int], ...] = ((255, 0, 0), (255, 184, 255), (0, 255, 255), (255, 184, 82))
+VULNERABLE_COLOR: tuple[int, int, int] = (33, 33, 255)
+EATEN_COLOR: tuple[int, int, int] = (255, 255, 255)
+
+class ObservationRenderer:
+    """
+    Desenha quadros pequenos (ex.: 84x84, ou um pixel por tile) para agentes que aprendem por
+    imagem, sem passar pelo `GameRenderer` nem pela janela.
+
+    Tudo é feito com NumPy direto no array de saída, (N, altura, largura, 3) em RGB uint8:
+    as paredes e a porta vêm de um fundo estático calculado uma vez; as pastilhas e as
+    entidades (retângulos do tamanho de um tile, nas cores de cada uma) são desenhadas por cima
+    a cada quadro. O array devolvido é o próprio buffer desenhado, sem cópias; `as_surface`
+    o embrulha em uma superfície do pygame, também sem cópia, para visualização.
+    """
+
+    _width: int
+    _height: int
+    _rows: int
+    _cols: int
+    _tile_rows: np.ndarray
+    _tile_cols: np.ndarray
+    _pellet_pixels: np.ndarray
+    _background: np.ndarray
+    _small_pellet_color: np.ndarray
+    _power_pellet_color: np.ndarray
+    _ghost_palette: np.ndarray
+    _entity_width: int
+    _entity_height: int
+    _buffer: Optional[np.ndarray]
+
+    def __init__(self, maze, size: tuple[int, int] = (84, 84)) -> None:
+        """
+        :param maze: `Maze` com o layout e as cores (de qualquer partida com o mesmo labirinto).
+        :param size: (largura, altura) do quadro; (colunas, linhas) dá um pixel por tile.
+        """
+        width, height = size
+        if width <= 0 or height <= 0: raise ValueError('O tamanho do quadro deve ser positivo.')
+
+        self._width, self._height = width, height
+        self._rows, self._cols = maze.rows, maze.cols
+        self._buffer = None
+
+        # Tile de cada linha e coluna de pixels, e os pixels mais próximos do centro de cada tile.
+        self._tile_rows = np.arange(height) * self._rows // height
+        self._tile_cols = np.arange(width) * self._cols // width
+        center_rows = np.zeros(height, dtype=bool)
+        center_cols = np.zeros(width, dtype=bool)
+        center_rows[(2 * np.arange(self._rows) + 1) * height // (2 * self._rows)] = True
+        center_cols[(2 * np.arange(self._cols) + 1) * width // (2 * self._cols)] = True
+        self._pellet_pixels = center_rows[:, None] & center_cols[None, :]
+
+        self._background = self._build_background(maze)
+        self._small_pellet_color = np.array(pygame.Color(maze.small_pellet_color)[:3], dtype=np.uint8)
+        self._power_pellet_color = np.array(pygame.Color(maze.power_pellet_color)[:3], dtype=np.uint8)
+
+        modes = max(state.value for state in GhostState) + 1
+        self._ghost_palette = np.array([[color] * modes for color in GHOST_COLORS], dtype=np.uint8)
+        self._ghost_palette[:, GhostState.VULNERABLE.value] = VULNERABLE_COLOR
+        self._ghost_palette[:, GhostState.EATEN.value] = EATEN_COLOR
+
+        self._entity_width = max(1, round(width / self._cols))
+        self._entity_height = max(1, round(height / self._rows))
+
+    def _build_background(self, maze) -> np.ndarray:
+        layout = np.array(maze.maze_layout, dtype=np.int16)
+
+        tile_colors = np.zeros((self._rows, self._cols, 3), dtype=np.uint8)
+        tile_colors[layout >= 3] = pygame.Color(maze.wall_color)[:3]
+        tile_colors[layout == maze.door_code] = pygame.Color(maze.door_color)[:3]
+
+        return tile_colors[self._tile_rows[:, None], self._tile_cols[None, :]]
+
+    def render(self, manager, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """ Quadro de uma partida (`GameManager`), (altura, largura, 3). """
+        return self.render_games([manager], None if out is None else out[None])[0]
+
+    def render_games(self, managers: Sequence, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """ Quadros de várias partidas sem janela (`GameManager`), (N, altura, largura, 3). """
+        ghosts = len(GHOST_COLORS)
+        pellets = np.stack([manager.maze.pellet_grid for manager in managers])
+        pacman_positions = np.array([manager.pacman.fixed_position for manager in managers], dtype=np.int64)
+        ghost_positions = np.array(
+            [[ghost.fixed_position for ghost in manager.ghosts[:ghosts]] for manager in managers], dtype=np.int64
+        ).reshape(len(managers), -1, 2)
+        ghost_modes = np.array(
+            [[ghost.mode.value for ghost in manager.ghosts[:ghosts]] for manager in managers], dtype=np.int64
+        ).reshape(len(managers), -1)
+
+        return self.render_state(pellets, pacman_positions, ghost_positions, ghost_modes, out)
+
+    def render_batch(self, engine, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """ Quadros de todas as partidas de um `BatchEngine`, (N, altura, largura, 3), sem laço em Python por partida. """
+        return self.render_state(engine.pellets, engine.pacman_positions, engine.ghost_positions, engine.ghost_modes, out)
+
+    def render_state(
+        self,
+        pellets: np.ndarray,
+        pacman_positions: np.ndarray,
+        ghost_positions: np.ndarray,
+        ghost_modes: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Quadros a partir dos arrays de estado: grades (N, linhas, colunas), posições fixas do
+        Pac-Man (N, 2) e dos fantasmas (N, F, 2) e modos dos fantasmas (N, F).
+        """
+        n = pellets.shape[0]
+        out = self._output_buffer(n, out)
+
+        np.copyto(out, self._background)
+
+        tiles = pellets[:, self._tile_rows[:, None], self._tile_cols[None, :]]
+        out[(tiles == 1) & self._pellet_pixels] = self._small_pellet_color
+        out[tiles == 2] = self._power_pellet_color
+
+        for ghost in range(ghost_positions.shape[1]):
+            colors = self._ghost_palette[ghost, ghost_modes[:, ghost]]
+            self._draw_entities(out, ghost_positions[:, ghost], colors)
+        self._draw_entities(out, pacman_positions, np.broadcast_to(np.array(PACMAN_COLOR, dtype=np.uint8), (n, 3)))
+
+        return out
+
+    def _draw_entities(self, out: np.ndarray, positions: np.ndarray, colors: np.ndarray) -> None:
+        """ Um retângulo do tamanho de um tile por partida, centrado em cada posição fixa. """
+        n = positions.shape[0]
+        left = positions[:, 0] * self._width // (self._cols * UNITS_PER_TILE) - self._entity_width // 2
+        top = positions[:, 1] * self._height // (self._rows * UNITS_PER_TILE) - self._entity_height // 2
+
+        shape = (n, self._entity_height, self._entity_width)
+        xs = np.broadcast_to(left[:, None, None] + np.arange(self._entity_width), shape).ravel()
+        ys = np.broadcast_to(top[:, None, None] + np.arange(self._entity_height)[:, None], shape).ravel()
+        games = np.repeat(np.arange(n), self._entity_height * self._entity_width)
+
+        # No túnel, parte do retângulo pode ficar fora do quadro.
+        inside = (xs >= 0) & (xs < self._width) & (ys >= 0) & (ys < self._height)
+        games, ys, xs = games[inside], ys[inside], xs[inside]
+        out[games, ys, xs] = colors[games]
+
+    def _output_buffer(self, n: int, out: Optional[np.ndarray]) -> np.ndarray:
+        shape = (n, self._height, self._width, 3)
+        if out is not None:
+            if out.shape != shape or out.dtype != np.uint8:
+                raise ValueError(f'O buffer de saída deve ter forma {shape} e tipo uint8.')
+            return out
+
+        if self._buffer is None or self._buffer.shape != shape:
+            self._buffer = np.empty(shape, dtype=np.uint8)
+        return self._buffer
+
+    @staticmethod
+    def as_surface(frame: np.ndarray) -> pygame.Surface:
+        """ Superfície RGB que lê os pixels direto de um quadro (altura, largura, 3) contíguo, sem cópia. """
+        height, width = frame.shape[:2]
+        return pygame.image.frombuffer(frame, (width, height), "RGB")
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._width, self._height
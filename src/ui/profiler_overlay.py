@@ -0,0 +1,68 @@
+from typing import Optional
+
+import pygame
+
+from src.core.profiler import FrameProfiler
+
+class ProfilerOverlay:
+    """
+    Painel sobreposto com o p50 e o p99 (em ms) de cada etapa medida pelo profiler.
+    O texto é recalculado só a cada `refresh_frames` quadros.
+    """
+
+    _screen: pygame.Surface
+    _profiler: FrameProfiler
+    _font: pygame.font.Font
+    _refresh_frames: int
+    _frames_until_refresh: int
+    _panel: Optional[pygame.Surface]
+    _padding: int
+
+    def __init__(self, screen: pygame.Surface, profiler: FrameProfiler, refresh_frames: int = 30, font_size: int = 20) -> None:
+        self._screen = screen
+        self._profiler = profiler
+        self._refresh_frames = max(1, refresh_frames)
+        self._frames_until_refresh = 0
+        self._panel = None
+        self._padding = 6
+
+        try:
+            self._font = pygame.font.Font(None, font_size)
+        except IOError:
+            self._font = pygame.font.SysFont(pygame.font.get_default_font(), font_size)
+
+    def draw(self) -> None:
+        if self._frames_until_refresh <= 0 or self._panel is None:
+            self._panel = self._build_panel()
+            self._frames_until_refresh = self._refresh_frames
+        self._frames_until_refresh -= 1
+
+        self._screen.blit(self._panel, (self._padding, self._screen.get_height() - self._panel.get_height() - self._padding))
+
+    def _build_panel(self) -> pygame.Surface:
+        rows = [("etapa", "p50 ms", "p99 ms")]
+        for stage in self._profiler.stages:
+            p50, p99 = self._profiler.percentiles(stage, 50, 99)
+            rows.append((stage, f"{p50:.2f}", f"{p99:.2f}"))
+
+        rendered = [[self._font.render(text, True, "white") for text in row] for row in rows]
+        column_widths = [max(cells[i].get_width() for cells in rendered) for i in range(3)]
+        gap = 3 * self._padding
+        line_height = self._font.get_linesize()
+
+        width = sum(column_widths) + 2 * gap + 2 * self._padding
+        height = line_height * len(rendered) + 2 * self._padding
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+
+        for index, (name, p50, p99) in enumerate(rendered):
+            y = self._padding + index * line_height
+            p50_right = self._padding + column_widths[0] + gap + column_widths[1]
+            p99_right = p50_right + gap + column_widths[2]
+
+            panel.blit(name, (self._padding, y))
+            panel.blit(p50, (p50_right - p50.get_width(), y))
+            panel.blit(p99, (p99_right - p99.get_width(), y))
+
+        return panel
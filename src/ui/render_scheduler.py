@@ -0,0 +1,81 @@
+from typing import Hashable, Optional
+
+class RenderScheduler:
+    """
+    Decide, a cada volta do laço da janela, se o quadro deve ser desenhado.
+
+    Um quadro só é desenhado quando a assinatura do que aparece na tela (ver
+    `GameRenderer.frame_signature`) mudou desde o último quadro desenhado, ou quando a tela
+    foi invalidada (`invalidate`). Assim a tela de fim de jogo ou um Pac-Man parado com os
+    fantasmas na casa não custam desenho nem troca de quadro.
+
+    Quando o laço atrasa (o último intervalo passou do esperado em mais de um tick), os
+    quadros são descartados antes dos ticks da simulação, até `max_skipped_frames` seguidos.
+    """
+
+    _frame_interval_ms: float
+    _late_threshold_ms: float
+    _max_skipped_frames: int
+    _last_signature: Optional[Hashable]
+    _invalidated: bool
+    _skipped_in_row: int
+    _drawn_frames: int
+    _idle_frames: int
+    _dropped_frames: int
+
+    def __init__(self, fps: int, tick_ms: float, max_skipped_frames: int = 4) -> None:
+        """
+        :param fps: Limite de quadros por segundo do laço (intervalo esperado entre quadros).
+        :param tick_ms: Duração de um tick; um atraso maior que ela conta como sobrecarga.
+        :param max_skipped_frames: Quadros seguidos que podem ser descartados por atraso.
+        """
+        if fps <= 0: raise ValueError('O fps deve ser positivo.')
+
+        self._frame_interval_ms = 1000.0 / fps
+        self._late_threshold_ms = tick_ms
+        self._max_skipped_frames = max(0, max_skipped_frames)
+        self._last_signature = None
+        self._invalidated = True
+        self._skipped_in_row = 0
+        self._drawn_frames = 0
+        self._idle_frames = 0
+        self._dropped_frames = 0
+
+    def invalidate(self) -> None:
+        """ Força o desenho do próximo quadro (janela exposta, painel do profiler etc.). """
+        self._invalidated = True
+
+    def should_draw(self, frame_ms: float, signature: Hashable) -> bool:
+        """
+        :param frame_ms: Tempo real desde o quadro anterior.
+        :param signature: Assinatura do estado visível no quadro atual.
+        """
+        late = frame_ms - self._frame_interval_ms > self._late_threshold_ms
+        if late and self._skipped_in_row < self._max_skipped_frames:
+            self._skipped_in_row += 1
+            self._dropped_frames += 1
+            return False
+
+        self._skipped_in_row = 0
+        if not self._invalidated and signature == self._last_signature:
+            self._idle_frames += 1
+            return False
+
+        self._last_signature = signature
+        self._invalidated = False
+        self._drawn_frames += 1
+        return True
+
+    @property
+    def drawn_frames(self) -> int:
+        return self._drawn_frames
+
+    @property
+    def idle_frames(self) -> int:
+        """ Quadros não desenhados porque nada visível mudou. """
+        return self._idle_frames
+
+    @property
+    def dropped_frames(self) -> int:
+        """ Quadros descartados porque o laço estava atrasado. """
+        return self._dropped_frames
@@ -0,0 +1,85 @@
+import os
+import math
+from typing import Optional
+
+import pygame
+
+class SpriteAtlas:
+    """
+    Carrega cada imagem uma única vez, já na escala do tile, pré-calcula as rotações
+    pedidas e agrupa todos os quadros em uma única superfície.
+    As entidades recebem subsuperfícies compartilhadas dessa superfície.
+    """
+
+    _cell_size: tuple[int, int]
+    _surface: pygame.Surface
+    _frames: dict[tuple[str, int], pygame.Surface]
+
+    def __init__(
+        self,
+        images_dir: str,
+        cell_size: tuple[int, int],
+        sprite_angles: dict[str, tuple[int, ...]],
+        images: Optional[dict[str, pygame.Surface]] = None
+    ) -> None:
+        """
+        :param sprite_angles: Nome de cada arquivo de imagem e os ângulos (em graus) necessários.
+        :param images: Imagens já carregadas e na escala do tile (ex.: pelo `AssetPipeline`), por nome;
+            as que faltarem são lidas do disco.
+        """
+        self._cell_size = cell_size
+
+        images = images or {}
+        images = { name: images.get(name) or self._load_scaled_image(images_dir, name) for name in sprite_angles }
+
+        frames = []
+        for name, angles in sprite_angles.items():
+            for angle in angles:
+                image = images[name]
+                frames.append(((name, angle), pygame.transform.rotate(image, angle) if angle % 360 else image))
+
+        self._surface, self._frames = self._pack(frames)
+
+    def get(self, name: str, angle: int = 0) -> pygame.Surface:
+        """ Retorna o quadro pré-calculado da imagem no ângulo pedido. """
+        return self._frames[(name, angle)]
+
+    def _load_scaled_image(self, images_dir: str, name: str) -> pygame.Surface:
+        try:
+            image = pygame.image.load(os.path.join(images_dir, name))
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+
+            return pygame.transform.scale(image, self._cell_size)
+        except FileNotFoundError:
+            print(f"[ERRO] Imagem não encontrada: {name}")
+            return pygame.Surface(self._cell_size)
+
+    def _pack(self, frames: list) -> tuple[pygame.Surface, dict]:
+        """ Organiza os quadros em uma grade de espaços do tamanho do maior quadro. """
+        slot_width = max((frame.get_width() for _, frame in frames), default=1)
+        slot_height = max((frame.get_height() for _, frame in frames), default=1)
+        columns = max(1, math.ceil(math.sqrt(len(frames))))
+        rows = max(1, math.ceil(len(frames) / columns))
+
+        surface = pygame.Surface((columns * slot_width, rows * slot_height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+
+        placements = []
+        for index, (key, frame) in enumerate(frames):
+            x, y = (index % columns) * slot_width, (index // columns) * slot_height
+            surface.blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            placements.append((key, pygame.Rect(x, y, frame.get_width(), frame.get_height())))
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        return surface, { key: surface.subsurface(rect) for key, rect in placements }
+
+    @property
+    def surface(self) -> pygame.Surface:
+        return self._surface
+
+    @property
+    def cell_size(self) -> tuple[int, int]:
+        return self._cell_size
@@ -0,0 +1,51 @@
+# Posições das entidades em ponto fixo inteiro: cada tile mede `UNITS_PER_TILE` unidades em
+# cada eixo, e o centro do tile fica em `HALF_TILE`. Tile e deslocamento dentro dele saem de
+# uma divisão inteira e o centro é atingido exatamente, então a simulação é a mesma para
+# qualquer tamanho de tela.
+#
+# Velocidades, tamanhos de colisão e limites do túnel continuam configurados em pixels de um
+# tile de `REFERENCE_CELL_SIZE` pixels e são convertidos uma vez, na criação da entidade.
+
+UNITS_PER_TILE: int = 120
+HALF_TILE: int = UNITS_PER_TILE // 2
+REFERENCE_CELL_SIZE: int = 30
+
+# Distância, em unidades, do deslocamento dentro do tile até o próximo centro à frente
+# (eixo crescente) e atrás (eixo decrescente). Partindo do centro, o próximo fica a um tile.
+DISTANCE_TO_NEXT_CENTER: tuple[int, ...] = tuple(
+    HALF_TILE - offset if offset < HALF_TILE else UNITS_PER_TILE + HALF_TILE - offset
+    for offset in range(UNITS_PER_TILE)
+)
+DISTANCE_TO_PREVIOUS_CENTER: tuple[int, ...] = tuple(
+    offset - HALF_TILE if offset > HALF_TILE else offset + UNITS_PER_TILE - HALF_TILE
+    for offset in range(UNITS_PER_TILE)
+)
+
+def reference_pixels_to_units(pixels: float) -> int:
+    """ Converte uma medida em pixels do tile de referência para unidades fixas. """
+    return round(pixels * UNITS_PER_TILE / REFERENCE_CELL_SIZE)
+
+def tile_center(row: int, col: int) -> tuple[int, int]:
+    """ Centro (x, y) do tile, em unidades fixas. """
+    return col * UNITS_PER_TILE + HALF_TILE, row * UNITS_PER_TILE + HALF_TILE
+
+def is_tile_center(x: int, y: int) -> bool:
+    return x % UNITS_PER_TILE == HALF_TILE and y % UNITS_PER_TILE == HALF_TILE
+
+def advance(coordinate: int, step: int) -> int:
+    """
+    Anda `step` unidades (com sinal) em um eixo, parando no próximo centro de tile se ele
+    estiver no caminho. Assim toda entidade passa exatamente pelo centro de cada tile.
+    """
+    offset = coordinate % UNITS_PER_TILE
+    if step > 0:
+        return coordinate + min(step, DISTANCE_TO_NEXT_CENTER[offset])
+    if step < 0:
+        return coordinate - min(-step, DISTANCE_TO_PREVIOUS_CENTER[offset])
+    return coordinate
+
+def units_to_pixels(units: int, cell_size: int) -> float:
+    return units * cell_size / UNITS_PER_TILE
+
+def pixels_to_units(pixels: float, cell_size: int) -> int:
+    return round(pixels * UNITS_PER_TILE / cell_size)
@@ -1,7 +1,13 @@
+import os
 import math
+import hashlib
+from typing import Optional
 
+import numpy as np
 import pygame
 
+from src.world.maze_pack import MazePack
+
 class Maze: 
 
     _wall_color: str
@@ -17,10 +23,28 @@ class Maze:
     _maze_cols: int
     _maze_layout: list[list[int]]
     _matrix: list[list[int]]
+    _pellet_grid: np.ndarray
+    _pellet_grid_view: np.ndarray
     _total_tablets: int
-    _wall_surface: pygame.Surface
-
-    def __init__(self, maze_file: str, cell_width: int, cell_height: int, config: dict):
+    _eaten_cells: list[tuple[int, int]]
+    _content_hash: str
+    _wall_surface: Optional[pygame.Surface]
+    _cache_dir: Optional[str]
+    _walkable_tables: dict[bool, list[list[bool]]]
+    _move_tables: dict[bool, list[list[list[bool]]]]
+    _forward_exit_tables: dict[bool, list[list[list[tuple[int, ...]]]]]
+    _shared_tables: dict = {}
+    _loaded_wall_surfaces: dict = {}
+
+    WALL_CACHE_VERSION: int = 1
+
+    DIRECTION_OFFSETS: dict = { 1: (-1, 0), 2: (1, 0), 3: (0, -1), 4: (0, 1) }
+    OPPOSITE_ORIENTATION: dict = { 1: 2, 2: 1, 3: 4, 4: 3, 0: 0 }
+
+    def __init__(self, maze_file: str, cell_width: int, cell_height: int, config: dict, cache_dir: Optional[str] = None):
+        """
+        :param cache_dir: Pasta do cache em disco da superfície das paredes (None = sem cache em disco).
+        """
         colors = config.get("colors", {})
         self._wall_color = colors.get("wall", "blue")
         self._door_color = colors.get("door", "white")
@@ -45,51 +69,208 @@ class Maze:
         self._cell_width = cell_width
         self._cell_height = cell_height
 
-        self._maze_layout = self._load_maze_layout(maze_file)
-        self._maze_rows = len(self._maze_layout)
-        self._maze_cols = len(self._maze_layout[0])
+        pack = self._load_pack(maze_file)
+        self._content_hash = pack.content_hash
+        self._maze_rows, self._maze_cols = pack.rows, pack.cols
+
+        tables = self._load_shared_tables(pack)
+        self._maze_layout = tables["layout"]
+        self._walkable_tables = tables["walkable"]
+        self._move_tables = tables["moves"]
+        self._forward_exit_tables = tables["forward_exits"]
+
+        self._matrix = tables["matrix"].tolist()
+        self._pellet_grid = tables["matrix"].astype(np.int8)
+        self._pellet_grid_view = self._pellet_grid.view()
+        self._pellet_grid_view.flags.writeable = False
+        self._total_tablets = pack.total_tablets
+        self._eaten_cells = []
 
-        self._matrix = self._load_wall_matrix()
-        self._total_tablets = self._count_tablets()
+        self._wall_surface = None
+        self._cache_dir = cache_dir
 
-        self._wall_surface = self._create_wall_surface()
+    def eat_tablet(self, row: int, col: int) -> None:
+        """ Remove a pastilha do tile e decrementa o contador de pastilhas de forma segura. """
+        self._matrix[row][col] = 0
+        self._pellet_grid[row, col] = 0
+        self._eaten_cells.append((row, col))
 
-    def eat_tablet(self) -> None:
-        """ Decrementa o contador de pastilhas de forma segura. """
         if self._total_tablets > 0:
             self._total_tablets -= 1
+
+    def consume_eaten_cells(self) -> list[tuple[int, int]]:
+        """ Retorna os tiles esvaziados desde a última chamada e limpa a lista. """
+        eaten_cells = self._eaten_cells
+        self._eaten_cells = []
+        return eaten_cells
             
     def is_level_cleared(self) -> bool:
         """ Verifica se todas as pastilhas foram comidas. """
         return self._total_tablets <= 0
 
-    def _load_maze_layout(self, maze_file: str) -> list[list[int]]:
-        maze = []
-
+    def is_walkable(self, row: int, col: int, allow_door: bool = False) -> bool:
+        """ Verifica se o tile pode ser ocupado (a porta só vale com `allow_door`). """
+        if not (0 <= row < self._maze_rows and 0 <= col < self._maze_cols):
+            return False
+        return self._walkable_tables[allow_door][row][col]
+
+    def can_move(self, row: int, col: int, direction: int, allow_door: bool = False) -> bool:
+        """ 
+        Verifica se é possível sair do tile (row, col) na direção informada. 
+        A direção 0 (parado) é sempre válida.
+
+        :param allow_door: Considera a porta da casa como passagem (fantasmas comidos).
+        """
+        if not (0 <= row < self._maze_rows and 0 <= col < self._maze_cols):
+            return direction == 0
+        return self._move_tables[allow_door][row][col][direction]
+
+    def forward_exits(self, row: int, col: int, orientation: int, allow_door: bool = False) -> tuple[int, ...]:
+        """ Saídas válidas do tile, sem contar a direção oposta à orientação atual. """
+        if not (0 <= row < self._maze_rows and 0 <= col < self._maze_cols):
+            return ()
+        return self._forward_exit_tables[allow_door][row][col][orientation]
+
+    def is_intersection(self, row: int, col: int, orientation: int, allow_door: bool = False) -> bool:
+        """ Um tile é cruzamento quando há mais de uma saída sem dar meia-volta. """
+        return len(self.forward_exits(row, col, orientation, allow_door)) > 1
+
+    def move_table(self, allow_door: bool = False) -> list[list[list[bool]]]:
+        """ Tabela [linha][coluna][direção] com as saídas válidas de cada tile. """
+        return self._move_tables[allow_door]
+
+    def _load_pack(self, maze_file: str) -> MazePack:
+        """ Pacote compilado (`.mazepack`) ou texto; um arquivo ausente vira um labirinto de um tile vazio. """
         try:
-            with open(maze_file, 'r') as f:
-                for line in f:
-                    maze.append([int(x) for x in line.split()])
+            return MazePack.open(maze_file)
         except FileNotFoundError:
-            return [[0]] 
+            return MazePack.from_layout(np.zeros((1, 1), dtype=np.int8), hashlib.sha256(b'').hexdigest())
+
+    def _load_shared_tables(self, pack: MazePack) -> dict:
+        """
+        Tabelas derivadas do layout, que nunca mudam durante a partida. São calculadas com NumPy
+        uma vez por labirinto (e código da porta) e compartilhadas por todos os `Maze` do processo.
+        """
+        door_code = self._wall_codes["door"]
+        cache_key = (pack.content_hash, pack.rows, pack.cols, door_code)
+
+        tables = self._shared_tables.get(cache_key)
+        if tables is None:
+            layout = np.asarray(pack.layout, dtype=np.int8)
+            walkable = {
+                False: np.asarray(pack.walkable, dtype=bool),
+                True: np.asarray(pack.walkable, dtype=bool) | (layout == door_code)
+            }
+            moves = { allow_door: self._build_move_table(walkable[allow_door]) for allow_door in (False, True) }
+
+            tables = {
+                "layout": layout.tolist(),
+                "matrix": np.where(walkable[False], layout, -1).astype(np.int8),
+                "walkable": { allow_door: walkable[allow_door].tolist() for allow_door in (False, True) },
+                "moves": { allow_door: moves[allow_door].tolist() for allow_door in (False, True) },
+                "forward_exits": { allow_door: self._build_forward_exit_table(moves[allow_door]) for allow_door in (False, True) }
+            }
+            self._shared_tables[cache_key] = tables
+
+        return tables
+
+    @staticmethod
+    def _build_move_table(walkable: np.ndarray) -> np.ndarray:
+        """ Para cada tile, quais das direções 0-4 levam a um tile livre, (linhas, colunas, 5). """
+        padded = np.pad(walkable, 1, constant_values=False)
+        rows, cols = walkable.shape
+
+        moves = np.empty((rows, cols, 5), dtype=bool)
+        moves[:, :, 0] = True
+        moves[:, :, 1] = padded[:-2, 1:-1]
+        moves[:, :, 2] = padded[2:, 1:-1]
+        moves[:, :, 3] = padded[1:-1, :-2]
+        moves[:, :, 4] = padded[1:-1, 2:]
+        return moves
+
+    @classmethod
+    def _build_forward_exit_table(cls, moves: np.ndarray) -> list[list[list[tuple[int, ...]]]]:
+        """
+        Para cada tile e orientação de chegada (0-4), as saídas válidas sem meia-volta.
+        As saídas de cada tile viram uma máscara de 4 bits, traduzida por uma tabela de 16 entradas.
+        """
+        exits_by_mask = np.empty((16, 5), dtype=object)
+        for mask in range(16):
+            for orientation in (0, 1, 2, 3, 4):
+                exits_by_mask[mask, orientation] = tuple(
+                    d for d in (1, 2, 3, 4) if mask & (1 << (d - 1)) and d != cls.OPPOSITE_ORIENTATION[orientation]
+                )
+
+        masks = moves[:, :, 1:].astype(np.int64) @ np.array([1, 2, 4, 8], dtype=np.int64)
+        return exits_by_mask[masks].tolist()
+
+    def wall_cache_key(self) -> str:
+        """ Chave da superfície das paredes: labirinto, tamanho do tile, cores e códigos de desenho. """
+        colors = (tuple(pygame.Color(self._wall_color)), tuple(pygame.Color(self._door_color)))
+        codes = tuple(sorted(self._wall_codes.items()))
+        digest = hashlib.sha256(repr((self._content_hash, self._cell_width, self._cell_height, colors, codes)).encode())
+        return f"walls_{digest.hexdigest()[:16]}_v{self.WALL_CACHE_VERSION}"
+
+    def _load_or_create_wall_surface(self) -> pygame.Surface:
+        """
+        Superfície já usada no processo, imagem do cache em disco ou, por último, desenho completo
+        (que é então salvo no cache). Falhas de leitura ou escrita apenas fazem a imagem ser redesenhada.
+        """
+        cache_key = self.wall_cache_key()
+
+        surface = self._loaded_wall_surfaces.get(cache_key)
+        if surface is not None:
+            return surface
+
+        surface = self._load_cached_wall_surface(cache_key) if self._cache_dir else None
+        if surface is None:
+            surface = self._create_wall_surface()
+            if self._cache_dir:
+                self._save_cached_wall_surface(surface, cache_key)
+
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+                surface.set_colorkey('black')
+
+        self._loaded_wall_surfaces[cache_key] = surface
+        return surface
+
+    def _load_cached_wall_surface(self, cache_key: str) -> Optional[pygame.Surface]:
+        cache_path = os.path.join(self._cache_dir, f"{cache_key}.png")
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            surface = pygame.image.load(cache_path)
+        except (OSError, pygame.error):
+            return None
+
+        if surface.get_size() != (self._maze_cols * self._cell_width, self._maze_rows * self._cell_height):
+            return None
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+
+        # O PNG não guarda a cor transparente; sem ela, o fundo preto cobriria o labirinto.
+        surface.set_colorkey('black')
+        return surface
+
+    def _save_cached_wall_surface(self, surface: pygame.Surface, cache_key: str) -> None:
+        cache_path = os.path.join(self._cache_dir, f"{cache_key}.png")
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp.png"
+
+        # As paredes só têm três cores; em 8 bits com paleta, o PNG fica com poucos KB e abre mais rápido.
+        paletted = pygame.Surface(surface.get_size(), depth = 8)
+        paletted.set_palette([pygame.Color('black'), pygame.Color(self._wall_color), pygame.Color(self._door_color)])
+        paletted.blit(surface, (0, 0))
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            pygame.image.save(paletted, temporary_path)
+            os.replace(temporary_path, cache_path)
+        except (OSError, pygame.error) as e:
+            print(f"[ERRO] Não foi possível salvar o cache das paredes '{cache_path}': {e}")
 
-        return maze
-    
-    def _load_wall_matrix(self) -> list[list[int]]:
-        matrix = []
-        for row in self._maze_layout:
-            new_row = [-1 if x > 2 else x for x in row]
-            matrix.append(new_row)
-        return matrix
-    
-    def _count_tablets(self) -> int:
-        count = 0
-        for row in self._matrix:
-            for cell in row:
-                if cell == 1 or cell == 2:
-                    count += 1
-        return count
-    
     def _create_wall_surface(self) -> pygame.Surface:
         """ Gera uma imagem estática das paredes para não recalcular todo frame. """
         surface = pygame.Surface((self._maze_cols * self._cell_width, self._maze_rows * self._cell_height))
@@ -133,12 +314,24 @@ class Maze:
     def matrix(self) -> list[list[int]]:
         return self._matrix
 
+    @property
+    def pellet_grid(self) -> np.ndarray:
+        """ A mesma grade de `matrix` em NumPy (int8, somente leitura), atualizada a cada pastilha comida. """
+        return self._pellet_grid_view
+
     @property
     def maze_layout(self) -> list[list[int]]:
         return self._maze_layout
 
+    @property
+    def content_hash(self) -> str:
+        return self._content_hash
+
     @property
     def wall_surface(self) -> pygame.Surface:
+        """ Superfície das paredes, obtida no primeiro acesso (simulações sem janela nunca a criam). """
+        if self._wall_surface is None:
+            self._wall_surface = self._load_or_create_wall_surface()
         return self._wall_surface
 
     @property
@@ -161,6 +354,10 @@ class Maze:
     def cell_height(self) -> int:
         return self._cell_height
 
+    @property
+    def door_code(self) -> int:
+        return self._wall_codes["door"]
+
     @property
     def wall_color(self) -> str:
         return self._wall_color
@@ -0,0 +1,212 @@
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import argparse
+from typing import Optional
+
+import numpy as np
+
+MAZE_PACK_MAGIC: bytes = b"PMMZ"
+MAZE_PACK_VERSION: int = 1
+MAZE_PACK_EXTENSION: str = ".mazepack"
+
+# magic, versão, linhas, colunas, SHA-256 do texto de origem, pastilhas pequenas, pílulas de poder
+_HEADER = struct.Struct("<4sBHH32sII")
+
+class MazePack:
+    """
+    Labirinto compilado: layout, matriz de tiles livres, posições das pastilhas, contagens
+    e o hash do arquivo de texto de origem (o mesmo `Maze.content_hash`, então os caches em
+    disco continuam válidos).
+
+    O arquivo binário é lido por mmap e os arrays são vistas NumPy sobre ele, sem nenhum
+    trabalho por célula em Python.
+    """
+
+    _layout: np.ndarray
+    _walkable: np.ndarray
+    _pellet_tiles: np.ndarray
+    _small_pellets: int
+    _power_pellets: int
+    _content_hash: str
+
+    def __init__(
+        self,
+        layout: np.ndarray,
+        walkable: np.ndarray,
+        pellet_tiles: np.ndarray,
+        small_pellets: int,
+        power_pellets: int,
+        content_hash: str
+    ) -> None:
+        self._layout = layout
+        self._walkable = walkable
+        self._pellet_tiles = pellet_tiles
+        self._small_pellets = small_pellets
+        self._power_pellets = power_pellets
+        self._content_hash = content_hash
+
+    @classmethod
+    def from_layout(cls, layout: np.ndarray, content_hash: str) -> "MazePack":
+        """ Deriva a matriz de tiles livres e as pastilhas a partir dos códigos do layout. """
+        layout = np.ascontiguousarray(layout, dtype=np.int8)
+
+        walkable = layout <= 2
+        pellet_tiles = np.argwhere((layout == 1) | (layout == 2)).astype(np.int16)
+        small_pellets = int(np.count_nonzero(layout == 1))
+        power_pellets = int(np.count_nonzero(layout == 2))
+
+        return cls(layout, walkable, pellet_tiles, small_pellets, power_pellets, content_hash)
+
+    @classmethod
+    def from_text(cls, maze_file: str) -> "MazePack":
+        """ Lê um labirinto em texto (um código inteiro por tile, separados por espaços). """
+        with open(maze_file, 'rb') as f:
+            data = f.read()
+
+        rows = [line.split() for line in data.splitlines() if line.strip()]
+        if not rows:
+            raise ValueError(f'Labirinto vazio: {maze_file}')
+        if any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError(f'Linhas de tamanhos diferentes no labirinto: {maze_file}')
+
+        return cls.from_layout(np.array(rows, dtype=np.int8), hashlib.sha256(data).hexdigest())
+
+    @classmethod
+    def load(cls, path: str) -> "MazePack":
+        """ Abre um pacote compilado por mmap. """
+        with open(path, 'rb') as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f'Pacote de labirinto vazio: {path}')
+
+        if len(buffer) < _HEADER.size:
+            raise ValueError(f'Pacote de labirinto truncado: {path}')
+
+        magic, version, rows, cols, digest, small_pellets, power_pellets = _HEADER.unpack_from(buffer)
+        if magic != MAZE_PACK_MAGIC:
+            raise ValueError(f'Arquivo não é um pacote de labirinto: {path}')
+        if version != MAZE_PACK_VERSION:
+            raise ValueError(f'Versão de pacote de labirinto não suportada: {version}')
+
+        tiles = rows * cols
+        pellets = small_pellets + power_pellets
+        if len(buffer) != _HEADER.size + 2 * tiles + 4 * pellets:
+            raise ValueError(f'Pacote de labirinto truncado: {path}')
+
+        offset = _HEADER.size
+        layout = np.frombuffer(buffer, dtype=np.int8, count=tiles, offset=offset).reshape(rows, cols)
+        offset += tiles
+        walkable = np.frombuffer(buffer, dtype=np.bool_, count=tiles, offset=offset).reshape(rows, cols)
+        offset += tiles
+        pellet_tiles = np.frombuffer(buffer, dtype='<i2', count=2 * pellets, offset=offset).reshape(pellets, 2)
+
+        return cls(layout, walkable, pellet_tiles, small_pellets, power_pellets, digest.hex())
+
+    @classmethod
+    def open(cls, path: str) -> "MazePack":
+        """ Abre o pacote compilado ou, se o arquivo não for um, compila o texto em memória. """
+        return cls.load(path) if is_maze_pack(path) else cls.from_text(path)
+
+    def encode(self) -> bytes:
+        rows, cols = self._layout.shape
+        header = _HEADER.pack(
+            MAZE_PACK_MAGIC, MAZE_PACK_VERSION, rows, cols, bytes.fromhex(self._content_hash),
+            self._small_pellets, self._power_pellets
+        )
+        return b"".join((
+            header,
+            self._layout.astype(np.int8).tobytes(),
+            self._walkable.astype(np.bool_).tobytes(),
+            self._pellet_tiles.astype('<i2').tobytes()
+        ))
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(self.encode())
+
+    @property
+    def layout(self) -> np.ndarray:
+        """ Códigos do arquivo de origem, (linhas, colunas). """
+        return self._layout
+
+    @property
+    def walkable(self) -> np.ndarray:
+        """ Tiles livres (pastilhas e corredores vazios); a porta da casa não conta. """
+        return self._walkable
+
+    @property
+    def pellet_tiles(self) -> np.ndarray:
+        """ (linha, coluna) de cada pastilha e pílula de poder, em ordem de leitura. """
+        return self._pellet_tiles
+
+    @property
+    def small_pellets(self) -> int:
+        return self._small_pellets
+
+    @property
+    def power_pellets(self) -> int:
+        return self._power_pellets
+
+    @property
+    def total_tablets(self) -> int:
+        return self._small_pellets + self._power_pellets
+
+    @property
+    def content_hash(self) -> str:
+        return self._content_hash
+
+    @property
+    def rows(self) -> int:
+        return self._layout.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self._layout.shape[1]
+
+def is_maze_pack(path: str) -> bool:
+    """ Verifica pela assinatura do início do arquivo se ele é um pacote compilado. """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAZE_PACK_MAGIC)) == MAZE_PACK_MAGIC
+    except OSError:
+        return False
+
+def compile_maze(maze_file: str, output_path: Optional[str] = None) -> str:
+    """
+    Compila um labirinto em texto para um pacote binário.
+
+    :param output_path: Destino; por padrão, o mesmo caminho com a extensão `.mazepack`.
+    :return: Caminho do pacote gerado.
+    """
+    if output_path is None:
+        output_path = os.path.splitext(maze_file)[0] + MAZE_PACK_EXTENSION
+
+    MazePack.from_text(maze_file).save(output_path)
+    return output_path
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compila labirintos em texto para pacotes binários (.mazepack).")
+    parser.add_argument("mazes", nargs="+", help="arquivos de labirinto em texto")
+    parser.add_argument("--output-dir", help="pasta de destino (padrão: ao lado de cada arquivo)")
+    args = parser.parse_args(argv)
+
+    for maze_file in args.mazes:
+        output_path = None
+        if args.output_dir:
+            name = os.path.splitext(os.path.basename(maze_file))[0] + MAZE_PACK_EXTENSION
+            output_path = os.path.join(args.output_dir, name)
+
+        try:
+            print(compile_maze(maze_file, output_path))
+        except (OSError, ValueError) as e:
+            print(f"[ERRO] {maze_file}: {e}")
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
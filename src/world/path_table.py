@@ -0,0 +1,187 @@
+import os
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+from src.world.maze import Maze
+
+class PathTable:
+    """
+    Distância em passos e primeira direção do caminho mais curto entre todos os pares
+    de tiles do labirinto, calculadas por BFS (incluindo a passagem do túnel lateral).
+    Os tiles são indexados por `linha * colunas + coluna`.
+    """
+
+    _rows: int
+    _cols: int
+    _distances: np.ndarray
+    _next_hops: np.ndarray
+    _neighbors: np.ndarray
+    _loaded_tables: dict = {}
+
+    UNREACHABLE: int = 0xFFFF
+    FORMAT_VERSION: int = 1
+    DIRECTION_OFFSETS: dict = { 1: (-1, 0), 2: (1, 0), 3: (0, -1), 4: (0, 1) }
+
+    def __init__(self, rows: int, cols: int, distances: np.ndarray, next_hops: np.ndarray, neighbors: np.ndarray) -> None:
+        self._rows = rows
+        self._cols = cols
+        self._distances = distances
+        self._next_hops = next_hops
+        self._neighbors = neighbors
+
+    @classmethod
+    def build(cls, maze: Maze, allow_door: bool = False) -> "PathTable":
+        """ Calcula a tabela com uma BFS a partir de cada tile livre. """
+        rows, cols = maze.rows, maze.cols
+        neighbors = cls._build_neighbors(maze, allow_door)
+        tile_count = rows * cols
+
+        distances = np.full((tile_count, tile_count), cls.UNREACHABLE, dtype=np.uint16)
+        next_hops = np.zeros((tile_count, tile_count), dtype=np.uint8)
+        adjacency = [
+            [(direction, int(neighbors[tile, direction])) for direction in (1, 2, 3, 4) if neighbors[tile, direction] >= 0]
+            for tile in range(tile_count)
+        ]
+
+        for source in range(tile_count):
+            if not maze.is_walkable(source // cols, source % cols, allow_door):
+                continue
+
+            source_distances = [cls.UNREACHABLE] * tile_count
+            source_hops = [0] * tile_count
+            source_distances[source] = 0
+
+            queue = deque()
+            for direction, neighbor in adjacency[source]:
+                if source_distances[neighbor] == cls.UNREACHABLE:
+                    source_distances[neighbor] = 1
+                    source_hops[neighbor] = direction
+                    queue.append(neighbor)
+
+            while queue:
+                tile = queue.popleft()
+                step = source_distances[tile] + 1
+                first_direction = source_hops[tile]
+
+                for _, neighbor in adjacency[tile]:
+                    if source_distances[neighbor] == cls.UNREACHABLE:
+                        source_distances[neighbor] = step
+                        source_hops[neighbor] = first_direction
+                        queue.append(neighbor)
+
+            distances[source] = source_distances
+            next_hops[source] = source_hops
+
+        return cls(rows, cols, distances, next_hops, neighbors)
+
+    @classmethod
+    def load_or_build(cls, maze: Maze, allow_door: bool = False, cache_dir: Optional[str] = None) -> "PathTable":
+        """
+        Lê a tabela do cache em disco (chaveado pelo hash do labirinto) ou a calcula e salva.
+        Tabelas já carregadas ficam em memória e são compartilhadas entre partidas do mesmo processo.
+        Falhas de leitura ou escrita do cache apenas fazem a tabela ser recalculada.
+        """
+        door_tag = "door" if allow_door else "nodoor"
+        cache_key = f"paths_{maze.content_hash[:16]}_{door_tag}_v{cls.FORMAT_VERSION}"
+
+        if cache_key in cls._loaded_tables:
+            return cls._loaded_tables[cache_key]
+
+        table = cls._load_cached(maze, cache_dir, cache_key) if cache_dir else None
+        if table is None:
+            table = cls.build(maze, allow_door)
+            if cache_dir:
+                cls._save_cached(table, cache_dir, cache_key)
+
+        cls._loaded_tables[cache_key] = table
+        return table
+
+    @classmethod
+    def _load_cached(cls, maze: Maze, cache_dir: str, cache_key: str) -> Optional["PathTable"]:
+        cache_path = os.path.join(cache_dir, f"{cache_key}.npz")
+
+        try:
+            with np.load(cache_path) as data:
+                if data["distances"].shape == (maze.rows * maze.cols,) * 2:
+                    return cls(maze.rows, maze.cols, data["distances"], data["next_hops"], data["neighbors"])
+        except (OSError, KeyError, ValueError):
+            pass
+
+        return None
+
+    @classmethod
+    def _save_cached(cls, table: "PathTable", cache_dir: str, cache_key: str) -> None:
+        cache_path = os.path.join(cache_dir, f"{cache_key}.npz")
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.savez_compressed(cache_path, distances=table._distances, next_hops=table._next_hops, neighbors=table._neighbors)
+        except OSError as e:
+            print(f"[ERRO] Não foi possível salvar o cache de caminhos '{cache_path}': {e}")
+
+    @classmethod
+    def _build_neighbors(cls, maze: Maze, allow_door: bool) -> np.ndarray:
+        """ Índice do tile vizinho em cada direção (-1 se bloqueado), com o túnel ligando as bordas. """
+        rows, cols = maze.rows, maze.cols
+        neighbors = np.full((rows * cols, 5), -1, dtype=np.int32)
+
+        for row in range(rows):
+            for col in range(cols):
+                tile = row * cols + col
+                neighbors[tile, 0] = tile
+
+                for direction, (row_offset, col_offset) in cls.DIRECTION_OFFSETS.items():
+                    if maze.can_move(row, col, direction, allow_door):
+                        neighbors[tile, direction] = (row + row_offset) * cols + (col + col_offset)
+
+            left_edge, right_edge = row * cols, row * cols + cols - 1
+            if maze.is_walkable(row, 0, allow_door) and maze.is_walkable(row, cols - 1, allow_door):
+                neighbors[left_edge, 3] = right_edge
+                neighbors[right_edge, 4] = left_edge
+
+        return neighbors
+
+    def tile_index(self, tile: tuple[int, int]) -> Optional[int]:
+        row, col = tile
+        if 0 <= row < self._rows and 0 <= col < self._cols:
+            return row * self._cols + col
+        return None
+
+    def distance(self, from_tile: tuple[int, int], to_tile: tuple[int, int]) -> Optional[int]:
+        """ Número de passos do caminho mais curto, ou None se não houver caminho. """
+        source, target = self.tile_index(from_tile), self.tile_index(to_tile)
+        if source is None or target is None:
+            return None
+
+        distance = int(self._distances[source, target])
+        return None if distance == self.UNREACHABLE else distance
+
+    def next_direction(self, from_tile: tuple[int, int], to_tile: tuple[int, int]) -> int:
+        """ Primeira direção (1-4) do caminho mais curto; 0 se já chegou ou não há caminho. """
+        source, target = self.tile_index(from_tile), self.tile_index(to_tile)
+        if source is None or target is None:
+            return 0
+        return int(self._next_hops[source, target])
+
+    def neighbor(self, tile: tuple[int, int], direction: int) -> Optional[tuple[int, int]]:
+        """ Tile alcançado ao andar um passo na direção informada, considerando o túnel. """
+        index = self.tile_index(tile)
+        if index is None:
+            return None
+
+        neighbor = int(self._neighbors[index, direction])
+        return None if neighbor < 0 else divmod(neighbor, self._cols)
+
+    @property
+    def distances(self) -> np.ndarray:
+        return self._distances
+
+    @property
+    def next_hops(self) -> np.ndarray:
+        return self._next_hops
+
+    @property
+    def neighbors(self) -> np.ndarray:
+        return self._neighbors
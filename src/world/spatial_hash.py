@@ -0,0 +1,98 @@
+from src.world.fixed_point import UNITS_PER_TILE
+
+class SpatialHash:
+    """
+    Índice espacial das entidades por tile do labirinto, usado como fase ampla das colisões.
+    Cada entidade só troca de balde quando muda de tile; as consultas olham apenas os baldes
+    que podem conter um quadrado de colisão sobreposto ao consultado.
+
+    Trabalha nas unidades fixas de `src.world.fixed_point` (`fixed_position`, `collision_size`).
+    """
+
+    _buckets: dict[tuple[int, int], list]
+    _entity_tiles: dict[object, tuple[int, int]]
+    _insertion_order: dict[object, int]
+    _max_half_size: int
+
+    def __init__(self) -> None:
+        self._buckets = {}
+        self._entity_tiles = {}
+        self._insertion_order = {}
+        self._max_half_size = 0
+
+    def insert(self, entity) -> None:
+        """ Registra a entidade; a ordem de inserção é preservada nos resultados das consultas. """
+        if entity in self._entity_tiles:
+            return
+
+        self._insertion_order[entity] = len(self._insertion_order)
+        self._max_half_size = max(self._max_half_size, entity.collision_size // 2 + 1)
+
+        tile = self._tile_of(entity)
+        self._entity_tiles[entity] = tile
+        self._buckets.setdefault(tile, []).append(entity)
+
+    def remove(self, entity) -> None:
+        tile = self._entity_tiles.pop(entity, None)
+        if tile is None:
+            return
+
+        self._insertion_order.pop(entity, None)
+        bucket = self._buckets[tile]
+        bucket.remove(entity)
+        if not bucket:
+            del self._buckets[tile]
+
+    def clear(self) -> None:
+        self._buckets = {}
+        self._entity_tiles = {}
+        self._insertion_order = {}
+        self._max_half_size = 0
+
+    def update(self, entity) -> None:
+        """ Move a entidade de balde se ela mudou de tile. Entidades não registradas são ignoradas. """
+        old_tile = self._entity_tiles.get(entity)
+        if old_tile is None:
+            return
+
+        new_tile = self._tile_of(entity)
+        if new_tile == old_tile:
+            return
+
+        bucket = self._buckets[old_tile]
+        bucket.remove(entity)
+        if not bucket:
+            del self._buckets[old_tile]
+
+        self._entity_tiles[entity] = new_tile
+        self._buckets.setdefault(new_tile, []).append(entity)
+
+    def query(self, x: int, y: int, size: int) -> list:
+        """
+        Entidades cujos tiles permitem sobreposição com o quadrado de lado `size` centrado em
+        (x, y), na ordem de inserção. A verificação exata (`collides_with`) continua com quem chama.
+        """
+        reach = size // 2 + 1 + self._max_half_size
+        first_col = (x - reach) // UNITS_PER_TILE
+        last_col = (x + reach) // UNITS_PER_TILE
+        first_row = (y - reach) // UNITS_PER_TILE
+        last_row = (y + reach) // UNITS_PER_TILE
+
+        buckets = self._buckets
+        candidates = []
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                bucket = buckets.get((row, col))
+                if bucket:
+                    candidates.extend(bucket)
+
+        if len(candidates) > 1:
+            candidates.sort(key=self._insertion_order.__getitem__)
+        return candidates
+
+    def _tile_of(self, entity) -> tuple[int, int]:
+        x, y = entity.fixed_position
+        return y // UNITS_PER_TILE, x // UNITS_PER_TILE
+
+    def __len__(self) -> int:
+        return len(self._entity_tiles)